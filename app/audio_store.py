@@ -0,0 +1,90 @@
+"""
+In-memory hand-off of synthesized audio within a podcast task.
+
+By default every dialogue turn is written to the task's temporary directory by
+the TTS service, then read back for cloud upload, for the episode preview and
+again for stitching. With an InMemoryAudioStore set for the task, the TTS
+service keeps the audio in memory under the path it would have been written to
+and those consumers read it from there. Audio over the store's byte budget is
+spilled to its path on disk, and whatever is still in memory is written out at
+the end of the task so the episode's segment paths stay valid.
+"""
+
+import logging
+import os
+import threading
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class InMemoryAudioStore:
+    """Synthesized audio of one task, keyed by file path, with a byte budget."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._audio: Dict[str, bytes] = {}
+        self._size_bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _write_file(path: str, audio: bytes) -> None:
+        output_dir = os.path.dirname(path)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(audio)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size_bytes
+
+    def put(self, path: str, audio: bytes) -> None:
+        """Keep audio for path in memory, or write it to path if the budget is spent."""
+        with self._lock:
+            self._size_bytes -= len(self._audio.pop(path, b""))
+            if self._size_bytes + len(audio) <= self.max_bytes:
+                self._audio[path] = audio
+                self._size_bytes += len(audio)
+                return
+        logger.debug(f"In-memory audio budget of {self.max_bytes} bytes spent, spilling {path} to disk")
+        self._write_file(path, audio)
+
+    def get(self, path: str) -> Optional[bytes]:
+        """Audio held in memory for path, or None if it is not (or no longer) in memory."""
+        with self._lock:
+            return self._audio.get(path)
+
+    def spill_all(self) -> int:
+        """Write all audio still in memory to its path and release it. Blocking; returns files written."""
+        with self._lock:
+            pending, self._audio = self._audio, {}
+            self._size_bytes = 0
+        for path, audio in pending.items():
+            self._write_file(path, audio)
+        return len(pending)
+
+
+# Store of the podcast task the current coroutine runs for, if audio is kept in memory
+current_audio_store: ContextVar[Optional[InMemoryAudioStore]] = ContextVar("current_audio_store", default=None)
+
+
+def buffered_audio(path: str) -> Optional[bytes]:
+    """Audio for path held in memory by the current task's store, if any."""
+    store = current_audio_store.get()
+    return store.get(path) if store is not None else None
+
+
+def audio_exists(path: str) -> bool:
+    """Check if audio for path is held in memory or exists on disk."""
+    return buffered_audio(path) is not None or os.path.exists(path)
+
+
+def read_audio(path: str) -> bytes:
+    """Read audio for path from memory, falling back to disk. Blocking when it reads from disk."""
+    audio = buffered_audio(path)
+    if audio is not None:
+        return audio
+    with open(path, "rb") as f:
+        return f.read()
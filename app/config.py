@@ -78,7 +78,216 @@ class Config:
         """Get maximum concurrent podcast generations."""
         default = 4 if self.environment == "production" else 2
         return int(os.getenv("MAX_CONCURRENT_GENERATIONS", str(default)))
-    
+
+    @property
+    def tts_max_concurrency(self) -> int:
+        """Get maximum number of dialogue turns synthesized concurrently per task."""
+        return max(1, int(os.getenv("TTS_MAX_CONCURRENCY", "8")))
+
+    @property
+    def tts_service_max_concurrency(self) -> int:
+        """Get maximum number of speech synthesis calls in flight across all tasks."""
+        return max(1, int(os.getenv("TTS_SERVICE_MAX_CONCURRENCY", "16")))
+
+    @property
+    def tts_max_input_bytes(self) -> int:
+        """Get the largest text (UTF-8 bytes) sent in one synthesis request; longer turns are split."""
+        return max(100, int(os.getenv("TTS_MAX_INPUT_BYTES", "4500")))
+
+    @property
+    def persona_research_max_concurrency(self) -> int:
+        """Get maximum number of persona research calls run concurrently per task."""
+        return max(1, int(os.getenv("PERSONA_RESEARCH_MAX_CONCURRENCY", "4")))
+
+    @property
+    def dialogue_tts_streaming(self) -> bool:
+        """Check if TTS should start on each outline segment's dialogue as soon as it is generated."""
+        return os.getenv("DIALOGUE_TTS_STREAMING", "false").lower() == "true"
+
+    @property
+    def dialogue_tts_batching(self) -> bool:
+        """Check if consecutive turns of the same voice should be synthesized in one SSML request."""
+        return os.getenv("DIALOGUE_TTS_BATCHING", "false").lower() == "true"
+
+    @property
+    def tts_audio_in_memory(self) -> bool:
+        """Check if synthesized turn audio should be handed to upload and stitching in memory instead of via temp files."""
+        return os.getenv("TTS_AUDIO_IN_MEMORY", "false").lower() == "true"
+
+    @property
+    def tts_audio_memory_max_bytes(self) -> int:
+        """Get the per-task memory budget for in-memory turn audio; audio beyond it is spilled to disk."""
+        return max(0, int(os.getenv("TTS_AUDIO_MEMORY_MAX_BYTES", str(256 * 1024 * 1024))))
+
+    @property
+    def request_dedupe_policy(self) -> str:
+        """
+        Get how duplicate podcast requests are handled.
+
+        "reuse" returns a matching completed task or attaches to a matching running one,
+        "attach" only attaches to running tasks and "off" (the default) always starts a new task.
+        """
+        policy = os.getenv("REQUEST_DEDUPE_POLICY", "off").lower()
+        if policy not in ("reuse", "attach", "off"):
+            logging.warning(f"Unknown REQUEST_DEDUPE_POLICY '{policy}', using 'off'")
+            return "off"
+        return policy
+
+    @property
+    def request_dedupe_window_seconds(self) -> int:
+        """Get how far back (in seconds) earlier tasks are considered for duplicate requests."""
+        return int(os.getenv("REQUEST_DEDUPE_WINDOW_SECONDS", "3600"))
+
+    @property
+    def preview_audio_publish_every_turns(self) -> int:
+        """Get how many newly synthesized leading turns trigger republishing the preview audio."""
+        return max(1, int(os.getenv("PREVIEW_AUDIO_PUBLISH_EVERY_TURNS", "4")))
+
+    @property
+    def extraction_source_timeout_seconds(self) -> float:
+        """Get timeout in seconds for extracting a single source URL."""
+        return float(os.getenv("EXTRACTION_SOURCE_TIMEOUT_SECONDS", "600"))
+
+    @property
+    def extraction_deadline_seconds(self) -> float:
+        """Get overall deadline in seconds for extracting all source URLs of a task."""
+        return float(os.getenv("EXTRACTION_DEADLINE_SECONDS", "900"))
+
+    @property
+    def source_analysis_chunk_chars(self) -> int:
+        """Get the chunk size (characters) above which source analysis is split into chunks; 0 disables chunking."""
+        return max(0, int(os.getenv("SOURCE_ANALYSIS_CHUNK_CHARS", "100000")))
+
+    @property
+    def source_analysis_max_concurrency(self) -> int:
+        """Get maximum number of source text chunks analyzed concurrently."""
+        return max(1, int(os.getenv("SOURCE_ANALYSIS_MAX_CONCURRENCY", "4")))
+
+    @property
+    def source_analysis_cache_ttl_seconds(self) -> int:
+        """Get how long per-source analyses are reused across tasks (0, the default, disables reuse)."""
+        return max(0, int(os.getenv("SOURCE_ANALYSIS_CACHE_TTL_SECONDS", "0")))
+
+    @property
+    def dialogue_parallel_segments(self) -> bool:
+        """Check if dialogue for all outline segments should be generated concurrently."""
+        return os.getenv("DIALOGUE_PARALLEL_SEGMENTS", "false").lower() == "true"
+
+    @property
+    def dialogue_max_concurrency(self) -> int:
+        """Get maximum number of segment dialogue requests in flight in parallel mode."""
+        return max(1, int(os.getenv("DIALOGUE_MAX_CONCURRENCY", "8")))
+
+    @property
+    def dialogue_transition_smoothing(self) -> bool:
+        """Check if segment boundaries of parallel dialogue should be smoothed by an extra LLM pass."""
+        return os.getenv("DIALOGUE_TRANSITION_SMOOTHING", "false").lower() == "true"
+
+    @property
+    def dialogue_stream_turns(self) -> bool:
+        """Check if dialogue turns should be streamed to TTS while a segment is still being written."""
+        return os.getenv("DIALOGUE_STREAM_TURNS", "false").lower() == "true"
+
+    @property
+    def gemini_requests_per_minute(self) -> int:
+        """Get the process-wide Gemini request budget per minute (0 disables the limit)."""
+        return max(0, int(os.getenv("GEMINI_REQUESTS_PER_MINUTE", "120")))
+
+    @property
+    def gemini_tokens_per_minute(self) -> int:
+        """Get the process-wide Gemini token budget per minute (0 disables the limit)."""
+        return max(0, int(os.getenv("GEMINI_TOKENS_PER_MINUTE", "1000000")))
+
+    @property
+    def gemini_max_concurrent_requests(self) -> int:
+        """Get the maximum number of Gemini requests in flight across all tasks (0 disables the limit)."""
+        return max(0, int(os.getenv("GEMINI_MAX_CONCURRENT_REQUESTS", "16")))
+
+    @property
+    def llm_adaptive_timeouts(self) -> bool:
+        """Check if LLM call timeouts should adapt to the latency observed for each call type."""
+        return os.getenv("LLM_ADAPTIVE_TIMEOUTS", "true").lower() == "true"
+
+    @property
+    def llm_timeout_min_samples(self) -> int:
+        """Get the number of completed calls of a type needed before its timeout adapts."""
+        return max(1, int(os.getenv("LLM_TIMEOUT_MIN_SAMPLES", "20")))
+
+    @property
+    def llm_timeout_p99_multiplier(self) -> float:
+        """Get the multiple of the observed p99 latency used as the adaptive timeout."""
+        return max(1.0, float(os.getenv("LLM_TIMEOUT_P99_MULTIPLIER", "3.0")))
+
+    @property
+    def llm_timeout_floor_seconds(self) -> float:
+        """Get the shortest timeout an adaptive timeout may shrink to."""
+        return max(1.0, float(os.getenv("LLM_TIMEOUT_FLOOR_SECONDS", "30")))
+
+    @property
+    def llm_hedge_requests(self) -> bool:
+        """Check if a duplicate LLM request should be sent when a call runs past its p95 latency."""
+        return os.getenv("LLM_HEDGE_REQUESTS", "false").lower() == "true"
+
+    @property
+    def llm_hedge_max_fraction(self) -> float:
+        """Get the largest share of LLM calls that may be hedged."""
+        return min(1.0, max(0.0, float(os.getenv("LLM_HEDGE_MAX_FRACTION", "0.1"))))
+
+    @property
+    def llm_cache_enabled(self) -> bool:
+        """Check if LLM responses should be cached on local disk."""
+        return os.getenv("LLM_CACHE_ENABLED", "false").lower() == "true"
+
+    @property
+    def llm_cache_path(self) -> str:
+        """Get the SQLite file used for the LLM response cache."""
+        return os.getenv("LLM_CACHE_PATH", "llm_response_cache.db")
+
+    @property
+    def llm_cache_ttl_seconds(self) -> int:
+        """Get how long cached LLM responses stay valid (seconds)."""
+        return int(os.getenv("LLM_CACHE_TTL_SECONDS", "86400"))
+
+    @property
+    def llm_cache_max_entries(self) -> int:
+        """Get the number of cached LLM responses kept before least recently used ones are evicted."""
+        return max(1, int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1000")))
+
+    @property
+    def tts_cache_enabled(self) -> bool:
+        """Check if synthesized speech should be cached on local disk."""
+        return os.getenv("TTS_CACHE_ENABLED", "false").lower() == "true"
+
+    @property
+    def tts_cache_dir(self) -> str:
+        """Get the directory used for the TTS synthesis cache."""
+        return os.getenv("TTS_CACHE_DIR", "tts_cache")
+
+    @property
+    def tts_cache_max_bytes(self) -> int:
+        """Get the disk budget of the TTS synthesis cache; least recently used audio is evicted beyond it."""
+        return max(1, int(os.getenv("TTS_CACHE_MAX_BYTES", str(500 * 1024 * 1024))))
+
+    @property
+    def tts_cache_gcs_enabled(self) -> bool:
+        """Check if the TTS synthesis cache should also be kept in the audio bucket."""
+        return os.getenv("TTS_CACHE_GCS_ENABLED", "false").lower() == "true"
+
+    @property
+    def llm_source_context_caching(self) -> bool:
+        """Check if the extracted source text should be uploaded once as a Gemini cached context."""
+        return os.getenv("LLM_SOURCE_CONTEXT_CACHING", "false").lower() == "true"
+
+    @property
+    def llm_source_context_min_chars(self) -> int:
+        """Get the minimum source text length (characters) worth caching as a context."""
+        return int(os.getenv("LLM_SOURCE_CONTEXT_MIN_CHARS", "16000"))
+
+    @property
+    def llm_source_context_ttl_seconds(self) -> int:
+        """Get how long a cached source context lives if it is not deleted explicitly (seconds)."""
+        return int(os.getenv("LLM_SOURCE_CONTEXT_TTL_SECONDS", "1800"))
+
     @property
     def cors_origins(self) -> list:
         """Get allowed CORS origins."""
@@ -6,7 +6,7 @@ import logging
 from datetime import datetime
 from typing import Optional, Any
 from sqlmodel import Field, Session, SQLModel, create_engine, select
-from sqlalchemy import Column, DateTime, func
+from sqlalchemy import Column, DateTime, func, inspect, text
 
 from .config import get_config
 
@@ -33,6 +33,7 @@ class PodcastStatusDB(SQLModel, table=True):
     )
 
     request_data: str = Field(description="JSON-serialized PodcastRequest")
+    request_fingerprint: Optional[str] = Field(default=None, index=True, description="PodcastRequest.fingerprint() for duplicate detection")
     result_episode: Optional[str] = Field(default=None, description="JSON-serialized PodcastEpisode")
 
     error_message: Optional[str] = Field(default=None, description="User-friendly error message")
@@ -42,6 +43,37 @@ class PodcastStatusDB(SQLModel, table=True):
     logs: str = Field(default="[]", description="JSON-serialized list of log entries")
 
 
+class PodcastCheckpointDB(SQLModel, table=True):
+    """Database model for storing completed-stage outputs so a task can be resumed."""
+
+    __tablename__ = "podcast_checkpoint"
+
+    task_id: str = Field(primary_key=True, description="Task identifier the checkpoint belongs to")
+    stage: str = Field(primary_key=True, description="Workflow stage name (e.g. 'outline')")
+    payload: str = Field(description="JSON-serialized stage output")
+
+    created_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column=Column(DateTime(timezone=False), server_default=func.now()),
+        description="When the checkpoint was saved",
+    )
+
+
+class SourceAnalysisCacheDB(SQLModel, table=True):
+    """Database model for sharing per-source analyses across tasks that use the same source content."""
+
+    __tablename__ = "source_analysis_cache"
+
+    content_hash: str = Field(primary_key=True, description="Hash of the analysis prompt and extracted source text")
+    payload: str = Field(description="JSON-serialized SourceAnalysis")
+
+    created_at: datetime = Field(
+        default_factory=datetime.utcnow,
+        sa_column=Column(DateTime(timezone=False), server_default=func.now()),
+        description="When the analysis was cached",
+    )
+
+
 config = get_config()
 DATABASE_URL = config.database_url
 
@@ -66,8 +98,22 @@ else:
 
 
 def init_db() -> None:
-    """Create tables if they do not exist."""
+    """Create tables if they do not exist and add columns introduced after a table was created."""
     SQLModel.metadata.create_all(engine)
+    _add_missing_columns()
+
+
+def _add_missing_columns() -> None:
+    """create_all does not alter existing tables, so add newer nullable columns in place."""
+    existing = {column["name"] for column in inspect(engine).get_columns(PodcastStatusDB.__tablename__)}
+    if "request_fingerprint" not in existing:
+        with engine.begin() as connection:
+            connection.execute(text(f"ALTER TABLE {PodcastStatusDB.__tablename__} ADD COLUMN request_fingerprint VARCHAR"))
+            connection.execute(text(
+                f"CREATE INDEX IF NOT EXISTS ix_podcast_status_request_fingerprint "
+                f"ON {PodcastStatusDB.__tablename__} (request_fingerprint)"
+            ))
+        logging.info("Added request_fingerprint column to podcast_status")
 
 
 def get_session() -> Session:
@@ -0,0 +1,202 @@
+"""
+Persistent cache for LLM responses.
+
+Responses are stored in a local SQLite file keyed by a hash of the model name,
+the prompt and the JSON schema of the requested result type, so retries and
+re-runs of the same generation step are answered from disk instead of Gemini.
+Entries expire after a TTL and the least recently used entries are evicted once
+the cache holds more than the configured number of entries.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from pydantic import TypeAdapter
+
+from app.config import get_config
+
+logger = logging.getLogger(__name__)
+
+
+class LlmCacheMetrics:
+    """Track LLM response cache hits and misses."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.errors = 0
+        self.saved_seconds = 0.0
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get current metrics snapshot."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate_pct": round((self.hits / lookups) * 100, 1) if lookups > 0 else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "errors": self.errors,
+            "estimated_seconds_saved": round(self.saved_seconds, 1),
+        }
+
+
+class LlmResponseCache:
+    """SQLite-backed response cache with TTL expiry and LRU eviction."""
+
+    def __init__(self, path: str, ttl_seconds: int, max_entries: int):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.metrics = LlmCacheMetrics()
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_response_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    model_name TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_accessed_at REAL NOT NULL,
+                    generation_seconds REAL NOT NULL DEFAULT 0
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_llm_response_cache_last_accessed_at "
+                "ON llm_response_cache (last_accessed_at)"
+            )
+        logger.info(f"LLM response cache at {path} (ttl={ttl_seconds}s, max_entries={max_entries})")
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=10)
+
+    @staticmethod
+    def make_key(model_name: str, prompt: str, result_type: Optional[type]) -> str:
+        """Hash the model name, prompt and result type schema into a cache key."""
+        schema = None
+        if result_type is not None:
+            try:
+                schema = TypeAdapter(result_type).json_schema()
+            except Exception:
+                schema = repr(result_type)
+        material = json.dumps(
+            {"model": model_name, "prompt": prompt, "result_schema": schema},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, result_type: Optional[type]) -> Tuple[bool, Any]:
+        """
+        Look up a cached response.
+
+        Returns:
+            Tuple of (hit, value); value is deserialized into result_type (or str)
+        """
+        now = time.time()
+        try:
+            with self._lock, self._connect() as conn:
+                row = conn.execute(
+                    "SELECT payload, created_at, generation_seconds FROM llm_response_cache WHERE cache_key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    self.metrics.misses += 1
+                    return False, None
+                payload, created_at, generation_seconds = row
+                if now - created_at > self.ttl_seconds:
+                    conn.execute("DELETE FROM llm_response_cache WHERE cache_key = ?", (key,))
+                    self.metrics.misses += 1
+                    return False, None
+                conn.execute(
+                    "UPDATE llm_response_cache SET last_accessed_at = ? WHERE cache_key = ?",
+                    (now, key),
+                )
+            value = TypeAdapter(result_type or str).validate_json(payload)
+        except Exception as e:
+            # A corrupt or incompatible entry is treated as a miss and regenerated
+            logger.warning(f"LLM response cache lookup failed: {e}")
+            self.metrics.errors += 1
+            self.metrics.misses += 1
+            return False, None
+
+        self.metrics.hits += 1
+        self.metrics.saved_seconds += generation_seconds
+        return True, value
+
+    def set(
+        self,
+        key: str,
+        model_name: str,
+        value: Any,
+        result_type: Optional[type],
+        generation_seconds: float = 0.0
+    ) -> None:
+        """Store a response and evict expired and least recently used entries."""
+        now = time.time()
+        try:
+            payload = TypeAdapter(result_type or str).dump_json(value).decode("utf-8")
+            with self._lock, self._connect() as conn:
+                conn.execute(
+                    """
+                    INSERT OR REPLACE INTO llm_response_cache
+                        (cache_key, model_name, payload, created_at, last_accessed_at, generation_seconds)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    """,
+                    (key, model_name, payload, now, now, generation_seconds),
+                )
+                self.metrics.stores += 1
+                expired = conn.execute(
+                    "DELETE FROM llm_response_cache WHERE created_at < ?",
+                    (now - self.ttl_seconds,),
+                ).rowcount
+                overflow = conn.execute(
+                    """
+                    DELETE FROM llm_response_cache WHERE cache_key IN (
+                        SELECT cache_key FROM llm_response_cache
+                        ORDER BY last_accessed_at DESC LIMIT -1 OFFSET ?
+                    )
+                    """,
+                    (self.max_entries,),
+                ).rowcount
+                self.metrics.evictions += expired + overflow
+        except Exception as e:
+            logger.warning(f"Failed to store LLM response in cache: {e}")
+            self.metrics.errors += 1
+
+
+# Global cache instance
+_llm_response_cache: Optional[LlmResponseCache] = None
+
+
+def get_llm_response_cache() -> Optional[LlmResponseCache]:
+    """Get or create the global LLM response cache, or None if caching is disabled."""
+    global _llm_response_cache
+    config = get_config()
+    if not config.llm_cache_enabled:
+        return None
+    if _llm_response_cache is None:
+        try:
+            _llm_response_cache = LlmResponseCache(
+                config.llm_cache_path,
+                config.llm_cache_ttl_seconds,
+                config.llm_cache_max_entries,
+            )
+        except Exception as e:
+            logger.warning(f"LLM response cache unavailable, continuing without it: {e}")
+            return None
+    return _llm_response_cache
@@ -0,0 +1,249 @@
+"""
+Adaptive timeouts and hedged requests for Gemini calls.
+
+Call sites pass generous fixed timeouts (up to 7 minutes), so one stuck request
+holds a task long before any fallback starts. The tracker keeps a window of
+recent latencies per call type and, once enough calls have completed, shrinks
+the timeout to a multiple of the observed p99 (never above the call site's own
+timeout). Optionally a duplicate request is sent when a call runs past the p95
+of its type, and whichever answer arrives first is used; the share of hedged
+calls is capped so the extra cost stays bounded.
+"""
+
+import asyncio
+import logging
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+from app.config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Latencies kept per call type
+LATENCY_WINDOW_SIZE = 200
+# How often to check whether a call queued in the rate limiter has started
+_START_POLL_SECONDS = 0.05
+
+T = TypeVar("T")
+
+
+def _is_timeout(error: BaseException) -> bool:
+    return isinstance(error, asyncio.TimeoutError) or "timeout" in type(error).__name__.lower()
+
+
+class LlmAttempt:
+    """One request of a call; the caller marks when it actually starts (after rate limiting)."""
+
+    def __init__(self, timeout_seconds: float):
+        self.timeout_seconds = timeout_seconds
+        self.started_at: Optional[float] = None
+
+    def start(self):
+        if self.started_at is None:
+            self.started_at = time.monotonic()
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at if self.started_at is not None else 0.0
+
+
+class _CallTypeStats:
+    def __init__(self):
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW_SIZE)
+        self.calls = 0
+        self.timeouts = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+
+
+class LlmLatencyTracker:
+    """Track latency per call type and run calls with adaptive timeouts and optional hedging."""
+
+    def __init__(
+        self,
+        adaptive_timeouts: bool = True,
+        min_samples: int = 20,
+        p99_multiplier: float = 3.0,
+        floor_seconds: float = 30.0,
+        hedge_requests: bool = False,
+        hedge_max_fraction: float = 0.1
+    ):
+        self.adaptive_timeouts = adaptive_timeouts
+        self.min_samples = min_samples
+        self.p99_multiplier = p99_multiplier
+        self.floor_seconds = floor_seconds
+        self.hedge_requests = hedge_requests
+        self.hedge_max_fraction = hedge_max_fraction
+        self._lock = threading.Lock()
+        self._stats: Dict[str, _CallTypeStats] = {}
+        self._total_calls = 0
+        self._total_hedges = 0
+
+    def _get_stats(self, call_type: str) -> _CallTypeStats:
+        stats = self._stats.get(call_type)
+        if stats is None:
+            stats = self._stats[call_type] = _CallTypeStats()
+        return stats
+
+    def percentile(self, call_type: str, pct: float) -> Optional[float]:
+        """Nearest-rank latency percentile of a call type, or None until min_samples calls completed."""
+        with self._lock:
+            latencies = sorted(self._get_stats(call_type).latencies)
+        if len(latencies) < self.min_samples:
+            return None
+        return latencies[max(0, math.ceil(pct / 100 * len(latencies)) - 1)]
+
+    def timeout_for(self, call_type: str, default_timeout: float) -> float:
+        """Timeout for the next call of a type; the call site's default is the upper bound."""
+        if not self.adaptive_timeouts:
+            return default_timeout
+        p99 = self.percentile(call_type, 99)
+        if p99 is None:
+            return default_timeout
+        return min(default_timeout, max(self.floor_seconds, p99 * self.p99_multiplier))
+
+    def hedge_delay(self, call_type: str) -> Optional[float]:
+        """Seconds after which a call of this type gets a duplicate request, or None to never hedge."""
+        if not self.hedge_requests:
+            return None
+        return self.percentile(call_type, 95)
+
+    def _reserve_hedge(self, call_type: str) -> bool:
+        with self._lock:
+            if self._total_hedges + 1 > self.hedge_max_fraction * self._total_calls:
+                return False
+            self._total_hedges += 1
+            self._get_stats(call_type).hedges += 1
+            return True
+
+    def _record_latency(self, call_type: str, seconds: float, timed_out: bool = False, hedge_won: bool = False):
+        with self._lock:
+            stats = self._get_stats(call_type)
+            # Timeouts count as samples too, so the timeout grows back if the model slows down
+            stats.latencies.append(seconds)
+            if timed_out:
+                stats.timeouts += 1
+            if hedge_won:
+                stats.hedge_wins += 1
+
+    def record_call(self, call_type: str, seconds: float, timed_out: bool = False):
+        """Record a call made without run(), such as a streamed response that cannot be hedged."""
+        with self._lock:
+            self._get_stats(call_type).calls += 1
+            self._total_calls += 1
+        self._record_latency(call_type, seconds, timed_out=timed_out)
+
+    async def run(
+        self,
+        call_type: str,
+        default_timeout: float,
+        call: Callable[[LlmAttempt], Awaitable[T]],
+        hedge: bool = True
+    ) -> T:
+        """
+        Run call with the adaptive timeout of its type, hedging it (unless hedge is False) if it runs past the p95.
+
+        call must call attempt.start() once its request is actually sent and give up
+        after attempt.timeout_seconds. The first successful answer wins and the other
+        request is cancelled; if every request fails, the first error is raised.
+        """
+        timeout = self.timeout_for(call_type, default_timeout)
+        hedge_delay = self.hedge_delay(call_type) if hedge else None
+        if hedge_delay is not None and hedge_delay >= timeout:
+            hedge_delay = None
+        if timeout < default_timeout:
+            logger.debug(f"Adaptive timeout for {call_type}: {timeout:.0f}s instead of {default_timeout}s")
+        with self._lock:
+            self._get_stats(call_type).calls += 1
+            self._total_calls += 1
+
+        primary = LlmAttempt(timeout)
+        attempts = {asyncio.ensure_future(call(primary)): primary}
+        pending = set(attempts)
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                wait_timeout = None
+                if hedge_delay is not None:
+                    wait_timeout = (
+                        _START_POLL_SECONDS if primary.started_at is None
+                        else max(0.0, hedge_delay - primary.elapsed())
+                    )
+                done, pending = await asyncio.wait(pending, timeout=wait_timeout, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    attempt = attempts[task]
+                    task_error = task.exception()
+                    if task_error is None:
+                        self._record_latency(call_type, attempt.elapsed(), hedge_won=attempt is not primary)
+                        return task.result()
+                    if _is_timeout(task_error):
+                        self._record_latency(call_type, attempt.timeout_seconds, timed_out=True)
+                    error = error or task_error
+
+                if hedge_delay is not None and pending and primary.started_at is not None and primary.elapsed() >= hedge_delay:
+                    # Only one hedge per call
+                    hedge_delay = None
+                    if self._reserve_hedge(call_type):
+                        logger.info(f"{call_type} call still running after {primary.elapsed():.1f}s (p95), sending a hedged request")
+                        hedge = LlmAttempt(timeout)
+                        hedge_task = asyncio.ensure_future(call(hedge))
+                        attempts[hedge_task] = hedge
+                        pending.add(hedge_task)
+            raise error
+        finally:
+            losers = [task for task in attempts if not task.done()]
+            for task in losers:
+                task.cancel()
+            # Retrieve results of the other requests so their errors are not reported as unhandled
+            await asyncio.gather(*attempts, return_exceptions=True)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get current metrics snapshot."""
+        call_types = {}
+        with self._lock:
+            snapshot = {call_type: (sorted(stats.latencies), stats) for call_type, stats in self._stats.items()}
+            total_calls, total_hedges = self._total_calls, self._total_hedges
+        for call_type, (latencies, stats) in snapshot.items():
+            def pct(value: float) -> Optional[float]:
+                return round(latencies[max(0, math.ceil(value / 100 * len(latencies)) - 1)], 2) if latencies else None
+            call_types[call_type] = {
+                "calls": stats.calls,
+                "samples": len(latencies),
+                "p50_seconds": pct(50),
+                "p95_seconds": pct(95),
+                "p99_seconds": pct(99),
+                "timeouts": stats.timeouts,
+                "hedges": stats.hedges,
+                "hedge_wins": stats.hedge_wins,
+            }
+        return {
+            "adaptive_timeouts": self.adaptive_timeouts,
+            "hedge_requests": self.hedge_requests,
+            "total_calls": total_calls,
+            "total_hedges": total_hedges,
+            "call_types": call_types,
+        }
+
+
+# Global tracker instance
+_llm_latency_tracker: Optional[LlmLatencyTracker] = None
+_llm_latency_tracker_lock = threading.Lock()
+
+
+def get_llm_latency_tracker() -> LlmLatencyTracker:
+    """Get or create the process-wide LLM latency tracker."""
+    global _llm_latency_tracker
+    with _llm_latency_tracker_lock:
+        if _llm_latency_tracker is None:
+            config = get_config()
+            _llm_latency_tracker = LlmLatencyTracker(
+                adaptive_timeouts=config.llm_adaptive_timeouts,
+                min_samples=config.llm_timeout_min_samples,
+                p99_multiplier=config.llm_timeout_p99_multiplier,
+                floor_seconds=config.llm_timeout_floor_seconds,
+                hedge_requests=config.llm_hedge_requests,
+                hedge_max_fraction=config.llm_hedge_max_fraction,
+            )
+        return _llm_latency_tracker
@@ -0,0 +1,147 @@
+"""
+Local repair of structured LLM output that failed validation.
+
+When a structured (result_type) call fails validation, the raw model output is
+usually almost right: wrapped in markdown fences or prose, with trailing commas,
+numbers where strings are expected, a bare list instead of the wrapping object,
+or nulls for optional fields. Repairing that output locally avoids a second full
+LLM call with the same prompt, which is then only needed as a last resort.
+"""
+
+import json
+import logging
+import re
+from typing import Any, Dict, List, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+_FENCED_BLOCK = re.compile(r"```(?:json)?\s*([\s\S]*?)\s*```")
+_TRAILING_COMMA = re.compile(r",\s*([}\]])")
+
+
+class StructuredOutputError(ValueError):
+    """Raised when a structured response cannot be validated; keeps the raw output for local repair."""
+
+    def __init__(self, message: str, raw_output: Any):
+        super().__init__(message)
+        self.raw_output = raw_output
+
+
+class JsonRepairMetrics:
+    """Track how often failed structured output is repaired locally."""
+
+    def __init__(self):
+        self.attempts = 0
+        self.repaired = 0
+        self.failed = 0
+        self.reprompts = 0
+
+    def record_repair(self, success: bool):
+        """Record a local repair attempt."""
+        self.attempts += 1
+        if success:
+            self.repaired += 1
+        else:
+            self.failed += 1
+
+    def record_reprompt(self):
+        """Record a fallback LLM call made because local repair was not possible."""
+        self.reprompts += 1
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get current metrics snapshot."""
+        return {
+            "attempts": self.attempts,
+            "repaired": self.repaired,
+            "failed": self.failed,
+            "success_rate_pct": round((self.repaired / self.attempts) * 100, 1) if self.attempts > 0 else 0.0,
+            "reprompts": self.reprompts,
+        }
+
+
+def parse_json_lenient(text: str) -> Any:
+    """
+    Parse JSON from raw LLM text.
+
+    Tolerates markdown fences, prose around the JSON value, trailing commas and
+    raw newlines inside strings.
+
+    Raises:
+        json.JSONDecodeError: If no JSON value can be recovered
+    """
+    stripped = (text or "").strip()
+    fenced = _FENCED_BLOCK.search(stripped)
+    if fenced:
+        stripped = fenced.group(1).strip()
+
+    candidates = [stripped]
+    # The outermost object or array, earliest first, for output wrapped in prose
+    spans = []
+    for open_char, close_char in (("{", "}"), ("[", "]")):
+        start, end = stripped.find(open_char), stripped.rfind(close_char)
+        if start != -1 and end > start:
+            spans.append((start, stripped[start:end + 1]))
+    candidates.extend(span for _, span in sorted(spans))
+
+    for candidate in candidates:
+        for variant in (candidate, _TRAILING_COMMA.sub(r"\1", candidate)):
+            try:
+                return json.loads(variant, strict=False)
+            except json.JSONDecodeError:
+                continue
+    raise json.JSONDecodeError("No JSON value found in LLM output", text or "", 0)
+
+
+def coerce_to_result_type(data: Any, result_type: type) -> Any:
+    """
+    Nudge parsed JSON towards the shape of a Pydantic result type before validation.
+
+    A bare list becomes the model's only list field, scalars become strings or
+    one-item lists where the model expects them, and nulls for optional fields
+    are dropped so their defaults apply.
+    """
+    if isinstance(result_type, type) and issubclass(result_type, BaseModel):
+        return _coerce_model_data(data, result_type)
+    return data
+
+
+def _coerce_model_data(data: Any, model: type) -> Any:
+    if isinstance(data, list):
+        list_fields = [name for name, field in model.model_fields.items() if get_origin(field.annotation) in (list, List)]
+        if len(list_fields) == 1:
+            data = {list_fields[0]: data}
+    if not isinstance(data, dict):
+        return data
+
+    coerced = {}
+    for key, value in data.items():
+        field = model.model_fields.get(key)
+        if field is None:
+            coerced[key] = value
+        elif value is None and not field.is_required():
+            continue
+        else:
+            coerced[key] = _coerce_value(value, field.annotation)
+    return coerced
+
+
+def _coerce_value(value: Any, annotation: Any) -> Any:
+    if get_origin(annotation) is Union:
+        non_none_args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(non_none_args) != 1:
+            return value
+        annotation = non_none_args[0]
+
+    if value is None:
+        return value
+    if annotation is str and isinstance(value, (int, float)):
+        return str(value)
+    if get_origin(annotation) in (list, List):
+        item_args = get_args(annotation)
+        items = value if isinstance(value, list) else [value]
+        return [_coerce_value(item, item_args[0]) for item in items] if item_args else items
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return _coerce_model_data(value, annotation)
+    return value
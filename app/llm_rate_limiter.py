@@ -0,0 +1,264 @@
+"""
+Process-wide rate limiting for Gemini API calls.
+
+Every GeminiService instance (the MCP server builds one per podcast request)
+shares one limiter, so concurrent tasks together stay within the configured
+requests-per-minute, tokens-per-minute and concurrent request limits instead of
+bursting into ResourceExhausted errors. Calls wait in a priority queue; the
+priority comes from the call site via ``call_priority`` and waiting calls age
+so low-priority work is not starved. Token use is estimated from the prompt
+before a call and corrected with the reported usage afterwards.
+"""
+
+import asyncio
+import itertools
+import logging
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Any, AsyncIterator, Dict, Iterator, Optional, Tuple
+
+from app.config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Rough size of a response, added to the prompt estimate until the real usage is known
+DEFAULT_OUTPUT_TOKEN_ESTIMATE = 1024
+
+
+class CallPriority(IntEnum):
+    """Priority of a Gemini call; lower values are served first."""
+    HIGH = 0  # On the critical path of a running task (outline, dialogue)
+    NORMAL = 1
+    LOW = 2  # Bulk work that can wait (e.g. chunks of a long source)
+
+
+# Priority of Gemini calls made in the current context
+current_call_priority: ContextVar[CallPriority] = ContextVar("current_call_priority", default=CallPriority.NORMAL)
+
+
+@contextmanager
+def call_priority(priority: CallPriority) -> Iterator[None]:
+    """Run the Gemini calls made inside this block with the given priority."""
+    token = current_call_priority.set(priority)
+    try:
+        yield
+    finally:
+        current_call_priority.reset(token)
+
+
+def estimate_tokens(prompt: str, expected_output_tokens: int = DEFAULT_OUTPUT_TOKEN_ESTIMATE) -> int:
+    """Estimate the tokens a call will use (about 4 characters per prompt token)."""
+    return len(prompt or "") // 4 + expected_output_tokens
+
+
+class RateLimiterMetrics:
+    """Track Gemini rate limiter queueing and throttling."""
+
+    def __init__(self):
+        self.requests = 0
+        self.throttled_requests = 0
+        self.total_throttle_seconds = 0.0
+        self.max_throttle_seconds = 0.0
+        self.max_queue_depth = 0
+        self.rate_limit_errors = 0
+
+    def record_acquire(self, waited_seconds: float):
+        """Record a call that was allowed through after waiting waited_seconds."""
+        self.requests += 1
+        if waited_seconds >= 0.01:
+            self.throttled_requests += 1
+            self.total_throttle_seconds += waited_seconds
+            self.max_throttle_seconds = max(self.max_throttle_seconds, waited_seconds)
+
+    def get_metrics(self, queue_depth: int, in_flight: int) -> Dict[str, Any]:
+        """Get current metrics snapshot."""
+        return {
+            "queue_depth": queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "in_flight": in_flight,
+            "requests": self.requests,
+            "throttled_requests": self.throttled_requests,
+            "total_throttle_seconds": round(self.total_throttle_seconds, 1),
+            "avg_throttle_seconds": round(self.total_throttle_seconds / self.throttled_requests, 2) if self.throttled_requests else 0.0,
+            "max_throttle_seconds": round(self.max_throttle_seconds, 1),
+            "rate_limit_errors": self.rate_limit_errors,
+        }
+
+
+class _TokenBucket:
+    """Continuously refilling bucket holding up to one minute of budget."""
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until amount (capped at the capacity) is available."""
+        self._refill(now)
+        amount = min(amount, self.capacity)
+        return 0.0 if self.tokens >= amount else (amount - self.tokens) / self.rate
+
+    def take(self, amount: float):
+        self.tokens -= min(amount, self.capacity)
+
+    def adjust(self, delta: float):
+        # May go negative, which delays later calls until the overuse is paid back
+        self.tokens = min(self.capacity, self.tokens - delta)
+
+    def drain(self, now: float):
+        self._refill(now)
+        self.tokens = min(self.tokens, 0.0)
+
+
+class RateLimitPermit:
+    """Handle for an admitted call, used to report its real token usage."""
+
+    def __init__(self, limiter: "GeminiRateLimiter", estimated_tokens: int):
+        self._limiter = limiter
+        self.estimated_tokens = estimated_tokens
+
+    def record_usage(self, total_tokens: Optional[int]):
+        """Correct the token budget with the usage reported for the call."""
+        if isinstance(total_tokens, int) and total_tokens > 0:
+            self._limiter._adjust_tokens(total_tokens - self.estimated_tokens)
+
+
+class GeminiRateLimiter:
+    """
+    Token-bucket limiter for requests and tokens per minute plus a concurrency cap.
+
+    State is guarded by a threading lock and waiters poll with asyncio.sleep, so
+    the limiter works across event loops and threads. A limit of 0 disables it.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        max_concurrent_requests: int,
+        aging_seconds: float = 30.0,
+        poll_interval: float = 0.05
+    ):
+        self._request_bucket = _TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        self._token_bucket = _TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        self.max_concurrent_requests = max_concurrent_requests
+        self.aging_seconds = aging_seconds
+        self.poll_interval = poll_interval
+        self.metrics = RateLimiterMetrics()
+        self._lock = threading.Lock()
+        self._sequence = itertools.count()
+        self._waiters: Dict[int, Tuple[CallPriority, float]] = {}
+        self._in_flight = 0
+
+    def _next_waiter(self, now: float) -> int:
+        # Each aging_seconds of waiting raises a call by one priority level
+        return min(
+            self._waiters,
+            key=lambda seq: (self._waiters[seq][0] - (now - self._waiters[seq][1]) / self.aging_seconds, seq)
+        )
+
+    def _try_acquire(self, seq: int, estimated_tokens: int) -> float:
+        """Admit the call if it is next in line and within limits; otherwise return seconds to wait."""
+        now = time.monotonic()
+        if self._next_waiter(now) != seq:
+            return self.poll_interval
+        if self.max_concurrent_requests > 0 and self._in_flight >= self.max_concurrent_requests:
+            return self.poll_interval
+        wait = max(
+            self._request_bucket.wait_time(1, now) if self._request_bucket else 0.0,
+            self._token_bucket.wait_time(estimated_tokens, now) if self._token_bucket else 0.0,
+        )
+        if wait > 0:
+            return wait
+        if self._request_bucket:
+            self._request_bucket.take(1)
+        if self._token_bucket:
+            self._token_bucket.take(estimated_tokens)
+        self._in_flight += 1
+        del self._waiters[seq]
+        return 0.0
+
+    @asynccontextmanager
+    async def limit(self, estimated_tokens: int, priority: Optional[CallPriority] = None) -> AsyncIterator[RateLimitPermit]:
+        """Wait for a slot for one Gemini call, by default with the priority of the current context."""
+        if priority is None:
+            priority = current_call_priority.get()
+        enqueued_at = time.monotonic()
+        with self._lock:
+            seq = next(self._sequence)
+            self._waiters[seq] = (priority, enqueued_at)
+            self.metrics.max_queue_depth = max(self.metrics.max_queue_depth, len(self._waiters))
+        try:
+            while True:
+                with self._lock:
+                    wait = self._try_acquire(seq, estimated_tokens)
+                if wait == 0:
+                    break
+                await asyncio.sleep(min(wait, 1.0))
+        except BaseException:
+            with self._lock:
+                self._waiters.pop(seq, None)
+            raise
+
+        waited = time.monotonic() - enqueued_at
+        self.metrics.record_acquire(waited)
+        if waited >= 1.0:
+            logger.info(f"Gemini call ({priority.name} priority, ~{estimated_tokens} tokens) throttled for {waited:.1f}s")
+        try:
+            yield RateLimitPermit(self, estimated_tokens)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _adjust_tokens(self, delta: float):
+        if self._token_bucket:
+            with self._lock:
+                self._token_bucket.adjust(delta)
+
+    def report_rate_limited(self):
+        """Back off all callers after Gemini rejected a call for exceeding its quota."""
+        now = time.monotonic()
+        with self._lock:
+            self.metrics.rate_limit_errors += 1
+            if self._request_bucket:
+                self._request_bucket.drain(now)
+            if self._token_bucket:
+                self._token_bucket.drain(now)
+        logger.warning("Gemini rate limit hit, draining the shared rate limiter budget")
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get current metrics snapshot."""
+        with self._lock:
+            return self.metrics.get_metrics(queue_depth=len(self._waiters), in_flight=self._in_flight)
+
+
+# Global limiter instance
+_gemini_rate_limiter: Optional[GeminiRateLimiter] = None
+_gemini_rate_limiter_lock = threading.Lock()
+
+
+def get_gemini_rate_limiter() -> GeminiRateLimiter:
+    """Get or create the process-wide Gemini rate limiter."""
+    global _gemini_rate_limiter
+    with _gemini_rate_limiter_lock:
+        if _gemini_rate_limiter is None:
+            config = get_config()
+            _gemini_rate_limiter = GeminiRateLimiter(
+                config.gemini_requests_per_minute,
+                config.gemini_tokens_per_minute,
+                config.gemini_max_concurrent_requests,
+            )
+            logger.info(
+                f"Gemini rate limiter: {config.gemini_requests_per_minute} requests/min, "
+                f"{config.gemini_tokens_per_minute} tokens/min, {config.gemini_max_concurrent_requests} concurrent (0 = unlimited)"
+            )
+        return _gemini_rate_limiter
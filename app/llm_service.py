@@ -5,28 +5,34 @@ import os
 import sys
 import time
 import re
+import hashlib
 import json
 import random
 from datetime import datetime
-from typing import List, Dict, Optional, Union, Any
+from typing import List, Dict, Optional, Union, Any, AsyncIterator, Callable, Tuple
 import logging
 import functools
 import asyncio
 from concurrent.futures import ThreadPoolExecutor, Future
 import atexit
+from contextlib import AsyncExitStack
 
 from dotenv import load_dotenv
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
-from pydantic_ai import Agent
+from pydantic_ai import Agent, capture_run_messages
+from pydantic_ai.exceptions import UserError, ModelRetry, UnexpectedModelBehavior
+from pydantic_ai.messages import ModelMessage, ModelResponse, TextPart, ToolCallPart
 from pydantic_ai.models.gemini import GeminiModel
 import logfire
 from app.config import get_config
 from app.prompts import (
     SOURCE_ANALYSIS_TEMPLATE,
+    SOURCE_ANALYSIS_REDUCE_TEMPLATE,
     PERSONA_RESEARCH_TEMPLATE,
     PODCAST_OUTLINE_TEMPLATE,
     SEGMENT_DIALOGUE_TEMPLATE,
+    DIALOGUE_TRANSITION_TEMPLATE,
 )
 
 from google.api_core.exceptions import (
@@ -40,6 +46,12 @@ from pydantic import ValidationError
 
 from app.podcast_models import PersonaResearch, PodcastOutline, DialogueTurn, SourceAnalysis, OutlineSegment, PodcastDialogue
 from app.common_exceptions import LLMProcessingError
+from app.task_runner import raise_if_cancelled
+from app.llm_cache import LlmResponseCache, get_llm_response_cache
+from app.llm_latency import LlmAttempt, get_llm_latency_tracker
+from app.llm_rate_limiter import CallPriority, call_priority, estimate_tokens, get_gemini_rate_limiter
+from app.llm_output_repair import JsonRepairMetrics, StructuredOutputError, coerce_to_result_type, parse_json_lenient
+from app.source_context_cache import GeminiSourceContextCache, SOURCE_CONTEXT_REFERENCE
 
 # Lists for persona invented names by gender
 male_names = [
@@ -73,8 +85,15 @@ class LLMNotInitializedError(ValueError):
     pass
 
 class GeminiService:
-    # Shared thread pool executor for LLM operations (similar to TTS service pattern)
+    # Shared thread pool executor for LLM operations
     _llm_executor = None
+    # Shared metrics for local repair of structured output that failed validation
+    _json_repair_metrics = JsonRepairMetrics()
+    
+    @classmethod
+    def get_json_repair_metrics(cls) -> Dict[str, Any]:
+        """Get a snapshot of structured output repair metrics."""
+        return cls._json_repair_metrics.get_metrics()
     
     @classmethod
     def _get_llm_executor(cls):
@@ -119,7 +138,8 @@ class GeminiService:
         genai.configure(api_key=api_key)
         # Using gemini-2.0-flash-exp as per upgrade to Gemini 2.0 Flash.
         # Consider making the model name configurable if needed in the future.
-        self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
+        self.model_name = 'gemini-2.0-flash-exp'
+        self.model = genai.GenerativeModel(self.model_name)
         
         # Store TTS service for voice profile lookup
         self.tts_service = tts_service
@@ -127,19 +147,24 @@ class GeminiService:
         # Initialize Pydantic AI agent
         logger.info("Initializing Pydantic AI agent for Gemini service")
         # Create Pydantic AI model with standard approach
-        pydantic_model = GeminiModel('gemini-2.0-flash-exp')
+        pydantic_model = GeminiModel(self.model_name)
         # Create a generic agent that can handle both string and structured outputs
         self.pydantic_agent = Agent(
             model=pydantic_model,
             system_prompt=""  # Empty system prompt for default behavior
         )
+        # Structured-output agents keyed by result_type, built on first use (see _get_agent)
+        self._agents_by_result_type: Dict[type, Agent] = {}
+        # Cached source contexts keyed by source text hash (see _get_source_context_async)
+        self.source_context_cache = GeminiSourceContextCache()
+        self._source_contexts: Dict[str, asyncio.Future] = {}
         # Configure Logfire if credentials are available (either in project dir or env)
-        logfire_configured = (
+        self.logfire_configured = (
             os.path.exists('.logfire/logfire_credentials.json') or 
             os.environ.get('LOGFIRE_TOKEN') is not None
         )
         
-        if logfire_configured:
+        if self.logfire_configured:
             try:
                 logfire.configure()
                 # Instrument all Pydantic AI agents globally
@@ -151,15 +176,143 @@ class GeminiService:
             logger.info("Logfire credentials not found, skipping observability setup")
         logger.info("Pydantic AI agent initialized successfully")
 
-    async def generate_text_async(self, prompt: str, timeout_seconds: int = 180, result_type: Optional[type] = None) -> Union[str, Any]:
+    def _get_agent(self, result_type: Optional[type] = None) -> Agent:
+        """
+        Get the Pydantic AI agent for a structured result type.
+        
+        Agents are created once per result type and reused, so the output schema
+        is only built on first use rather than on every call.
+        """
+        if result_type is None:
+            return self.pydantic_agent
+        agent = self._agents_by_result_type.get(result_type)
+        if agent is None:
+            agent = Agent(
+                model=self.pydantic_agent.model,
+                result_type=result_type,
+                system_prompt="",
+                # Invalid output is repaired locally before any re-prompt, see _run_structured_agent_async
+                output_retries=0
+            )
+            self._agents_by_result_type[result_type] = agent
+            logger.info(f"Created Pydantic AI agent for result type: {result_type}")
+        return agent
+
+    async def _lookup_cached_response_async(
+        self,
+        prompt: str,
+        result_type: Optional[type]
+    ) -> Tuple[Optional[LlmResponseCache], Optional[str], bool, Any]:
+        """
+        Look up a prompt in the LLM response cache without blocking the event loop.
+        
+        Returns:
+            Tuple of (cache or None when disabled, cache key, hit, cached output)
+        """
+        cache = get_llm_response_cache()
+        if cache is None:
+            return None, None, False, None
+        cache_key = cache.make_key(self.model_name, prompt, result_type)
+        hit, cached_output = await asyncio.to_thread(cache.get, cache_key, result_type)
+        if hit:
+            logger.info(f"LLM response cache hit for {result_type or 'string'} output")
+        return cache, cache_key, hit, cached_output
+
+    async def _cache_response_async(
+        self,
+        cache: Optional[LlmResponseCache],
+        cache_key: Optional[str],
+        output: Any,
+        result_type: Optional[type],
+        generation_seconds: float
+    ) -> None:
+        """Store a successful, non-empty response in the LLM response cache without blocking the event loop."""
+        if cache is None or cache_key is None or not output:
+            return
+        await asyncio.to_thread(cache.set, cache_key, self.model_name, output, result_type, generation_seconds)
+
+    @staticmethod
+    def _raw_output_from_messages(messages: List[ModelMessage]) -> Optional[Union[str, Dict[str, Any]]]:
+        """Get the model's last structured answer (tool call arguments or text) from a failed run."""
+        for message in reversed(messages):
+            if not isinstance(message, ModelResponse):
+                continue
+            for part in message.parts:
+                if isinstance(part, ToolCallPart) and part.args:
+                    return part.args
+                if isinstance(part, TextPart) and part.content.strip():
+                    return part.content
+        return None
+
+    def _repair_structured_output(self, raw_output: Optional[Union[str, Dict[str, Any]]], result_type: type) -> Optional[Any]:
+        """
+        Repair raw output that failed structured validation without calling the LLM again.
+        
+        Returns:
+            An instance of result_type, or None if the output could not be repaired
+        """
+        if not raw_output:
+            self._json_repair_metrics.record_repair(False)
+            return None
+        try:
+            parsed = raw_output if isinstance(raw_output, (dict, list)) else parse_json_lenient(raw_output)
+            repaired = TypeAdapter(result_type).validate_python(
+                coerce_to_result_type(self._clean_keys_recursive(parsed), result_type)
+            )
+        except (json.JSONDecodeError, ValidationError) as e:
+            logger.warning(f"Local repair of {getattr(result_type, '__name__', result_type)} output failed: {e}")
+            self._json_repair_metrics.record_repair(False)
+            return None
+        logger.info(f"Repaired {getattr(result_type, '__name__', result_type)} output locally without a second LLM call")
+        self._json_repair_metrics.record_repair(True)
+        return repaired
+
+    async def _run_structured_agent_async(
+        self,
+        agent: Agent,
+        prompt: str,
+        run_kwargs: Dict[str, Any],
+        result_type: type,
+        llm_attempt: LlmAttempt
+    ) -> Any:
+        """
+        Run a structured output agent once, repairing invalid output locally.
+        
+        Agents do not retry invalid output themselves (output_retries=0). Output
+        that fails validation is repaired locally; if the repair fails too, the
+        validation error is raised and generate_text_async re-prompts once.
+        """
+        with capture_run_messages() as run_messages:
+            try:
+                async with get_gemini_rate_limiter().limit(estimate_tokens(prompt)) as permit:
+                    llm_attempt.start()
+                    result = await asyncio.wait_for(agent.run(prompt, **run_kwargs), llm_attempt.timeout_seconds)
+                    permit.record_usage(result.usage().total_tokens)
+                return result.data
+            except (ValidationError, UnexpectedModelBehavior):
+                repaired = self._repair_structured_output(self._raw_output_from_messages(run_messages), result_type)
+                if repaired is not None:
+                    return repaired
+                raise
+
+    async def generate_text_async(
+        self,
+        prompt: str,
+        timeout_seconds: int = 180,
+        result_type: Optional[type] = None,
+        reprompt: bool = True
+    ) -> Union[str, Any]:
         """
         Asynchronously generates text based on the given prompt using the configured Gemini model.
         Uses Pydantic AI with support for structured output via result_type parameter.
         
         Args:
             prompt: The prompt to send to the model
-            timeout_seconds: Maximum time to wait for the API call in seconds (default: 180)
+            timeout_seconds: Maximum time to wait for the API call in seconds (default: 180); shortened
+                to a multiple of the observed p99 latency once enough calls of this type completed
             result_type: Optional type for structured output
+            reprompt: Whether structured output that cannot be repaired locally is asked for once more;
+                callers that already re-prompted pass False so one bad output costs at most two calls
             
         Returns:
             The generated text response (string) or structured output if result_type is provided
@@ -167,7 +320,7 @@ class GeminiService:
         Raises:
             TimeoutError: If the API call exceeds the timeout_seconds
             ValueError: If the prompt is empty
-            ValidationError: If structured output validation fails
+            ValidationError: If structured output validation fails and the output cannot be repaired locally
             RuntimeError: For other unexpected errors
         """
         logger.info("ENTRY: generate_text_async method called")
@@ -178,52 +331,70 @@ class GeminiService:
             logger.error("Prompt cannot be empty.")
             raise ValueError("Prompt cannot be empty.")
         
-        try:
-            # Configure timeout and retries
-            import pydantic_ai
-            from pydantic_ai.exceptions import UserError, ModelRetry
-            
+        # Don't spend quota on calls for a podcast task that was cancelled
+        raise_if_cancelled()
+        
+        # Identical prompts (retries, duplicate sources, re-runs) are answered from the response cache
+        cache, cache_key, hit, cached_output = await self._lookup_cached_response_async(prompt, result_type)
+        if hit:
+            logger.info("EXIT: generate_text_async completed from cache")
+            return cached_output
+        start_time = time.time()
+        
+        # Call sites pass worst-case timeouts; the tracker shrinks them to the observed
+        # latency of this call type and may hedge calls that run past their p95
+        latency_tracker = get_llm_latency_tracker()
+        call_type = f"{getattr(result_type, '__name__', 'text') if result_type else 'text'}/{timeout_seconds}s"
+        effective_timeout = latency_tracker.timeout_for(call_type, timeout_seconds)
+        
+        async def run_once(llm_attempt: LlmAttempt) -> Any:
             # Set up run context with timeout and retries
             run_kwargs = {
                 'message_history': [],
                 'model_settings': {
-                    'timeout': timeout_seconds,
+                    'timeout': llm_attempt.timeout_seconds,
                 }
             }
             
-            # Check if Logfire is configured
-            logfire_configured = (
-                os.path.exists('.logfire/logfire_credentials.json') or 
-                os.environ.get('LOGFIRE_TOKEN') is not None
-            )
+            if result_type:
+                # Logfire is instrumented globally, just run the agent
+                return await self._run_structured_agent_async(self._get_agent(result_type), prompt, run_kwargs, result_type, llm_attempt)
             
+            # Logfire is instrumented globally, just run the agent
+            async with get_gemini_rate_limiter().limit(estimate_tokens(prompt)) as permit:
+                llm_attempt.start()
+                result = await asyncio.wait_for(self.pydantic_agent.run(prompt, **run_kwargs), llm_attempt.timeout_seconds)
+                permit.record_usage(result.usage().total_tokens)
+            return result.data
+        
+        try:
             if result_type:
                 logger.info(f"Running Pydantic AI agent for structured output type: {result_type}")
-                # Create a specialized agent for this result type
-                agent = Agent(
-                    model=self.pydantic_agent.model,
-                    result_type=result_type,
-                    system_prompt=""
-                )
-                
-                # Logfire is instrumented globally, just run the agent
-                result = await agent.run(prompt, **run_kwargs)
-                logger.info(f"Pydantic AI call completed successfully, result type: {type(result.data)}")
+                try:
+                    output = await latency_tracker.run(call_type, timeout_seconds, run_once)
+                except (ValidationError, UnexpectedModelBehavior) as e:
+                    if not reprompt:
+                        raise
+                    # The re-prompt is a latency sample of its own and is not hedged
+                    logger.warning(f"Structured output could not be repaired locally, re-prompting once: {e}")
+                    self._json_repair_metrics.record_reprompt()
+                    output = await latency_tracker.run(call_type, timeout_seconds, run_once, hedge=False)
+                logger.info(f"Pydantic AI call completed successfully, result type: {type(output)}")
+                await self._cache_response_async(cache, cache_key, output, result_type, time.time() - start_time)
                 logger.info("EXIT: generate_text_async completed successfully with structured output")
-                return result.data
+                return output
             else:
                 logger.info("Running Pydantic AI agent for string output")
-                
-                # Logfire is instrumented globally, just run the agent
-                result = await self.pydantic_agent.run(prompt, **run_kwargs)
-                logger.info(f"Pydantic AI call completed successfully, response length: {len(result.data) if result.data else 0}")
+                output = await latency_tracker.run(call_type, timeout_seconds, run_once)
+                logger.info(f"Pydantic AI call completed successfully, response length: {len(output) if output else 0}")
+                await self._cache_response_async(cache, cache_key, output, result_type, time.time() - start_time)
                 logger.info("EXIT: generate_text_async completed successfully with string output")
-                return result.data
+                return output
                     
         except asyncio.TimeoutError as e:
-            logger.error(f"Pydantic AI call timed out after {timeout_seconds} seconds")
+            logger.error(f"Pydantic AI call timed out after {round(effective_timeout, 1):g} seconds")
             logger.info("EXIT: generate_text_async with timeout")
-            raise TimeoutError(f"Gemini API timeout: API call timed out after {timeout_seconds} seconds") from e
+            raise TimeoutError(f"Gemini API timeout: API call timed out after {round(effective_timeout, 1):g} seconds") from e
             
         except ValidationError as e:
             logger.error(f"Pydantic validation error: {e}", exc_info=True)
@@ -242,6 +413,7 @@ class GeminiService:
             logger.info("EXIT: generate_text_async with retry exhausted")
             # Map to appropriate exception based on the underlying cause
             if "rate limit" in str(e).lower() or "quota" in str(e).lower():
+                get_gemini_rate_limiter().report_rate_limited()
                 raise ResourceExhausted(str(e)) from e
             elif "timeout" in str(e).lower() or "deadline" in str(e).lower():
                 raise DeadlineExceeded(str(e)) from e
@@ -253,6 +425,7 @@ class GeminiService:
             error_message = str(e).lower()
             if "rate limit" in error_message or "quota" in error_message:
                 logger.error(f"Rate limit/quota error: {e}", exc_info=True)
+                get_gemini_rate_limiter().report_rate_limited()
                 raise ResourceExhausted(str(e)) from e
             elif "timeout" in str(e).lower():
                 logger.error(f"Timeout error: {e}", exc_info=True)
@@ -266,10 +439,197 @@ class GeminiService:
                 logger.info("EXIT: generate_text_async with exception")
                 raise RuntimeError(f"Failed to generate text due to an unexpected error: {e}") from e
 
-    async def analyze_source_text_async(self, source_text: str, analysis_instructions: str = None) -> SourceAnalysis:
+    async def generate_text_stream_async(
+        self,
+        prompt: str,
+        result_type: type,
+        timeout_seconds: int = 180,
+        priority: Optional[CallPriority] = None
+    ) -> AsyncIterator[Any]:
+        """
+        Streaming mode of generate_text_async for structured output.
+        
+        Yields partially validated result_type instances as the model writes its JSON;
+        the last value yielded is the complete result. Strings in the last item of a
+        partial list may still be cut off. A final response that fails validation is
+        repaired locally like in generate_text_async. priority overrides the
+        rate limiter priority of the current context.
+        
+        Raises:
+            ValueError: If the prompt is empty
+            ValidationError: If the final output is invalid and cannot be repaired
+        """
+        if not prompt:
+            logger.error("Prompt cannot be empty.")
+            raise ValueError("Prompt cannot be empty.")
+        
+        # Don't spend quota on calls for a podcast task that was cancelled
+        raise_if_cancelled()
+        
+        cache, cache_key, hit, cached_output = await self._lookup_cached_response_async(prompt, result_type)
+        if hit:
+            yield cached_output
+            return
+        start_time = time.time()
+        
+        # Streamed calls cannot be hedged, but share the adaptive overall deadline of generate_text_async
+        latency_tracker = get_llm_latency_tracker()
+        call_type = f"stream/{getattr(result_type, '__name__', 'text')}/{timeout_seconds}s"
+        effective_timeout = latency_tracker.timeout_for(call_type, timeout_seconds)
+        
+        agent = self._get_agent(result_type)
+        output = None
+        logger.info(f"Streaming Pydantic AI agent output for structured type: {result_type}")
+        async with AsyncExitStack() as stack:
+            permit = await stack.enter_async_context(
+                get_gemini_rate_limiter().limit(estimate_tokens(prompt), priority)
+            )
+            # The deadline covers the whole response, not each chunk
+            loop = asyncio.get_running_loop()
+            stream_started_at = loop.time()
+            deadline = stream_started_at + effective_timeout
+            try:
+                async with asyncio.timeout_at(deadline):
+                    streamed_result = await stack.enter_async_context(agent.run_stream(
+                        prompt, message_history=[], model_settings={'timeout': effective_timeout}
+                    ))
+                messages = streamed_result.stream_structured(debounce_by=None)
+                while True:
+                    async with asyncio.timeout_at(deadline):
+                        item = await anext(messages, None)
+                    if item is None:
+                        break
+                    message, is_last = item
+                    try:
+                        output = await streamed_result.validate_structured_output(message, allow_partial=not is_last)
+                    except ValidationError:
+                        if not is_last:
+                            # Not enough of the JSON has arrived yet to form a partial result
+                            continue
+                        output = self._repair_structured_output(self._raw_output_from_messages([message]), result_type)
+                        if output is None:
+                            raise
+                    yield output
+            except TimeoutError as e:
+                latency_tracker.record_call(call_type, effective_timeout, timed_out=True)
+                logger.error(f"Pydantic AI stream timed out after {round(effective_timeout, 1):g} seconds")
+                raise TimeoutError(f"Gemini API timeout: stream did not finish within {round(effective_timeout, 1):g} seconds") from e
+            permit.record_usage(streamed_result.usage().total_tokens)
+            latency_tracker.record_call(call_type, loop.time() - stream_started_at)
+        
+        logger.info(f"Pydantic AI stream completed in {time.time() - start_time:.1f}s")
+        await self._cache_response_async(cache, cache_key, output, result_type, time.time() - start_time)
+
+    @staticmethod
+    def _source_context_key(source_text: str) -> str:
+        return hashlib.sha256(source_text.encode("utf-8")).hexdigest()
+
+    async def _get_source_context_async(self, source_text: str) -> Optional[Any]:
+        """
+        Get the cached context holding source_text, creating it on first use.
+        
+        Concurrent callers with the same source text share one creation request.
+        Returns None when source context caching is disabled, the text is too
+        short to be worth caching, or the context could not be created.
+        """
+        config = get_config()
+        if not config.llm_source_context_caching or len(source_text) < config.llm_source_context_min_chars:
+            return None
+        
+        key = self._source_context_key(source_text)
+        creation = self._source_contexts.get(key)
+        if creation is None:
+            creation = asyncio.ensure_future(self.source_context_cache.create_async(
+                self.model_name, source_text, config.llm_source_context_ttl_seconds
+            ))
+            self._source_contexts[key] = creation
+        try:
+            # Shielded so one cancelled caller does not abort creation for the others
+            return await asyncio.shield(creation)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # The failed creation stays registered so later calls fall back immediately
+            logger.warning(f"Source context caching unavailable, sending source text inline: {e}")
+            return None
+
+    async def release_source_context_async(self, source_text: str) -> None:
+        """Delete the cached context for source_text once analysis and persona research are done."""
+        creation = self._source_contexts.pop(self._source_context_key(source_text), None)
+        if creation is None:
+            return
+        try:
+            handle = await creation
+            await self.source_context_cache.delete_async(handle)
+        except Exception as e:
+            # The context expires on its own after its TTL
+            logger.warning(f"Failed to delete cached source context: {e}")
+
+    async def _generate_with_source_context_async(
+        self,
+        source_text: str,
+        inline_prompt: str,
+        cached_prompt: str,
+        result_type: Optional[type],
+        timeout_seconds: int,
+        context_text: Optional[str] = None
+    ) -> Any:
+        """
+        Run a prompt that embeds source_text, referencing the cached source context when available.
+        
+        inline_prompt embeds the full source text; cached_prompt is the same prompt
+        with the text replaced by SOURCE_CONTEXT_REFERENCE. Falls back to
+        inline_prompt when caching is unavailable or the cached call fails.
+        context_text selects a larger cached context that contains source_text,
+        in which case cached_prompt must say which part of it to use.
+        """
+        source_context = await self._get_source_context_async(context_text or source_text)
+        if source_context is None:
+            return await self.generate_text_async(inline_prompt, timeout_seconds=timeout_seconds, result_type=result_type)
+        
+        # Responses are cached under the inline prompt so both paths share entries
+        cache, cache_key, hit, cached_output = await self._lookup_cached_response_async(inline_prompt, result_type)
+        if hit:
+            return cached_output
+        
+        raise_if_cancelled()
+        start_time = time.time()
+        try:
+            # Cached context tokens still count towards the token budget
+            async with get_gemini_rate_limiter().limit(estimate_tokens(inline_prompt)):
+                output = await self.source_context_cache.generate_async(
+                    source_context, cached_prompt, result_type, timeout_seconds
+                )
+        except StructuredOutputError as e:
+            output = self._repair_structured_output(e.raw_output, result_type)
+            if output is None:
+                logger.warning(f"Call against cached source context failed, retrying with inline source text: {e}")
+                # The inline call is the re-prompt, so it must not re-prompt again
+                self._json_repair_metrics.record_reprompt()
+                return await self.generate_text_async(
+                    inline_prompt, timeout_seconds=timeout_seconds, result_type=result_type, reprompt=False
+                )
+        except Exception as e:
+            logger.warning(f"Call against cached source context failed, retrying with inline source text: {e}")
+            return await self.generate_text_async(inline_prompt, timeout_seconds=timeout_seconds, result_type=result_type)
+        logger.info(f"Generated {result_type or 'string'} output against cached source context")
+        await self._cache_response_async(cache, cache_key, output, result_type, time.time() - start_time)
+        return output
+
+    async def analyze_source_text_async(
+        self,
+        source_text: str,
+        analysis_instructions: str = None,
+        context_text: Optional[str] = None,
+        context_reference: str = SOURCE_CONTEXT_REFERENCE
+    ) -> SourceAnalysis:
         """
         Analyzes the provided source text using the LLM.
         Allows for custom analysis instructions.
+        
+        context_text is an optional larger text containing source_text (the
+        combined text of all sources) whose cached context is shared with
+        persona research; context_reference then identifies source_text within it.
         """
         logger.info("ENTRY: analyze_source_text_async method called")
         logger.info(f"Source text length: {len(source_text) if source_text else 0} characters")
@@ -281,17 +641,32 @@ class GeminiService:
 
             if analysis_instructions:
                 logger.info(f"Using custom analysis instructions: {analysis_instructions[:100]}...")
-                prompt = f"{analysis_instructions}\n\nAnalyze the following text:\n\n---\n{source_text}\n---"
             else:
                 logger.info("Using default analysis prompt template, expecting JSON output for SourceAnalysis model")
+
+            def build_prompt(text: str) -> str:
+                if analysis_instructions:
+                    return f"{analysis_instructions}\n\nAnalyze the following text:\n\n---\n{text}\n---"
                 # Default analysis prompt, expecting JSON output
-                prompt = SOURCE_ANALYSIS_TEMPLATE.format(source_text=source_text)
+                return SOURCE_ANALYSIS_TEMPLATE.format(source_text=text)
             
             logger.info("Calling generate_text_async with text analysis prompt")
             
+            # Long documents are analyzed chunk by chunk and the partial analyses merged
+            chunk_chars = get_config().source_analysis_chunk_chars
+            if chunk_chars and len(source_text) > chunk_chars:
+                return await self._analyze_source_text_chunked_async(source_text, build_prompt, chunk_chars)
+            
             # Use Pydantic AI for structured SourceAnalysis output
             logger.info("Using Pydantic AI for structured SourceAnalysis output")
-            return await self.generate_text_async(prompt, timeout_seconds=180, result_type=SourceAnalysis)
+            return await self._generate_with_source_context_async(
+                source_text,
+                inline_prompt=build_prompt(source_text),
+                cached_prompt=build_prompt(context_reference),
+                result_type=SourceAnalysis,
+                timeout_seconds=180,
+                context_text=context_text
+            )
             
         except ValueError as ve:
             logger.error(f"ValueError in analyze_source_text_async: {ve}")
@@ -304,6 +679,102 @@ class GeminiService:
         finally:
             logger.info("EXIT: analyze_source_text_async method complete")
 
+    @staticmethod
+    def _split_source_text(source_text: str, max_chars: int) -> List[str]:
+        """
+        Split text into chunks of at most max_chars characters.
+        Chunks end at paragraph boundaries where possible, then at sentence
+        boundaries, and only split between words inside overly long sentences.
+        """
+        def pack(parts: List[str], joiner: str) -> List[str]:
+            packed: List[str] = []
+            current = ""
+            for part in parts:
+                candidate = f"{current}{joiner}{part}" if current else part
+                if current and len(candidate) > max_chars:
+                    packed.append(current)
+                    current = part
+                else:
+                    current = candidate
+            if current:
+                packed.append(current)
+            return packed
+
+        pieces: List[str] = []
+        for paragraph in re.split(r"\n\s*\n", source_text):
+            paragraph = paragraph.strip()
+            if not paragraph:
+                continue
+            if len(paragraph) <= max_chars:
+                pieces.append(paragraph)
+                continue
+            sentences: List[str] = []
+            for sentence in re.split(r"(?<=[.!?])\s+", paragraph):
+                if len(sentence) > max_chars:
+                    sentences.extend(pack(sentence.split(), " "))
+                else:
+                    sentences.append(sentence)
+            pieces.extend(pack(sentences, " "))
+        return pack(pieces, "\n\n")
+
+    async def _analyze_source_text_chunked_async(
+        self,
+        source_text: str,
+        build_prompt: Callable[[str], str],
+        chunk_chars: int
+    ) -> SourceAnalysis:
+        """
+        Map-reduce source analysis for long documents.
+        
+        Chunks are analyzed concurrently (up to SOURCE_ANALYSIS_MAX_CONCURRENCY)
+        into partial SourceAnalysis objects, which a final LLM call merges. Failed
+        chunks are skipped; if the merge call fails the partials are concatenated.
+        """
+        chunks = self._split_source_text(source_text, chunk_chars)
+        logger.info(f"Source text of {len(source_text)} characters split into {len(chunks)} chunks for analysis")
+        semaphore = asyncio.Semaphore(get_config().source_analysis_max_concurrency)
+
+        async def analyze_chunk(index: int, chunk: str) -> SourceAnalysis:
+            async with semaphore:
+                logger.info(f"Analyzing source chunk {index + 1}/{len(chunks)} ({len(chunk)} characters)")
+                # Bulk chunk calls of one long document should not crowd out other tasks
+                with call_priority(CallPriority.LOW):
+                    return await self.generate_text_async(build_prompt(chunk), timeout_seconds=180, result_type=SourceAnalysis)
+
+        results = await asyncio.gather(
+            *(analyze_chunk(index, chunk) for index, chunk in enumerate(chunks)),
+            return_exceptions=True
+        )
+        partials: List[SourceAnalysis] = []
+        for index, result in enumerate(results):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, BaseException):
+                logger.warning(f"Analysis of source chunk {index + 1}/{len(chunks)} failed: {result}")
+            else:
+                partials.append(result)
+
+        if not partials:
+            raise LLMProcessingError(f"Source analysis failed for all {len(chunks)} chunks")
+        if len(partials) == 1:
+            return partials[0]
+
+        partial_analyses = "\n\n".join(
+            f"Part {index + 1}:\n{partial.model_dump_json(indent=2)}" for index, partial in enumerate(partials)
+        )
+        try:
+            return await self.generate_text_async(
+                SOURCE_ANALYSIS_REDUCE_TEMPLATE.format(chunk_count=len(partials), partial_analyses=partial_analyses),
+                timeout_seconds=180,
+                result_type=SourceAnalysis
+            )
+        except Exception as e:
+            logger.warning(f"Merging {len(partials)} partial source analyses failed, concatenating them instead: {e}")
+            return SourceAnalysis(
+                summary_points=[point for partial in partials for point in partial.summary_points],
+                detailed_analysis="\n\n".join(partial.detailed_analysis for partial in partials)
+            )
+
     def _clean_keys_recursive(self, obj):
         # logger.debug(f"_clean_keys_recursive processing type: {type(obj)}")
         if isinstance(obj, dict):
@@ -370,19 +841,27 @@ class GeminiService:
 
         # We'll use the global name and voice profile lists defined at the top of the file
 
-        prompt = PERSONA_RESEARCH_TEMPLATE.format(
-            person_name=person_name,
-            person_id=person_id,
-            person_name_upper=person_name.upper(),
-            source_text=source_text
-        )
+        def build_prompt(text: str) -> str:
+            return PERSONA_RESEARCH_TEMPLATE.format(
+                person_name=person_name,
+                person_id=person_id,
+                person_name_upper=person_name.upper(),
+                source_text=text
+            )
+        prompt = build_prompt(source_text)
         
         logger.info(f"Generating persona research for '{person_name}' with prompt (first 200 chars): {prompt[:200]}...")
         
         try:
             # Use Pydantic AI for structured PersonaResearch output
             logger.info(f"Using Pydantic AI for structured PersonaResearch output for '{person_name}'")
-            persona_research = await self.generate_text_async(prompt, result_type=PersonaResearch, timeout_seconds=420)
+            persona_research = await self._generate_with_source_context_async(
+                source_text,
+                inline_prompt=prompt,
+                cached_prompt=build_prompt(SOURCE_CONTEXT_REFERENCE),
+                result_type=PersonaResearch,
+                timeout_seconds=420
+            )
             # Convert to dict for the existing post-processing logic
             parsed_json = persona_research.model_dump()
             logger.info(f"Successfully received structured PersonaResearch for '{person_name}'")
@@ -879,16 +1358,6 @@ Now create the podcast outline following both the custom instructions and the JS
             final_prompt = prd_outline_prompt_template.format(**format_dict)
             logger.debug(f"Final prompt for outline generation: {final_prompt[:500]}...")
             
-            # Use extended timeout (360s) for podcast outline generation as it's a complex prompt
-            raw_response_text = await self.generate_text_async(final_prompt, timeout_seconds=360)
-            
-            # Attempt to strip markdown fences if present
-            cleaned_response_text = raw_response_text.strip()
-            if cleaned_response_text.startswith("```json") and cleaned_response_text.endswith("```"):
-                cleaned_response_text = cleaned_response_text[7:-3].strip()
-            elif cleaned_response_text.startswith("```") and cleaned_response_text.endswith("```"):
-                cleaned_response_text = cleaned_response_text[3:-3].strip()
-
             try:
                 # Parse the desired duration to seconds for time distribution validation
                 total_duration_seconds = self._parse_duration_to_seconds(desired_podcast_length_str)
@@ -896,45 +1365,19 @@ Now create the podcast outline following both the custom instructions and the JS
                 
                 # Use Pydantic AI for structured PodcastOutline output
                 logger.info("Using Pydantic AI for structured PodcastOutline output")
-                podcast_outline = await self.generate_text_async(
-                    final_prompt, 
-                    result_type=PodcastOutline,
-                    timeout_seconds=360
-                )
+                # Every later stage waits for the outline, so it goes ahead of other tasks' calls
+                with call_priority(CallPriority.HIGH):
+                    podcast_outline = await self.generate_text_async(
+                        final_prompt, 
+                        result_type=PodcastOutline,
+                        timeout_seconds=360
+                    )
                 logger.info(f"Successfully generated podcast outline: {podcast_outline.title_suggestion}")
                 
             except ValidationError as e:
+                # generate_text_async already repaired locally and re-prompted once
                 logger.error(f"Structured output validation failed: {e.errors()}")
-                logger.info("Falling back to JSON parsing method")
-                
-                # Fallback to JSON parsing
-                try:
-                    json_response = await self.generate_text_async(final_prompt, timeout_seconds=360)
-                    
-                    # Clean markdown fences if present
-                    cleaned_response_text = json_response.strip()
-                    if cleaned_response_text.startswith("```json") and cleaned_response_text.endswith("```"):
-                        cleaned_response_text = cleaned_response_text[7:-3].strip()
-                    elif cleaned_response_text.startswith("```") and cleaned_response_text.endswith("```"):
-                        cleaned_response_text = cleaned_response_text[3:-3].strip()
-                    
-                    # Clean keys before parsing, as Gemini sometimes adds extra spaces
-                    parsed_json_dict = json.loads(cleaned_response_text)
-                    parsed_json_dict = self._clean_keys_recursive(parsed_json_dict) 
-                    
-                    # Create the podcast outline from JSON fallback
-                    podcast_outline = PodcastOutline(**parsed_json_dict)
-                    logger.info(f"Fallback JSON parsing successful: {podcast_outline.title_suggestion}")
-                    
-                except json.JSONDecodeError as json_e:
-                    logger.error(f"JSON fallback failed. Error: {json_e}. Raw response: '{cleaned_response_text[:500]}...'", exc_info=True)
-                    raise LLMProcessingError(f"Both Pydantic AI and JSON parsing failed for podcast outline. Validation: {e}. JSON: {json_e}")
-                except ValidationError as val_e:
-                    logger.error(f"JSON fallback validation failed. Error: {val_e}. Raw response: '{cleaned_response_text[:500]}...'", exc_info=True)
-                    raise LLMProcessingError(f"Both Pydantic AI and JSON validation failed for podcast outline. Original: {e}. Fallback: {val_e}")
-                except Exception as fallback_e:
-                    logger.error(f"Unexpected error in JSON fallback. Error: {fallback_e}. Raw response: '{cleaned_response_text[:500]}...'", exc_info=True)
-                    raise LLMProcessingError(f"Pydantic AI failed and JSON fallback encountered unexpected error. Original: {e}. Fallback: {fallback_e}")
+                raise LLMProcessingError(f"Podcast outline failed validation after repair and re-prompt: {e}") from e
                     
             except Exception as e:
                 logger.error(f"Unexpected error during Pydantic AI outline generation: {e}", exc_info=True)
@@ -964,6 +1407,40 @@ Now create the podcast outline following both the custom instructions and the JS
         dialogue turns specific to that segment's content, maintaining the proper flow
         and timing across segments.
         """
+        all_dialogue_turns = []
+        async for segment_dialogue_turns in self.generate_dialogue_segments_async(
+            podcast_outline=podcast_outline,
+            source_analyses=source_analyses,
+            persona_research_docs=persona_research_docs,
+            persona_details_map=persona_details_map,
+            user_custom_prompt_for_dialogue=user_custom_prompt_for_dialogue
+        ):
+            all_dialogue_turns.extend(segment_dialogue_turns)
+        
+        # Validate and process the final dialogue turns
+        if not all_dialogue_turns:
+            logger.error("No dialogue turns were generated across all segments")
+            raise LLMProcessingError("Failed to generate any dialogue turns for the podcast")
+        
+        logger.info(f"Successfully generated {len(all_dialogue_turns)} total dialogue turns across all segments")
+        return all_dialogue_turns
+
+    async def generate_dialogue_segments_async(
+        self,
+        podcast_outline: PodcastOutline,
+        source_analyses: list[SourceAnalysis],
+        persona_research_docs: list[PersonaResearch],
+        persona_details_map: dict[str, dict[str, str]], # (person_id -> {invented_name, gender, real_name})
+        user_custom_prompt_for_dialogue: str = None
+    ) -> AsyncIterator[List[DialogueTurn]]:
+        """
+        Generates dialogue segment by segment, yielding each segment's turns as soon as
+        they are ready so callers can start downstream work (e.g. TTS) early.
+        
+        Turn ids are sequential across segments. A segment that produces no turns
+        yields a single fallback Host turn. With DIALOGUE_PARALLEL_SEGMENTS enabled
+        all segments are generated concurrently and still yielded in outline order.
+        """
         logger.info(f"Generating dialogue for podcast outline '{podcast_outline.title_suggestion}' with {len(podcast_outline.segments)} segments")
         
         # persona_details_map now directly provides person_id -> {invented_name, gender, real_name}
@@ -982,8 +1459,18 @@ Now create the podcast outline following both the custom instructions and the JS
         logger.info(f"Available persona speakers for dialogue prompt: {available_persona_speakers_str}")
         logger.info(f"Full persona_details_map for dialogue: {persona_details_map}")
 
+        if get_config().dialogue_parallel_segments and len(podcast_outline.segments) > 1:
+            async for segment_dialogue_turns in self._generate_dialogue_segments_parallel_async(
+                podcast_outline=podcast_outline,
+                source_analyses=source_analyses,
+                persona_research_docs=persona_research_docs,
+                persona_details_map=persona_details_map,
+                user_custom_prompt_for_dialogue=user_custom_prompt_for_dialogue
+            ):
+                yield segment_dialogue_turns
+            return
+
         # Process each segment and generate dialogue turns
-        all_dialogue_turns = []
         current_turn_id = 1
         
         # Simplified: Process all segments directly (expecting just one in V1)
@@ -1014,29 +1501,319 @@ Now create the podcast outline following both the custom instructions and the JS
                 # Update current_turn_id for the next segment
                 if segment_dialogue_turns:
                     current_turn_id = segment_dialogue_turns[-1].turn_id + 1
-                    all_dialogue_turns.extend(segment_dialogue_turns)
                     logger.info(f"Generated {len(segment_dialogue_turns)} dialogue turns for segment '{segment.segment_id}'")
+                    yield segment_dialogue_turns
                 else:
                     logger.warning(f"No dialogue turns generated for segment '{segment.segment_id}'. Using fallback approach.")
-                    # Fallback: generate a simple host line for this segment
-                    fallback_turn = DialogueTurn(
-                        turn_id=current_turn_id,
-                        speaker_id="Host",
-                        speaker_gender=persona_details_map.get("Host", {}).get("gender", "male"),
-                        text=f"Let's talk about {segment.content_cue}",
-                        source_mentions=[]
-                    )
-                    all_dialogue_turns.append(fallback_turn)
+                    fallback_turn = self._build_fallback_segment_turn(segment, current_turn_id, persona_details_map)
                     current_turn_id += 1
+                    yield [fallback_turn]
+
+    @staticmethod
+    def _build_fallback_segment_turn(
+        segment: OutlineSegment,
+        turn_id: int,
+        persona_details_map: dict[str, dict[str, str]]
+    ) -> DialogueTurn:
+        """Build a simple Host line standing in for a segment whose dialogue generation failed."""
+        return DialogueTurn(
+            turn_id=turn_id,
+            speaker_id="Host",
+            speaker_gender=persona_details_map.get("Host", {}).get("gender", "male"),
+            text=f"Let's talk about {segment.content_cue}",
+            source_mentions=[]
+        )
+
+    @staticmethod
+    def _build_segment_continuity_guidance(podcast_outline: PodcastOutline, segment_index: int) -> str:
+        """
+        Describe a segment's position and neighbouring segments for prompts generated without
+        the preceding dialogue.
+        """
+        segments = podcast_outline.segments
+        lines = [f"Position in Podcast: segment {segment_index + 1} of {len(segments)}."]
+        if segment_index > 0:
+            previous_segment = segments[segment_index - 1]
+            lines.append(f"- Previous segment: {previous_segment.segment_title or previous_segment.segment_id} ({previous_segment.content_cue})")
+        else:
+            lines.append("- This is the opening segment: welcome the listeners and introduce the topic.")
+        if segment_index < len(segments) - 1:
+            next_segment = segments[segment_index + 1]
+            lines.append(f"- Next segment: {next_segment.segment_title or next_segment.segment_id} ({next_segment.content_cue})")
+        else:
+            lines.append("- This is the closing segment: wrap up the discussion and sign off.")
+        lines.append(
+            "The other segments are written separately. Pick up naturally where the previous segment leaves off, "
+            "and do not greet the listeners, re-introduce the speakers or sign off unless this is the opening or closing segment."
+        )
+        return "\n".join(lines)
+
+    async def _generate_dialogue_segments_parallel_async(
+        self,
+        podcast_outline: PodcastOutline,
+        source_analyses: list[SourceAnalysis],
+        persona_research_docs: list[PersonaResearch],
+        persona_details_map: dict[str, dict[str, str]],
+        user_custom_prompt_for_dialogue: str = None
+    ) -> AsyncIterator[List[DialogueTurn]]:
+        """
+        Generate dialogue for all segments concurrently (up to DIALOGUE_MAX_CONCURRENCY).
         
-        # Validate and process the final dialogue turns
-        if not all_dialogue_turns:
-            logger.error("No dialogue turns were generated across all segments")
-            raise LLMProcessingError("Failed to generate any dialogue turns for the podcast")
+        Each prompt carries outline-level continuity context instead of the previous
+        segment's dialogue. Segments are yielded in outline order as soon as they and
+        all earlier segments are done, with turn ids renumbered across segments. With
+        DIALOGUE_TRANSITION_SMOOTHING enabled every segment is awaited first so the
+        turns at segment boundaries can be rewritten.
+        """
+        config = get_config()
+        segments = podcast_outline.segments
+        semaphore = asyncio.Semaphore(config.dialogue_max_concurrency)
+        logger.info(f"Generating dialogue for {len(segments)} segments in parallel (max {config.dialogue_max_concurrency} at once)")
+
+        async def generate_segment(index: int, segment: OutlineSegment) -> List[DialogueTurn]:
+            async with semaphore:
+                logger.info(f"Generating dialogue for segment '{segment.segment_id}': '{segment.segment_title}'")
+                segment_dialogue_prompt = self._build_segment_dialogue_prompt(
+                    segment=segment,
+                    podcast_outline=podcast_outline,
+                    source_analyses=source_analyses,
+                    persona_research_docs=persona_research_docs,
+                    persona_details_map=persona_details_map,
+                    user_provided_custom_prompt=user_custom_prompt_for_dialogue,
+                    continuity_guidance=self._build_segment_continuity_guidance(podcast_outline, index)
+                )
+                segment_dialogue_turns = await self._generate_segment_dialogue(
+                    segment=segment,
+                    segment_dialogue_prompt=segment_dialogue_prompt,
+                    current_turn_id=1,
+                    persona_details_map=persona_details_map
+                )
+            if not segment_dialogue_turns:
+                logger.warning(f"No dialogue turns generated for segment '{segment.segment_id}'. Using fallback approach.")
+                return [self._build_fallback_segment_turn(segment, 1, persona_details_map)]
+            logger.info(f"Generated {len(segment_dialogue_turns)} dialogue turns for segment '{segment.segment_id}'")
+            return segment_dialogue_turns
+
+        segment_tasks = [asyncio.ensure_future(generate_segment(index, segment)) for index, segment in enumerate(segments)]
+        try:
+            smoothed_segment_turns = None
+            if config.dialogue_transition_smoothing:
+                smoothed_segment_turns = await self._smooth_segment_transitions_async(
+                    podcast_outline, list(await asyncio.gather(*segment_tasks))
+                )
+
+            current_turn_id = 1
+            for index, task in enumerate(segment_tasks):
+                turns = smoothed_segment_turns[index] if smoothed_segment_turns else await task
+                renumbered_turns = [
+                    turn.model_copy(update={"turn_id": current_turn_id + i}) for i, turn in enumerate(turns)
+                ]
+                current_turn_id += len(renumbered_turns)
+                yield renumbered_turns
+        finally:
+            # Stop outstanding segments if the consumer stops early or fails
+            for task in segment_tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def _smooth_segment_transitions_async(
+        self,
+        podcast_outline: PodcastOutline,
+        segment_turns: List[List[DialogueTurn]]
+    ) -> List[List[DialogueTurn]]:
+        """
+        Rewrite the last turn of each segment and the first turn of the next with one
+        small LLM call per boundary, all boundaries at once.
         
-        logger.info(f"Successfully generated {len(all_dialogue_turns)} total dialogue turns across all segments")
-        return all_dialogue_turns
+        A boundary is left unchanged if its call fails or changes the speakers. Boundaries
+        next to a single-turn middle segment are skipped so no turn is rewritten twice.
+        """
+        segments = podcast_outline.segments
+        boundaries = [
+            index for index in range(len(segment_turns) - 1)
+            if segment_turns[index] and segment_turns[index + 1]
+            and (index == 0 or len(segment_turns[index]) > 1)
+        ]
+
+        async def smooth_boundary(index: int) -> Optional[PodcastDialogue]:
+            boundary_turns = [segment_turns[index][-1], segment_turns[index + 1][0]]
+            prompt = DIALOGUE_TRANSITION_TEMPLATE.format(
+                podcast_title=podcast_outline.title_suggestion,
+                previous_segment_title=segments[index].segment_title or segments[index].segment_id,
+                next_segment_title=segments[index + 1].segment_title or segments[index + 1].segment_id,
+                boundary_turns=json.dumps([turn.model_dump(mode="json") for turn in boundary_turns], indent=2)
+            )
+            return await self.generate_text_async(prompt, timeout_seconds=60, result_type=PodcastDialogue)
+
+        results = await asyncio.gather(*(smooth_boundary(index) for index in boundaries), return_exceptions=True)
+        smoothed = [list(turns) for turns in segment_turns]
+        smoothed_count = 0
+        for index, result in zip(boundaries, results):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, BaseException):
+                logger.warning(f"Smoothing transition after segment {index + 1} failed, keeping original turns: {result}")
+                continue
+            previous_turn, next_turn = smoothed[index][-1], smoothed[index + 1][0]
+            rewritten = result.turns if result else []
+            if [turn.speaker_id for turn in rewritten] != [previous_turn.speaker_id, next_turn.speaker_id]:
+                logger.warning(f"Smoothed transition after segment {index + 1} changed the speakers, keeping original turns")
+                continue
+            smoothed[index][-1] = previous_turn.model_copy(update={"text": rewritten[0].text})
+            smoothed[index + 1][0] = next_turn.model_copy(update={"text": rewritten[1].text})
+            smoothed_count += 1
+        logger.info(f"Smoothed {smoothed_count} of {len(segment_turns) - 1} segment transitions")
+        return smoothed
     
+    @staticmethod
+    def _finalize_dialogue_turn(
+        turn: DialogueTurn,
+        turn_id: int,
+        persona_details_map: dict[str, dict[str, str]]
+    ) -> DialogueTurn:
+        """Copy an LLM dialogue turn with its sequential turn_id and a speaker_gender for TTS."""
+        # Create a copy with updated turn_id
+        turn_data = turn.model_dump()
+        turn_data['turn_id'] = turn_id
+        
+        # Ensure speaker_gender is set
+        if not turn_data.get('speaker_gender') and 'speaker_id' in turn_data:
+            speaker_id_from_llm = turn_data['speaker_id']
+            # Look up in persona_details_map
+            speaker_info = persona_details_map.get(speaker_id_from_llm)
+            if speaker_info and 'gender' in speaker_info:
+                turn_data['speaker_gender'] = speaker_info['gender']
+            else:
+                # Fallback if speaker_id not in map or gender not specified
+                if speaker_id_from_llm.lower() == "host":
+                    turn_data['speaker_gender'] = "Male"  # Default Host gender
+                elif speaker_id_from_llm.lower() == "narrator":
+                    turn_data['speaker_gender'] = "Neutral"  # Default Narrator gender
+                else:
+                    logger.warning(f"Speaker ID '{speaker_id_from_llm}' not found in persona_details_map or gender missing. Defaulting to 'neutral'.")
+                    turn_data['speaker_gender'] = "neutral"
+        
+        return DialogueTurn(**turn_data)
+
+    async def generate_dialogue_turns_async(
+        self,
+        podcast_outline: PodcastOutline,
+        source_analyses: list[SourceAnalysis],
+        persona_research_docs: list[PersonaResearch],
+        persona_details_map: dict[str, dict[str, str]], # (person_id -> {invented_name, gender, real_name})
+        user_custom_prompt_for_dialogue: str = None,
+        warnings_list: Optional[List[str]] = None
+    ) -> AsyncIterator[Tuple[int, DialogueTurn, bool]]:
+        """
+        Generates dialogue one turn at a time for callers that process turns as they arrive.
+        
+        Yields (segment index, turn, whether it is the segment's last turn) in order. With
+        DIALOGUE_STREAM_TURNS enabled each segment's response is streamed and every turn
+        is yielded as soon as the model has started writing the next one; otherwise (and
+        with DIALOGUE_PARALLEL_SEGMENTS) the turns of each finished segment are yielded.
+        A segment cut short by a failed stream is noted in warnings_list, if given.
+        """
+        dialogue_kwargs = dict(
+            podcast_outline=podcast_outline,
+            source_analyses=source_analyses,
+            persona_research_docs=persona_research_docs,
+            persona_details_map=persona_details_map,
+            user_custom_prompt_for_dialogue=user_custom_prompt_for_dialogue
+        )
+        config = get_config()
+        if not config.dialogue_stream_turns or (config.dialogue_parallel_segments and len(podcast_outline.segments) > 1):
+            segment_index = 0
+            async for segment_dialogue_turns in self.generate_dialogue_segments_async(**dialogue_kwargs):
+                for i, turn in enumerate(segment_dialogue_turns):
+                    yield segment_index, turn, i == len(segment_dialogue_turns) - 1
+                segment_index += 1
+            return
+
+        logger.info(f"Streaming dialogue turns for {len(podcast_outline.segments)} segments")
+        current_turn_id = 1
+        for segment_index, segment in enumerate(podcast_outline.segments):
+            logger.info(f"Streaming dialogue for segment '{segment.segment_id}': '{segment.segment_title}'")
+            segment_dialogue_prompt = self._build_segment_dialogue_prompt(
+                segment=segment,
+                podcast_outline=podcast_outline,
+                source_analyses=source_analyses,
+                persona_research_docs=persona_research_docs,
+                persona_details_map=persona_details_map,
+                user_provided_custom_prompt=user_custom_prompt_for_dialogue
+            )
+            # Hold back each turn until the next one arrives so the last turn can be flagged
+            pending_turn: Optional[DialogueTurn] = None
+            async for turn in self._stream_segment_dialogue(
+                segment=segment,
+                segment_dialogue_prompt=segment_dialogue_prompt,
+                current_turn_id=current_turn_id,
+                persona_details_map=persona_details_map,
+                warnings_list=warnings_list
+            ):
+                if pending_turn is not None:
+                    yield segment_index, pending_turn, False
+                pending_turn = turn
+                current_turn_id = turn.turn_id + 1
+            if pending_turn is None:
+                logger.warning(f"No dialogue turns generated for segment '{segment.segment_id}'. Using fallback approach.")
+                pending_turn = self._build_fallback_segment_turn(segment, current_turn_id, persona_details_map)
+                current_turn_id += 1
+            yield segment_index, pending_turn, True
+
+    async def _stream_segment_dialogue(
+        self,
+        segment: OutlineSegment,
+        segment_dialogue_prompt: str,
+        current_turn_id: int,
+        persona_details_map: dict[str, dict[str, str]],
+        warnings_list: Optional[List[str]] = None
+    ) -> AsyncIterator[DialogueTurn]:
+        """
+        Stream dialogue turns for a segment as the model writes its PodcastDialogue JSON.
+        
+        A turn is complete once the model has started the next one (or the response has
+        ended), so turns are yielded one step behind the partial output. If the stream
+        fails before any turn was yielded, the segment is generated without streaming;
+        if it fails later, the turns already yielded are kept and a warning is added
+        to warnings_list, if given.
+        """
+        yielded = 0
+        try:
+            final_dialogue = None
+            async for partial_dialogue in self.generate_text_stream_async(
+                segment_dialogue_prompt,
+                result_type=PodcastDialogue,
+                timeout_seconds=360,
+                priority=CallPriority.HIGH
+            ):
+                final_dialogue = partial_dialogue
+                # The last turn may still be cut off mid-text
+                while yielded < len(partial_dialogue.turns) - 1:
+                    yield self._finalize_dialogue_turn(
+                        partial_dialogue.turns[yielded], current_turn_id + yielded, persona_details_map
+                    )
+                    yielded += 1
+            for turn in (final_dialogue.turns[yielded:] if final_dialogue else []):
+                yield self._finalize_dialogue_turn(turn, current_turn_id + yielded, persona_details_map)
+                yielded += 1
+            logger.info(f"Streamed {yielded} dialogue turns for segment {segment.segment_id}")
+        except Exception as e:
+            if yielded:
+                logger.error(f"Dialogue stream for segment {segment.segment_id} failed after {yielded} turns, keeping them: {e}")
+                if warnings_list is not None:
+                    warnings_list.append(
+                        f"Dialogue for segment '{segment.segment_title}' was cut short after {yielded} turns: {e}"
+                    )
+                return
+            logger.warning(f"Dialogue stream for segment {segment.segment_id} failed, generating without streaming: {e}")
+            for turn in await self._generate_segment_dialogue(
+                segment=segment,
+                segment_dialogue_prompt=segment_dialogue_prompt,
+                current_turn_id=current_turn_id,
+                persona_details_map=persona_details_map
+            ):
+                yield turn
+
     async def _generate_segment_dialogue(self, 
                                       segment: OutlineSegment,
                                       segment_dialogue_prompt: str,
@@ -1049,109 +1826,29 @@ Now create the podcast outline following both the custom instructions and the JS
             logger.debug(f"Sending segment dialogue prompt for segment {segment.segment_id}")
             logger.info("Using Pydantic AI for structured PodcastDialogue output")
             
-            # Use Pydantic AI for structured PodcastDialogue output
-            dialogue_response = await self.generate_text_async(
-                segment_dialogue_prompt,
-                result_type=PodcastDialogue,
-                timeout_seconds=360
-            )
+            # Use Pydantic AI for structured PodcastDialogue output; dialogue feeds TTS
+            # directly, so it goes ahead of other tasks' calls
+            with call_priority(CallPriority.HIGH):
+                dialogue_response = await self.generate_text_async(
+                    segment_dialogue_prompt,
+                    result_type=PodcastDialogue,
+                    timeout_seconds=360
+                )
             
             logger.info(f"Successfully generated PodcastDialogue with {len(dialogue_response.turns)} turns for segment {segment.segment_id}")
             
             # Process turns: assign sequential turn_ids and ensure speaker_gender is set
-            processed_turns = []
-            for i, turn in enumerate(dialogue_response.turns):
-                # Create a copy with updated turn_id
-                turn_data = turn.model_dump()
-                turn_data['turn_id'] = current_turn_id + i
-                
-                # Ensure speaker_gender is set
-                if not turn_data.get('speaker_gender') and 'speaker_id' in turn_data:
-                    speaker_id_from_llm = turn_data['speaker_id']
-                    # Look up in persona_details_map
-                    speaker_info = persona_details_map.get(speaker_id_from_llm)
-                    if speaker_info and 'gender' in speaker_info:
-                        turn_data['speaker_gender'] = speaker_info['gender']
-                    else:
-                        # Fallback if speaker_id not in map or gender not specified
-                        if speaker_id_from_llm.lower() == "host":
-                            turn_data['speaker_gender'] = "Male"  # Default Host gender
-                        elif speaker_id_from_llm.lower() == "narrator":
-                            turn_data['speaker_gender'] = "Neutral"  # Default Narrator gender
-                        else:
-                            logger.warning(f"Speaker ID '{speaker_id_from_llm}' not found in persona_details_map or gender missing. Defaulting to 'neutral'.")
-                            turn_data['speaker_gender'] = "neutral"
-                
-                processed_turns.append(DialogueTurn(**turn_data))
+            processed_turns = [
+                self._finalize_dialogue_turn(turn, current_turn_id + i, persona_details_map)
+                for i, turn in enumerate(dialogue_response.turns)
+            ]
             
             return processed_turns
             
         except ValidationError as e:
+            # generate_text_async already repaired locally and re-prompted once
             logger.error(f"Dialogue generation validation failed for segment {segment.segment_id}: {e.errors()}")
-            logger.info("Falling back to JSON parsing method")
-            
-            # Fallback to JSON parsing
-            try:
-                json_response = await self.generate_text_async(segment_dialogue_prompt, timeout_seconds=360)
-                
-                # Clean the response
-                cleaned_response_text = json_response.strip()
-                if cleaned_response_text.startswith("```json") and cleaned_response_text.endswith("```"):
-                    cleaned_response_text = cleaned_response_text[7:-3].strip()
-                elif cleaned_response_text.startswith("```") and cleaned_response_text.endswith("```"):
-                    cleaned_response_text = cleaned_response_text[3:-3].strip()
-                
-                # Parse the response
-                parsed_json_list = json.loads(cleaned_response_text)
-                parsed_json_list = self._clean_keys_recursive(parsed_json_list)
-                
-                # Validate it's a list
-                if not isinstance(parsed_json_list, list):
-                    logger.error(f"LLM response for segment {segment.segment_id} dialogue was not a JSON list")
-                    return []
-                
-                # Create dialogue turns
-                dialogue_turns: List[DialogueTurn] = []
-                for i, item in enumerate(parsed_json_list):
-                    if not isinstance(item, dict):
-                        logger.error(f"Item {i} in dialogue list for segment {segment.segment_id} is not a dict")
-                        continue
-                    
-                    # Ensure the turn_id follows the sequence
-                    item['turn_id'] = current_turn_id + i
-                    
-                    # Add speaker gender if not present
-                    if 'speaker_gender' not in item and 'speaker_id' in item:
-                        speaker_id_from_llm = item['speaker_id']
-                        # Look up in persona_details_map
-                        speaker_info = persona_details_map.get(speaker_id_from_llm)
-                        if speaker_info and 'gender' in speaker_info:
-                            item['speaker_gender'] = speaker_info['gender']
-                        else:
-                            # Fallback if speaker_id not in map or gender not specified
-                            if speaker_id_from_llm.lower() == "host":
-                                item['speaker_gender'] = "Male"  # Default Host gender
-                            elif speaker_id_from_llm.lower() == "narrator":
-                                item['speaker_gender'] = "Neutral"  # Default Narrator gender
-                            else:
-                                logger.warning(f"Speaker ID '{speaker_id_from_llm}' not found in persona_details_map or gender missing. Defaulting to 'neutral'.")
-                                item['speaker_gender'] = "neutral"
-                    
-                    # Create the dialogue turn
-                    try:
-                        dialogue_turns.append(DialogueTurn(**item))
-                    except ValidationError as turn_e:
-                        logger.error(f"Failed to create DialogueTurn for item {i} in segment {segment.segment_id}: {turn_e}")
-                
-                logger.info(f"Fallback JSON parsing successful: {len(dialogue_turns)} turns for segment {segment.segment_id}")
-                return dialogue_turns
-                
-            except json.JSONDecodeError as json_e:
-                logger.error(f"JSON fallback failed for segment {segment.segment_id}: {json_e}")
-                return []
-            except Exception as fallback_e:
-                logger.error(f"Unexpected error in JSON fallback for segment {segment.segment_id}: {fallback_e}")
-                return []
+            return []
                 
         except Exception as e:
             logger.error(f"Unexpected error during Pydantic AI dialogue generation for segment {segment.segment_id}: {e}")
@@ -1163,7 +1860,8 @@ Now create the podcast outline following both the custom instructions and the JS
                                      source_analyses: list[SourceAnalysis],
                                      persona_research_docs: list[PersonaResearch],
                                      persona_details_map: dict[str, dict[str, str]],
-                                     user_provided_custom_prompt: Optional[str] = None) -> str:
+                                     user_provided_custom_prompt: Optional[str] = None,
+                                     continuity_guidance: str = "") -> str:
         """
         Build a prompt for generating dialogue specific to a segment of the podcast outline.
         """
@@ -1253,6 +1951,7 @@ Reference these sources appropriately in the dialogue. Be factual and accurate t
             target_word_count=target_word_count,
             persona_guidance=persona_guidance,
             source_guidance=source_guidance,
+            continuity_guidance=continuity_guidance,
             user_custom_prompt=user_custom_prompt
         )
 
@@ -1280,6 +1979,7 @@ Reference these sources appropriately in the dialogue. Be factual and accurate t
             logger.info("Falling back to JSON string generation")
             
             # Fallback to JSON string generation
+            self._json_repair_metrics.record_reprompt()
             try:
                 json_response = await self.generate_text_async(prompt, timeout_seconds)
                 logger.info(f"Fallback JSON generation successful, length: {len(json_response)}")
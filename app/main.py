@@ -9,6 +9,7 @@ from sqlalchemy import func
 from app.validations import is_valid_pdf
 from app.content_extractor import extract_text_from_pdf, ExtractionError
 from app.podcast_workflow import PodcastGeneratorService
+from app.tts_service import GoogleCloudTtsService
 from app.podcast_models import PodcastEpisode, PodcastStatus, PodcastRequest
 from app.status_manager import get_status_manager
 from app.task_runner import get_task_runner
@@ -86,6 +87,12 @@ async def startup_event():
     logger.info("Database tables initialized on startup")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close the async TTS clients, whose gRPC channels would otherwise stay open."""
+    await GoogleCloudTtsService.close_async_clients()
+
+
 @app.post("/process/pdf/", tags=["content"], summary="Extract Text from PDF")
 async def process_pdf_endpoint(pdf_file: UploadFile = File(...)):
     """
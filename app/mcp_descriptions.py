@@ -112,6 +112,32 @@ RETURNS: task_id for monitoring with get_task_status()
     Returns:
         Dict with status information and episode data when complete
     """,
+    "resume_podcast_generation": """
+    Resume a failed, cancelled or interrupted podcast generation task.
+
+    Completed stages (extraction, source analysis, persona research, outline,
+    dialogue) are restored from checkpoints instead of being regenerated, so
+    only the remaining work is redone.
+
+    Args:
+        task_id: The task ID returned by generate_podcast_async
+
+    Returns:
+        Dict with the task_id to monitor with get_task_status()
+    """,
+    "cancel_podcast_generation": """
+    Cancel a running podcast generation task.
+
+    Queued speech synthesis, LLM calls and uploads for the task are stopped and
+    its generation slot is freed within seconds. The task status becomes
+    "cancelled"; it can be continued later with resume_podcast_generation().
+
+    Args:
+        task_id: The task ID returned by generate_podcast_async
+
+    Returns:
+        Dict with the task_id and "cancelling" (stopping now) or "cancelled"
+    """,
 }
 
 RESOURCE_DESCRIPTIONS = {
@@ -209,7 +235,8 @@ EXAMPLE RESPONSE:
 
     "get_podcast_transcript_resource": """Get the full transcript of a completed podcast episode.
 
-📝 COMPLETION-REQUIRED RESOURCE - Only available after status="completed"
+📝 PREVIEW AVAILABLE - Published as soon as dialogue generation finishes
+(is_preview=true until status="completed")
 
 WHEN TO USE:
 - "Show me the transcript" (after completion)
@@ -236,7 +263,8 @@ USE CASES:
 
     "get_podcast_audio_resource": """Get audio file information for a completed podcast episode.
 
-🎵 COMPLETION-REQUIRED RESOURCE - Only available after status="completed"
+🎵 PREVIEW AVAILABLE - A partial MP3 of the leading turns grows during audio generation
+(is_preview=true until status="completed", then the final stitched audio)
 
 WHEN TO USE:
 - "Where's the audio file?" (after completion)
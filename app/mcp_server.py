@@ -6,6 +6,10 @@ from app.podcast_models import PodcastRequest, PodcastEpisode
 from app.status_manager import get_status_manager
 from app.task_runner import get_task_runner
 from app.tts_service import GoogleCloudTtsService
+from app.tts_cache import get_tts_synthesis_cache
+from app.llm_cache import get_llm_response_cache
+from app.llm_latency import get_llm_latency_tracker
+from app.llm_rate_limiter import get_gemini_rate_limiter
 from app.llm_service import GeminiService
 from app.config import setup_production_environment, get_config, get_server_config, get_health_status
 from fastmcp.prompts.prompt import Message
@@ -22,6 +26,7 @@ from pathlib import Path
 import logging
 import json
 import asyncio
+from contextlib import asynccontextmanager
 from app.mcp_descriptions import (
     PROMPT_DESCRIPTIONS,
     TOOL_DESCRIPTIONS,
@@ -56,6 +61,19 @@ mcp = FastMCP("MySalonCast Podcast Generator")
 # =============================================================================
 app = mcp.http_app(transport="sse")
 
+# Close the async TTS clients, whose gRPC channels would otherwise stay open, when the server stops
+_mcp_lifespan = app.router.lifespan_context
+
+
+@asynccontextmanager
+async def _lifespan(app):
+    async with _mcp_lifespan(app):
+        yield
+        await GoogleCloudTtsService.close_async_clients()
+
+
+app.router.lifespan_context = _lifespan
+
 # Add CORS middleware first (before OAuth middleware)
 from fastapi.middleware.cors import CORSMiddleware
 app.add_middleware(
@@ -245,6 +263,51 @@ async def get_task_status(ctx, task_id: str) -> dict:
             "error": f"Failed to get task status: {str(e)}"
         }
 
+# Resume a failed or interrupted task from its last completed stage
+@mcp.tool(description=TOOL_DESCRIPTIONS["resume_podcast_generation"])
+async def resume_podcast_generation(ctx, task_id: str) -> dict:
+    request_id, client_info = log_mcp_tool_call("resume_podcast_generation", ctx)
+    
+    if not task_id or not task_id.strip():
+        raise ToolError("task_id is required")
+    
+    try:
+        await podcast_service.resume_podcast_generation_async(task_id)
+    except ValueError as e:
+        raise ToolError(str(e))
+    except Exception as e:
+        logger.error(f"[{request_id}] Failed to resume podcast generation: {str(e)}")
+        raise ToolError(f"Failed to resume podcast generation: {str(e)}")
+    
+    return {
+        "task_id": task_id,
+        "status": "accepted",
+        "message": f"Podcast generation resumed for task: {task_id}"
+    }
+
+# Cancel a running task and release its worker slot
+@mcp.tool(description=TOOL_DESCRIPTIONS["cancel_podcast_generation"])
+async def cancel_podcast_generation(ctx, task_id: str) -> dict:
+    request_id, client_info = log_mcp_tool_call("cancel_podcast_generation", ctx)
+    
+    if not task_id or not task_id.strip():
+        raise ToolError("task_id is required")
+    
+    try:
+        was_running = await podcast_service.cancel_podcast_generation_async(task_id)
+    except ValueError as e:
+        raise ToolError(str(e))
+    except Exception as e:
+        logger.error(f"[{request_id}] Failed to cancel podcast generation: {str(e)}")
+        raise ToolError(f"Failed to cancel podcast generation: {str(e)}")
+    
+    return {
+        "task_id": task_id,
+        "status": "cancelling" if was_running else "cancelled",
+        "message": f"Cancellation requested for task: {task_id}" if was_running
+        else f"Task {task_id} was not running and has been marked cancelled"
+    }
+
 # =============================================================================
 # PHASE 4.4: Job Status and Podcast Resources
 # =============================================================================
@@ -297,7 +360,10 @@ async def get_podcast_transcript_resource(task_id: str) -> dict:
     
     try:
         status_info = await get_task_status_or_error(status_manager, task_id, require_episode=True)
-        return build_podcast_transcript_response(task_id, status_info.result_episode)
+        # Before completion the episode is a preview published once dialogue exists
+        return build_podcast_transcript_response(
+            task_id, status_info.result_episode, is_preview=status_info.status != "completed"
+        )
     except Exception as e:
         handle_resource_error(e, task_id, "retrieve podcast transcript")
 
@@ -307,7 +373,10 @@ async def get_podcast_audio_resource(task_id: str) -> dict:
     
     try:
         status_info = await get_task_status_or_error(status_manager, task_id, require_episode=True)
-        return build_podcast_audio_response(task_id, status_info.result_episode)
+        # Before completion the audio is a growing preview of the leading turns
+        return build_podcast_audio_response(
+            task_id, status_info.result_episode, is_preview=status_info.status != "completed"
+        )
     except Exception as e:
         handle_resource_error(e, task_id, "retrieve podcast audio")
 
@@ -895,6 +964,28 @@ async def health_check(request):
             health_status["status"] = "degraded"
             health_status["checks"]["services"] = "error"
         
+        # LLM response cache savings (only when LLM_CACHE_ENABLED)
+        llm_cache = get_llm_response_cache()
+        if llm_cache is not None:
+            health_status["llm_cache"] = llm_cache.metrics.get_metrics()
+        
+        # How often malformed structured LLM output was repaired without a second call
+        health_status["llm_json_repair"] = GeminiService.get_json_repair_metrics()
+        
+        # Shared Gemini rate limiter queueing and throttling
+        health_status["gemini_rate_limiter"] = get_gemini_rate_limiter().get_metrics()
+        
+        # LLM latency percentiles, adaptive timeouts and hedged requests per call type
+        health_status["llm_latency"] = get_llm_latency_tracker().get_metrics()
+        
+        # Speech synthesis concurrency and job timings
+        health_status["tts_service"] = GoogleCloudTtsService.get_current_metrics()
+        
+        # TTS synthesis cache savings (only when TTS_CACHE_ENABLED)
+        tts_cache = get_tts_synthesis_cache()
+        if tts_cache is not None:
+            health_status["tts_cache"] = tts_cache.get_metrics()
+        
         # Return appropriate status code
         status_code = 200 if health_status["status"] == "healthy" else 503
         return JSONResponse(health_status, status_code=status_code)
@@ -232,13 +232,14 @@ def handle_resource_error(e: Exception, task_id: str, operation: str):
         raise ToolError(f"Failed to {operation}: {error_str}")
 
 
-def build_podcast_transcript_response(task_id: str, episode) -> Dict[str, Any]:
+def build_podcast_transcript_response(task_id: str, episode, is_preview: bool = False) -> Dict[str, Any]:
     """
     Build a standardized podcast transcript response.
     
     Args:
         task_id: Task identifier
         episode: PodcastEpisode object
+        is_preview: Whether the episode is an in-progress preview
         
     Returns:
         Standardized podcast transcript response
@@ -249,17 +250,19 @@ def build_podcast_transcript_response(task_id: str, episode) -> Dict[str, Any]:
         "title": episode.title or "",
         "summary": episode.summary or "",
         "character_count": len(episode.transcript) if episode.transcript else 0,
+        "is_preview": is_preview,
         "resource_type": "podcast_transcript"
     }
 
 
-def build_podcast_audio_response(task_id: str, episode) -> Dict[str, Any]:
+def build_podcast_audio_response(task_id: str, episode, is_preview: bool = False) -> Dict[str, Any]:
     """
     Build a standardized podcast audio response.
     
     Args:
         task_id: Task identifier
         episode: PodcastEpisode object
+        is_preview: Whether the audio is a growing partial preview
         
     Returns:
         Standardized podcast audio response
@@ -274,6 +277,7 @@ def build_podcast_audio_response(task_id: str, episode) -> Dict[str, Any]:
         "audio_filepath": audio_filepath,
         "audio_exists": audio_exists,
         "file_size": os.path.getsize(audio_filepath) if audio_exists else 0,
+        "is_preview": is_preview,
         "resource_type": "podcast_audio"
     }
 
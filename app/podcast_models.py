@@ -1,8 +1,20 @@
+import hashlib
 import json
 from datetime import datetime
 from typing import Any, List, Literal, Optional
 from pydantic import BaseModel, Field
 
+def _file_digest(path: str) -> str:
+    """SHA-256 of a file's content, or the path itself if the file cannot be read."""
+    try:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+    except OSError:
+        return path
+
 class PodcastRequest(BaseModel):
     """Request model for podcast generation."""
     source_urls: Optional[List[str]] = None  # Support for multiple source URLs
@@ -20,6 +32,28 @@ class PodcastRequest(BaseModel):
         """Check if the request has at least one valid source."""
         return bool((self.source_urls and len(self.source_urls) > 0) or (self.source_pdf_path is not None))
 
+    def fingerprint(self) -> str:
+        """
+        Content hash of the request used to detect duplicate submissions.
+        Whitespace and case differences that cannot change the episode are normalized away.
+        A PDF source is hashed by content, so a new file uploaded to the same path is a new request.
+        """
+        def normalize_text(value: Optional[str]) -> Optional[str]:
+            return " ".join(value.split()) if value else None
+
+        normalized = {
+            "source_urls": [url.strip() for url in self.source_urls or []],
+            "source_pdf": _file_digest(self.source_pdf_path) if self.source_pdf_path else None,
+            "prominent_persons": [normalize_text(name).casefold() for name in self.prominent_persons or [] if name.strip()],
+            "desired_podcast_length_str": normalize_text(self.desired_podcast_length_str),
+            "custom_prompt_for_outline": normalize_text(self.custom_prompt_for_outline),
+            "host_invented_name": normalize_text(self.host_invented_name),
+            "host_gender": (self.host_gender or "").casefold() or None,
+            "custom_prompt_for_dialogue": normalize_text(self.custom_prompt_for_dialogue),
+            "webhook_url": self.webhook_url,
+        }
+        return hashlib.sha256(json.dumps(normalized, sort_keys=True).encode("utf-8")).hexdigest()
+
 class SourceAnalysis(BaseModel):
     """
     Simplified structured analysis of the source text.
@@ -186,6 +220,15 @@ class PodcastOutline(BaseModel):
         return "\n".join(lines)
 
 
+class TurnAudioSpan(BaseModel):
+    """
+    Where a dialogue turn's audio starts among the episode's dialogue turn audio files.
+    """
+    turn_id: int = Field(..., description="ID of the dialogue turn.")
+    audio_file_index: int = Field(..., description="Index into PodcastEpisode.dialogue_turn_audio_paths of the file holding this turn.")
+    offset_seconds: Optional[float] = Field(default=None, description="Start of the turn within that file, or None if the TTS API did not report it.")
+
+
 class PodcastEpisode(BaseModel):
     title: str
     summary: str
@@ -201,6 +244,8 @@ class PodcastEpisode(BaseModel):
     llm_dialogue_turns_path: Optional[str] = None
     llm_transcript_path: Optional[str] = None  # Path to transcript text file
     dialogue_turn_audio_paths: Optional[List[str]] = None  # Individual audio segment paths
+    # Start of each turn within dialogue_turn_audio_paths (set when several turns share a file)
+    dialogue_turn_audio_index: Optional[List[TurnAudioSpan]] = None
     
     def is_cloud_path(self, path: str) -> bool:
         """Check if a path is a cloud URL (GCS, HTTP, or HTTPS)."""
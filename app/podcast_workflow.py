@@ -1,5 +1,7 @@
 import asyncio
 import glob
+import hashlib
+import io
 import json
 import logging
 import os
@@ -10,15 +12,16 @@ import sys
 import tempfile
 import time
 import uuid
-from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from pydantic import ValidationError
 import aiohttp
 from .database import PodcastStatusDB
 from .common_exceptions import PodcastGenerationError
 from .status_manager import get_status_manager
 from .storage_utils import ensure_directory_exists
-from app.podcast_models import SourceAnalysis, PersonaResearch, OutlineSegment, DialogueTurn, PodcastOutline, PodcastEpisode, BaseModel, PodcastRequest, PodcastDialogue
+from app.podcast_models import SourceAnalysis, PersonaResearch, OutlineSegment, DialogueTurn, PodcastOutline, PodcastEpisode, TurnAudioSpan, BaseModel, PodcastRequest, PodcastDialogue, PodcastProgressStatus
 from app.common_exceptions import LLMProcessingError, ExtractionError
 from app.content_extractor import (
     extract_content_from_url, 
@@ -27,9 +30,12 @@ from app.content_extractor import (
 )
 from app.llm_service import GeminiService
 from app.tts_service import GoogleCloudTtsService
-from app.task_runner import get_task_runner
+from app.audio_store import InMemoryAudioStore, audio_exists, buffered_audio, current_audio_store, read_audio
+from app.task_runner import get_task_runner, raise_if_cancelled
 from app.storage import CloudStorageManager
-from app.config import setup_environment
+from app.config import setup_environment, get_config
+from app.prompts import SOURCE_ANALYSIS_TEMPLATE
+from app.source_context_cache import source_section_reference
 from app.http_utils import send_webhook_with_retry, build_webhook_payload
 from app.validations import is_valid_youtube_url
 from app.utils.migration_helpers import (
@@ -41,6 +47,217 @@ from app.utils.migration_helpers import (
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Workflow stages whose outputs are checkpointed, in execution order
+CHECKPOINT_STAGES = ("extraction", "source_analysis", "persona_research", "outline", "dialogue")
+
+@dataclass
+class WorkflowStage:
+    """
+    A node in the podcast generation stage graph.
+
+    ``run`` receives the outputs available so far, keyed by name, and returns a
+    dict holding every name listed in ``provides``. Each attempt is bounded by
+    ``timeout_seconds`` (if set) and failed attempts are retried up to
+    ``retries`` times with exponential backoff.
+    """
+    name: str
+    run: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]]
+    requires: Tuple[str, ...] = ()
+    provides: Tuple[str, ...] = ()
+    timeout_seconds: Optional[float] = None
+    retries: int = 0
+    retry_delay_seconds: float = 1.0
+
+
+class StageGraph:
+    """
+    Minimal DAG executor for workflow stages.
+
+    A stage starts as soon as everything it requires is available, so stages
+    with independent inputs run concurrently. The first stage to fail for good
+    cancels the stages still running and its error is re-raised.
+    """
+
+    def __init__(self, stages: List[WorkflowStage]):
+        self.stages: Dict[str, WorkflowStage] = {}
+        self._producers: Dict[str, str] = {}
+        for stage in stages:
+            if stage.name in self.stages:
+                raise ValueError(f"Duplicate stage name in workflow graph: {stage.name}")
+            self.stages[stage.name] = stage
+            for output in stage.provides:
+                if output in self._producers:
+                    raise ValueError(f"Output '{output}' provided by both '{self._producers[output]}' and '{stage.name}'")
+                self._producers[output] = stage.name
+
+    async def run(
+        self,
+        inputs: Dict[str, Any],
+        check_cancelled: Optional[Callable[[], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Run all stages and return the inputs merged with every stage output.
+
+        Args:
+            inputs: Values available before any stage runs
+            check_cancelled: Called before each stage attempt; raises to abort the run
+        """
+        results = dict(inputs)
+        unresolved = sorted({
+            name for stage in self.stages.values() for name in stage.requires
+            if name not in results and name not in self._producers
+        })
+        if unresolved:
+            raise ValueError(f"No stage provides required input(s): {unresolved}")
+
+        pending = dict(self.stages)
+        running: Dict[asyncio.Task, WorkflowStage] = {}
+        try:
+            while pending or running:
+                for stage in [s for s in pending.values() if all(name in results for name in s.requires)]:
+                    del pending[stage.name]
+                    logger.info(f"Starting workflow stage '{stage.name}'")
+                    running[asyncio.create_task(self._run_stage(stage, dict(results), check_cancelled))] = stage
+                if not running:
+                    raise ValueError(f"Workflow graph has a dependency cycle between: {sorted(pending)}")
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for finished in done:
+                    stage = running.pop(finished)
+                    outputs = finished.result()
+                    missing = [name for name in stage.provides if name not in outputs]
+                    if missing:
+                        raise PodcastGenerationError(f"Stage '{stage.name}' did not produce {missing}")
+                    results.update({name: outputs[name] for name in stage.provides})
+                    logger.info(f"Workflow stage '{stage.name}' complete")
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+        return results
+
+    async def _run_stage(
+        self,
+        stage: WorkflowStage,
+        available: Dict[str, Any],
+        check_cancelled: Optional[Callable[[], None]]
+    ) -> Dict[str, Any]:
+        """Run one stage with its timeout and retry policy."""
+        attempt = 0
+        while True:
+            if check_cancelled:
+                check_cancelled()
+            try:
+                if stage.timeout_seconds:
+                    return await asyncio.wait_for(stage.run(available), timeout=stage.timeout_seconds)
+                return await stage.run(available)
+            except Exception as e:
+                if attempt >= stage.retries:
+                    logger.error(f"Workflow stage '{stage.name}' failed after {attempt + 1} attempt(s): {e}")
+                    raise
+                delay = stage.retry_delay_seconds * (2 ** attempt)
+                attempt += 1
+                logger.warning(f"Workflow stage '{stage.name}' failed ({e!r}), retry {attempt}/{stage.retries} in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+
+class EpisodePreview:
+    """
+    In-progress episode published through StatusManager.set_episode before the task completes.
+
+    The transcript is published as soon as dialogue turns exist. Audio for the
+    leading run of synthesized turns is appended, in turn order, to a growing
+    MP3 (MP3 frames can be concatenated as-is) that is uploaded and republished
+    every ``publish_every_turns`` turns and once more by ``flush`` when the
+    audio stage ends. The final episode replaces the preview; ``discard``
+    removes it when the task fails or is cancelled.
+    """
+
+    def __init__(
+        self,
+        task_id: str,
+        base_episode: PodcastEpisode,
+        audio_path: str,
+        publish_every_turns: int,
+        storage_manager: Optional[CloudStorageManager] = None
+    ):
+        self.task_id = task_id
+        self.episode = base_episode.model_copy()
+        self.audio_path = audio_path
+        self.publish_every_turns = max(1, publish_every_turns)
+        self.storage_manager = storage_manager
+        self.turns_in_audio = 0
+        self._pending_turns: Dict[int, Optional[str]] = {}
+        self._next_turn = 0
+        self._unpublished_turns = 0
+        self._lock = asyncio.Lock()
+
+    def publish(self) -> None:
+        """Store the current preview as the task's episode."""
+        try:
+            get_status_manager().set_episode(self.task_id, self.episode)
+        except Exception as e:
+            logger.warning(f"Failed to publish episode preview for task {self.task_id}: {e}")
+
+    def discard(self) -> None:
+        """Remove the preview from the task, whose run did not complete."""
+        try:
+            get_status_manager().clear_episode(self.task_id)
+        except Exception as e:
+            logger.warning(f"Failed to discard episode preview for task {self.task_id}: {e}")
+
+    def update_transcript(self, turns: List[DialogueTurn]) -> None:
+        """Publish the transcript of the dialogue turns generated so far."""
+        self.episode.transcript = PodcastDialogue(turns=turns).to_transcript()
+        self.publish()
+
+    async def add_turn_audio(self, index: int, audio_path: Optional[str]) -> None:
+        """Record a finished turn (None if its TTS failed) and extend the preview audio."""
+        async with self._lock:
+            self._pending_turns[index] = audio_path
+            leading_paths: List[str] = []
+            while self._next_turn in self._pending_turns:
+                path = self._pending_turns.pop(self._next_turn)
+                self._next_turn += 1
+                if path:
+                    leading_paths.append(path)
+            if not leading_paths:
+                return
+
+            await asyncio.to_thread(self._append_audio, leading_paths)
+            self.turns_in_audio += len(leading_paths)
+            self._unpublished_turns += len(leading_paths)
+            if self._unpublished_turns >= self.publish_every_turns:
+                await self._publish_audio()
+
+    async def flush(self) -> None:
+        """Publish audio of turns added since the last publish."""
+        async with self._lock:
+            if self._unpublished_turns:
+                await self._publish_audio()
+
+    async def _publish_audio(self) -> None:
+        # The preview lives in the task's temp directory, so clients get the uploaded copy
+        self._unpublished_turns = 0
+        audio_url: Optional[str] = self.audio_path
+        if self.storage_manager:
+            audio_url = await self.storage_manager.upload_audio_file_async(
+                self.audio_path,
+                f"episodes/{self.task_id}/preview.mp3"
+            )
+        if not audio_url:
+            logger.warning(f"Failed to upload preview audio for task {self.task_id}")
+            return
+        self.episode.audio_filepath = audio_url
+        self.publish()
+
+    def _append_audio(self, paths: List[str]) -> None:
+        with open(self.audio_path, "ab") as preview_file:
+            for path in paths:
+                preview_file.write(read_audio(path))
+
+
 class PodcastGeneratorService:
     """
     Asynchronous podcast generation service for MySalonCast.
@@ -110,12 +327,17 @@ class PodcastGeneratorService:
             combined = None
             
             for audio_path in audio_file_paths:
-                if not os.path.exists(audio_path):
+                if not audio_exists(audio_path):
                     logger.warning(f"Audio file not found: {audio_path}")
                     continue
                     
                 try:
-                    segment = AudioSegment.from_mp3(audio_path)
+                    # Audio handed over in memory by the TTS service is decoded without touching disk
+                    audio = buffered_audio(audio_path)
+                    if audio is not None:
+                        segment = AudioSegment.from_file(io.BytesIO(audio), format="mp3")
+                    else:
+                        segment = AudioSegment.from_mp3(audio_path)
                     if combined is None:
                         combined = segment
                     else:
@@ -151,12 +373,19 @@ class PodcastGeneratorService:
         Returns:
             str - The task_id for status tracking
         """
+        # Identical requests reuse or attach to an earlier task instead of re-running the pipeline.
+        # Fingerprinting hashes an uploaded PDF's content, so it runs off the event loop
+        request_fingerprint = await asyncio.to_thread(request_data.fingerprint)
+        duplicate_task_id = self._find_duplicate_task(request_fingerprint)
+        if duplicate_task_id:
+            return duplicate_task_id
+        
         # Generate new task ID
         task_id = str(uuid.uuid4())
         status_manager = get_status_manager()
         
         # Create initial status with request data
-        status = status_manager.create_status(task_id, request_data.dict())
+        status = status_manager.create_status(task_id, request_data.dict(), request_fingerprint=request_fingerprint)
         logger.info(f"Created podcast generation task with ID: {task_id}")
         
         # Update status to preprocessing
@@ -201,6 +430,140 @@ class PodcastGeneratorService:
             # Return task ID even on submission failure so user can check status
             return task_id
         
+    def _find_duplicate_task(self, request_fingerprint: str) -> Optional[str]:
+        """
+        Find an earlier task for the same request that can stand in for a new one.
+        
+        Within REQUEST_DEDUPE_WINDOW_SECONDS, a task still running in this process
+        is attached to; with the "reuse" policy a task that completed with audio
+        is returned as well. Failed, cancelled and orphaned tasks are never reused.
+        
+        Returns:
+            The task_id to return to the caller, or None to start a new task
+        """
+        config = get_config()
+        policy = config.request_dedupe_policy
+        if policy == "off":
+            return None
+        
+        since = datetime.utcnow() - timedelta(seconds=config.request_dedupe_window_seconds)
+        try:
+            candidates = list(get_status_manager().find_statuses_by_fingerprint(request_fingerprint, since))
+        except Exception as e:
+            logger.warning(f"Duplicate request lookup failed, starting a new task: {e}")
+            return None
+        
+        task_runner = get_task_runner()
+        for candidate in candidates:
+            if task_runner.is_task_running(candidate.task_id) and not task_runner.is_cancellation_requested(candidate.task_id):
+                logger.info(f"Duplicate request attached to in-flight task {candidate.task_id}")
+                return candidate.task_id
+            if (policy == "reuse" and candidate.status == "completed"
+                    and candidate.artifacts.final_podcast_audio_available):
+                logger.info(f"Duplicate request reusing completed task {candidate.task_id}")
+                return candidate.task_id
+        return None
+
+    async def resume_podcast_generation_async(self, task_id: str) -> str:
+        """
+        Resume a failed, cancelled or interrupted task from its last completed stage.
+        Stages with a saved checkpoint are restored instead of re-run, so the
+        LLM work done before the interruption is not repeated.
+        
+        Returns:
+            str - The task_id for status tracking
+            
+        Raises:
+            ValueError: If the task does not exist, is still running or already completed
+        """
+        status_manager = get_status_manager()
+        status = status_manager.get_status(task_id)
+        if not status or not status.request_data:
+            raise ValueError(f"Task {task_id} not found")
+        
+        task_runner = get_task_runner()
+        if task_runner.is_task_running(task_id):
+            raise ValueError(f"Task {task_id} is still running")
+        if status.status == "completed" and status.artifacts.final_podcast_audio_available:
+            raise ValueError(f"Task {task_id} already completed")
+        
+        checkpoints = self._load_stage_checkpoints(task_id)
+        restored_stages = [stage for stage in CHECKPOINT_STAGES if stage in checkpoints]
+        logger.info(f"Resuming task {task_id} with checkpoints: {restored_stages}")
+        
+        status_manager.clear_error(task_id)
+        status_manager.update_status(
+            task_id,
+            "preprocessing_sources",
+            f"Resuming from checkpoint ({', '.join(restored_stages) or 'no completed stages'})",
+            5.0
+        )
+        
+        if not task_runner.can_accept_new_task():
+            logger.warning(f"Task runner at capacity, cannot resume task {task_id}")
+            status_manager.set_error(
+                task_id,
+                "System at capacity",
+                f"Maximum concurrent podcast generations ({task_runner.max_workers}) reached. Please try again later."
+            )
+            return task_id
+        
+        try:
+            await task_runner.submit_async_task(
+                task_id,
+                self._run_podcast_generation_async,
+                task_id,
+                status.request_data
+            )
+            logger.info(f"Task {task_id} resubmitted for background processing")
+        except Exception as e:
+            logger.error(f"Failed to resume task {task_id}: {str(e)}")
+            status_manager.set_error(
+                task_id,
+                "Failed to resume background processing",
+                str(e)
+            )
+        return task_id
+    
+    async def cancel_podcast_generation_async(self, task_id: str) -> bool:
+        """
+        Cancel a running podcast generation task.
+        
+        The task's cancellation token is set, which stops queued TTS work,
+        LLM calls and uploads, and the running coroutine is cancelled so the
+        task releases its worker slot right away. A task left in progress by a
+        previous process (no longer running here) is simply marked cancelled.
+        
+        Returns:
+            True if a running task was cancelled, False if an orphaned task was marked cancelled
+            
+        Raises:
+            ValueError: If the task does not exist or has already finished
+        """
+        status_manager = get_status_manager()
+        status = status_manager.get_status(task_id)
+        if not status:
+            raise ValueError(f"Task {task_id} not found")
+        
+        task_runner = get_task_runner()
+        if await task_runner.cancel_task(task_id):
+            logger.info(f"Cancellation requested for task {task_id}")
+            return True
+        
+        if status.status in ("completed", "failed", "cancelled"):
+            raise ValueError(f"Task {task_id} already {status.status}")
+        
+        logger.info(f"Task {task_id} is not running in this process, marking it cancelled")
+        # A preview left by the interrupted run points at audio that will never be finished
+        status_manager.clear_episode(task_id)
+        status_manager.update_status(
+            task_id,
+            "cancelled",
+            "Task was cancelled by user request",
+            progress=None
+        )
+        return False
+        
     async def _run_podcast_generation_async(self, task_id: str, request_data: PodcastRequest) -> None:
         """
         Wrapper function that runs podcast generation in a background task.
@@ -315,67 +678,1089 @@ class PodcastGeneratorService:
             error=error
         )
         
-        # Use the retry utility
-        await send_webhook_with_retry(
-            url=webhook_url,
-            payload=payload,
-            identifier=task_id
+        # Use the retry utility
+        await send_webhook_with_retry(
+            url=webhook_url,
+            payload=payload,
+            identifier=task_id
+        )
+
+    def _check_cancellation(self, task_id: Optional[str] = None) -> None:
+        """
+        Check if the current task has been cancelled.
+        Raises CancelledError if the task was cancelled.
+        
+        Args:
+            task_id: Optional task ID to check. If not provided, checks the
+                cancellation token of the current async task context.
+        """
+        if not task_id:
+            raise_if_cancelled()
+            return
+        
+        # Check the task's cancellation token; asyncio's task.cancelled() is never
+        # true from inside the running task itself
+        token = get_task_runner().get_cancellation_token(task_id)
+        if token is not None:
+            token.raise_if_cancelled()
+
+    def _load_stage_checkpoints(self, task_id: str) -> Dict[str, Any]:
+        """Load saved stage outputs for a task; an unreadable store means a fresh run."""
+        try:
+            checkpoints = get_status_manager().get_checkpoints(task_id)
+        except Exception as e:
+            logger.warning(f"Failed to load checkpoints for task {task_id}: {e}")
+            return {}
+        return checkpoints if isinstance(checkpoints, dict) else {}
+
+    def _save_stage_checkpoint(self, task_id: str, stage: str, payload: Any) -> None:
+        """Persist a stage output; a failed save only costs the ability to resume."""
+        try:
+            get_status_manager().save_checkpoint(task_id, stage, payload)
+        except Exception as e:
+            logger.warning(f"Failed to save '{stage}' checkpoint for task {task_id}: {e}")
+
+    def _select_host_voice(self, gender: str, used_voice_ids: set[str]) -> Tuple[str, Dict[str, float]]:
+        """Select a host voice profile from the TTS cache avoiding conflicts."""
+        return self._select_voice(gender, used_voice_ids, role="host")
+
+    def _select_voice(self, gender: str, used_voice_ids: set[str], role: str = "host") -> Tuple[str, Dict[str, float]]:
+        """Select a voice profile for the given gender from the TTS cache avoiding conflicts."""
+        default_profile = {"voice_id": "en-US-Chirp3-HD-Achird", "speaking_rate": 1.0}
+        if not self.tts_service:
+            logger.warning(f"TTS service unavailable, using fallback {role} voice")
+            return default_profile["voice_id"], {
+                "speaking_rate": default_profile["speaking_rate"]
+            }
+        try:
+            voices = self.tts_service.get_voices_by_gender(gender)
+            logger.debug(f"Retrieved {len(voices)} voices for {role} gender '{gender}'")
+            available = [v for v in voices if v.get("voice_id") not in used_voice_ids]
+            if not available:
+                logger.debug(f"All {role} voices in use; allowing reuse")
+                available = voices
+            if not available:
+                logger.warning(f"No voices available for gender '{gender}', using default")
+                return default_profile["voice_id"], {
+                    "speaking_rate": default_profile["speaking_rate"]
+                }
+            chosen = random.choice(available)
+            voice_id = chosen.get("voice_id", default_profile["voice_id"])
+            params = {
+                "speaking_rate": chosen.get("speaking_rate", default_profile["speaking_rate"])
+            }
+            logger.debug(
+                f"{role.capitalize()} voice selected: {voice_id}, Params: {{'speaking_rate': {params['speaking_rate']}}}"
+            )
+            return voice_id, params
+        except Exception as e:
+            logger.error(f"Error selecting {role} voice: {e}")
+            return default_profile["voice_id"], {
+                "speaking_rate": default_profile["speaking_rate"]
+            }
+
+    async def _extract_source_async(self, url: str, timeout_seconds: float) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Extract text from a single source URL within a timeout.
+
+        Returns:
+            Tuple of (extracted text or None, warning message or None)
+        """
+        try:
+            # Check if this is a YouTube URL and handle accordingly
+            if is_valid_youtube_url(url):
+                logger.info(f"Detected YouTube URL, extracting transcript: {url}")
+                text = await asyncio.wait_for(extract_transcript_from_youtube(url), timeout=timeout_seconds)
+            else:
+                logger.info(f"Processing general URL: {url}")
+                text = await asyncio.wait_for(extract_content_from_url(url), timeout=timeout_seconds)
+        except ExtractionError as e:
+            logger.error(f"Content extraction from URL {url} failed: {e}")
+            return None, f"Failed to extract content from URL {url}: {e}"
+        except asyncio.TimeoutError:
+            logger.error(f"Content extraction from URL {url} timed out after {timeout_seconds}s")
+            return None, f"Failed to extract content from URL {url}: timed out after {timeout_seconds}s"
+
+        if not text:
+            logger.warning(f"Empty content extracted from URL: {url}")
+            return None, None
+        logger.info(f"Successfully extracted text from URL: {url}")
+        return text, None
+
+    async def _extract_sources_async(
+        self,
+        source_urls: List[Any],
+        warnings_list: List[str]
+    ) -> Tuple[List[str], List[Any]]:
+        """
+        Extract all source URLs concurrently.
+
+        Each source is bounded by ``EXTRACTION_SOURCE_TIMEOUT_SECONDS`` and the
+        whole stage by ``EXTRACTION_DEADLINE_SECONDS``; sources still running at
+        the deadline are cancelled. Results keep the order of source_urls.
+
+        Returns:
+            Tuple of (extracted texts, matching source attributions)
+        """
+        config = get_config()
+        deadline = config.extraction_deadline_seconds
+        extraction_tasks = [
+            asyncio.create_task(self._extract_source_async(str(url), config.extraction_source_timeout_seconds))
+            for url in source_urls
+        ]
+
+        _, pending = await asyncio.wait(extraction_tasks, timeout=deadline)
+        for extraction_task in pending:
+            extraction_task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        extracted_texts: List[str] = []
+        source_attributions: List[Any] = []
+        for url, extraction_task in zip(source_urls, extraction_tasks):
+            if extraction_task in pending:
+                logger.error(f"Content extraction from URL {url} cancelled at the {deadline}s extraction deadline")
+                warnings_list.append(f"Failed to extract content from URL {url}: extraction deadline of {deadline}s exceeded")
+                continue
+            text, warning = extraction_task.result()
+            if warning:
+                warnings_list.append(warning)
+            if text:
+                extracted_texts.append(text)
+                source_attributions.append(url)
+        return extracted_texts, source_attributions
+
+    def _assign_unique_persona_voices(self, persona_research_objects: List[PersonaResearch]) -> None:
+        """
+        Reassign duplicate persona voices in request order.
+
+        Personas researched concurrently pick their voices independently, so the
+        first persona keeps a contested voice and later ones get a fresh one.
+        """
+        used_voice_ids: set[str] = set()
+        for pr in persona_research_objects:
+            if pr.tts_voice_id and pr.tts_voice_id in used_voice_ids:
+                voice_id, params = self._select_voice(pr.gender or "Neutral", used_voice_ids, role="persona")
+                logger.info(f"Voice {pr.tts_voice_id} already assigned, reassigning {pr.person_id} to {voice_id}")
+                pr.tts_voice_id = voice_id
+                pr.tts_voice_params = {"voice_id": voice_id, **params}
+            if pr.tts_voice_id:
+                used_voice_ids.add(pr.tts_voice_id)
+
+    async def _research_persona_safe_async(
+        self,
+        task_id: str,
+        person_name: str,
+        extracted_text: str
+    ) -> Tuple[Optional[PersonaResearch], List[str]]:
+        """
+        Research a single persona, isolating failures.
+
+        Returns:
+            Tuple of (PersonaResearch or None on failure, warnings raised for this person)
+        """
+        status_manager = get_status_manager()
+        person_warnings: List[str] = []
+        try:
+            logger.info(f"STEP: Attempting Persona Research for '{person_name}'...")
+            status_manager.add_progress_log(
+                task_id,
+                "researching_personas",
+                "persona_research_individual",
+                f"Researching {person_name}"
+            )
+
+            persona_research_obj = await self.llm_service.research_persona_async(
+                source_text=extracted_text, person_name=person_name
+            )
+            if persona_research_obj:
+                logger.info(f"STEP: Persona Research for '{person_name}' successful. Object created.")
+                status_manager.add_progress_log(
+                    task_id,
+                    "researching_personas",
+                    "persona_research_success",
+                    f"✓ Generated persona research for {person_name}"
+                )
+                logger.info(f"Persona research for {person_name} saved to memory")
+                status_manager.add_progress_log(
+                    task_id,
+                    "researching_personas",
+                    "persona_saved",
+                    f"Research saved to memory: {person_name}"
+                )
+                return persona_research_obj, person_warnings
+
+            logger.error(f"Persona research for {person_name} returned None.")
+            person_warnings.append(f"Persona research for {person_name} failed to produce a result.")
+            status_manager.add_progress_log(
+                task_id,
+                "researching_personas",
+                "persona_research_empty",
+                f"⚠ Persona research for {person_name} returned no data"
+            )
+        except Exception as e:
+            logger.error(f"Persona research for {person_name} failed ({e.__class__.__name__}): {e}", exc_info=True)
+            person_warnings.append(f"Persona research for {person_name} failed: {e}")
+            status_manager.add_progress_log(
+                task_id,
+                "researching_personas",
+                "persona_research_error",
+                f"✗ Persona research failed for {person_name}: {e}"
+            )
+        return None, person_warnings
+
+    async def _research_personas_async(
+        self,
+        task_id: str,
+        person_names: List[str],
+        extracted_text: str,
+        warnings_list: List[str]
+    ) -> List[PersonaResearch]:
+        """
+        Research all requested personas with bounded concurrency.
+
+        Up to ``PERSONA_RESEARCH_MAX_CONCURRENCY`` Gemini calls run at once.
+        Results and per-person warnings keep the order of person_names.
+        """
+        semaphore = asyncio.Semaphore(get_config().persona_research_max_concurrency)
+
+        async def run_person(person_name: str) -> Tuple[Optional[PersonaResearch], List[str]]:
+            async with semaphore:
+                self._check_cancellation(task_id)
+                return await self._research_persona_safe_async(task_id, person_name, extracted_text)
+
+        results = await asyncio.gather(*(run_person(name) for name in person_names))
+
+        persona_research_objects: List[PersonaResearch] = []
+        for persona_research_obj, person_warnings in results:
+            if persona_research_obj:
+                persona_research_objects.append(persona_research_obj)
+            warnings_list.extend(person_warnings)
+
+        self._assign_unique_persona_voices(persona_research_objects)
+        return persona_research_objects
+
+    def _resolve_turn_voice(
+        self,
+        turn: DialogueTurn,
+        persona_research_map: Dict[str, PersonaResearch]
+    ) -> Tuple[Optional[str], Optional[str], Optional[Dict[str, Any]]]:
+        """Resolve (voice_name, speaker_gender, voice_params) for a dialogue turn."""
+        voice_name = None
+        speaker_gender = None
+        voice_params = None
+
+        # Try to find matching persona with voice info
+        if turn.speaker_id in persona_research_map:
+            pr = persona_research_map[turn.speaker_id]
+            # Priority 1: Use specific voice ID if available
+            if pr.tts_voice_id:
+                voice_name = pr.tts_voice_id
+                logger.info(f"Using specific voice ID for {turn.speaker_id}: {voice_name}")
+            # Priority 2: Use gender if no specific voice
+            elif pr.gender:
+                speaker_gender = pr.gender
+                logger.info(f"Using gender from PersonaResearch for {turn.speaker_id}: {speaker_gender}")
+            # Priority 3: Use voice params if available
+            if pr.tts_voice_params:
+                voice_params = pr.tts_voice_params
+        # Fallback to turn.speaker_gender if no persona found
+        elif hasattr(turn, 'speaker_gender') and turn.speaker_gender:
+            speaker_gender = turn.speaker_gender
+            logger.info(f"Falling back to turn.speaker_gender for {turn.speaker_id}: {speaker_gender}")
+        # No PersonaResearch or speaker_gender available - log warning and use default
+        else:
+            logger.warning(f"No PersonaResearch or speaker_gender found for {turn.speaker_id}. Using default Neutral voice.")
+            speaker_gender = "Neutral"
+
+        return voice_name, speaker_gender, voice_params
+
+    async def _generate_turn_audio_async(
+        self,
+        task_id: str,
+        i: int,
+        turn: DialogueTurn,
+        total_turns: Optional[int],
+        audio_segments_dir: str,
+        persona_research_map: Dict[str, PersonaResearch]
+    ) -> Tuple[Optional[str], List[str]]:
+        """
+        Synthesize and upload the audio for a single dialogue turn.
+
+        total_turns is None while dialogue is still being streamed in.
+
+        Returns:
+            Tuple of (audio file path or None on failure, warnings raised for this turn)
+        """
+        status_manager = get_status_manager()
+        turn_warnings: List[str] = []
+
+        status_manager.add_progress_log(
+            task_id,
+            "generating_audio_segments",
+            "tts_turn_start",
+            f"Processing turn {i+1}/{total_turns or '?'}: {turn.speaker_id}"
+        )
+
+        turn_audio_filename = f"turn_{i:03d}_{turn.speaker_id.replace(' ','_')}.mp3"
+        turn_audio_filepath = os.path.join(audio_segments_dir, turn_audio_filename)
+        logger.info(f"Generating TTS for turn {i} (Speaker: {turn.speaker_id}): {turn.text[:50]}...")
+        try:
+            voice_name, speaker_gender, voice_params = self._resolve_turn_voice(turn, persona_research_map)
+
+            # Make the TTS call with all available voice parameters
+            success = await self.tts_service.text_to_audio_async(
+                text_input=turn.text,
+                output_filepath=turn_audio_filepath,
+                speaker_gender=speaker_gender or "Neutral",  # Provide default
+                voice_name=voice_name or "",  # Provide default
+                voice_params=voice_params or {}  # Provide default
+            )
+            if not success:
+                logger.warning(f"TTS generation failed for turn {i}. Skipping audio for this turn.")
+                turn_warnings.append(f"TTS failed for turn {i}: {turn.text[:30]}...")
+                status_manager.add_progress_log(
+                    task_id,
+                    "generating_audio_segments",
+                    "tts_turn_failed",
+                    f"✗ TTS failed for turn {i+1}: {turn.speaker_id}"
+                )
+                return None, turn_warnings
+
+            logger.info(f"Generated audio for turn {i}: {turn_audio_filepath}")
+            status_manager.add_progress_log(
+                task_id,
+                "generating_audio_segments",
+                "tts_turn_success",
+                f"✓ Generated audio for turn {i+1}: {turn.speaker_id}"
+            )
+            # Upload the individual audio segment to cloud storage
+            if self.cloud_storage_manager:
+                self._check_cancellation(task_id)
+                try:
+                    await self.cloud_storage_manager.upload_audio_segment_async(turn_audio_filepath, buffered_audio(turn_audio_filepath))
+                    logger.info(f"Individual audio segment uploaded to cloud storage successfully: {turn_audio_filepath}")
+                except Exception as e:
+                    logger.error(f"Error uploading individual audio segment to cloud storage: {e}")
+                    turn_warnings.append(f"Error uploading individual audio segment to cloud storage: {e}")
+            return turn_audio_filepath, turn_warnings
+        except Exception as e:
+            logger.error(f"Error during TTS for turn {i}: {e}", exc_info=True)
+            turn_warnings.append(f"TTS critical error for turn {i}: {e}")
+            status_manager.add_progress_log(
+                task_id,
+                "generating_audio_segments",
+                "tts_turn_error",
+                f"✗ Critical TTS error for turn {i+1}: {e}"
+            )
+            return None, turn_warnings
+
+    def _tts_batch_voice(
+        self,
+        turn: DialogueTurn,
+        persona_research_map: Dict[str, PersonaResearch]
+    ) -> Optional[Tuple[str, str, str]]:
+        """Voice of a turn as the key for batching, or None if the voice cannot be batched."""
+        voice_name, speaker_gender, voice_params = self._resolve_turn_voice(turn, persona_research_map)
+        if not GoogleCloudTtsService.supports_ssml_marks(voice_name):
+            return None
+        # Same defaults as the TTS calls, so an unset gender matches "Neutral"
+        return (voice_name, speaker_gender or "Neutral", json.dumps(voice_params or {}, sort_keys=True))
+
+    @staticmethod
+    def _fits_tts_batch(texts: List[str]) -> bool:
+        """Check if the SSML of a batch of turn texts is within ``TTS_MAX_INPUT_BYTES``."""
+        return len(GoogleCloudTtsService.build_turns_ssml(texts).encode("utf-8")) <= get_config().tts_max_input_bytes
+
+    def _group_turns_for_tts(
+        self,
+        dialogue_turns_list: List[DialogueTurn],
+        persona_research_map: Dict[str, PersonaResearch]
+    ) -> List[List[int]]:
+        """
+        Group runs of consecutive turns that share a voice for batched synthesis.
+
+        Only voices that accept SSML <mark> tags are batched; a turn of any other
+        voice (e.g. Chirp3-HD) is a group of its own. A group's SSML is kept within
+        ``TTS_MAX_INPUT_BYTES``; a turn that does not fit starts a new group.
+        """
+        groups: List[List[int]] = []
+        group_voice = None
+        for i, turn in enumerate(dialogue_turns_list):
+            voice = self._tts_batch_voice(turn, persona_research_map)
+            if groups and voice is not None and voice == group_voice and self._fits_tts_batch(
+                [dialogue_turns_list[j].text for j in groups[-1]] + [turn.text]
+            ):
+                groups[-1].append(i)
+                continue
+            groups.append([i])
+            group_voice = voice
+        return groups
+
+    async def _generate_turn_batch_audio_async(
+        self,
+        task_id: str,
+        indices: List[int],
+        dialogue_turns_list: List[DialogueTurn],
+        audio_segments_dir: str,
+        persona_research_map: Dict[str, PersonaResearch]
+    ) -> Tuple[Optional[str], Optional[List[Optional[float]]], List[str]]:
+        """
+        Synthesize consecutive turns of one voice into a single audio file and upload it.
+
+        Returns:
+            Tuple of (audio file path, start offset of each turn within it, warnings);
+            path and offsets are None if batched synthesis failed, in which case the
+            caller synthesizes the turns one by one
+        """
+        status_manager = get_status_manager()
+        turns = [dialogue_turns_list[i] for i in indices]
+        first, last = indices[0] + 1, indices[-1] + 1
+        batch_warnings: List[str] = []
+
+        status_manager.add_progress_log(
+            task_id,
+            "generating_audio_segments",
+            "tts_batch_start",
+            f"Processing turns {first}-{last}/{len(dialogue_turns_list)} in one request: {turns[0].speaker_id}"
+        )
+
+        batch_audio_filename = f"turns_{indices[0]:03d}-{indices[-1]:03d}_{turns[0].speaker_id.replace(' ','_')}.mp3"
+        batch_audio_filepath = os.path.join(audio_segments_dir, batch_audio_filename)
+        logger.info(f"Generating TTS for turns {indices[0]}-{indices[-1]} (Speaker: {turns[0].speaker_id}) in one request")
+        try:
+            voice_name, speaker_gender, voice_params = self._resolve_turn_voice(turns[0], persona_research_map)
+            offsets = await self.tts_service.turns_to_audio_async(
+                turn_texts=[turn.text for turn in turns],
+                output_filepath=batch_audio_filepath,
+                speaker_gender=speaker_gender or "Neutral",
+                voice_name=voice_name or "",
+                voice_params=voice_params or {}
+            )
+        except Exception as e:
+            logger.error(f"Error during batched TTS for turns {indices[0]}-{indices[-1]}: {e}", exc_info=True)
+            offsets = None
+        if offsets is None:
+            logger.warning(f"Batched TTS failed for turns {indices[0]}-{indices[-1]}, synthesizing them one by one")
+            return None, None, batch_warnings
+
+        logger.info(f"Generated audio for turns {indices[0]}-{indices[-1]}: {batch_audio_filepath}")
+        status_manager.add_progress_log(
+            task_id,
+            "generating_audio_segments",
+            "tts_batch_success",
+            f"✓ Generated audio for turns {first}-{last}: {turns[0].speaker_id}"
+        )
+        if self.cloud_storage_manager:
+            self._check_cancellation(task_id)
+            try:
+                await self.cloud_storage_manager.upload_audio_segment_async(batch_audio_filepath, buffered_audio(batch_audio_filepath))
+                logger.info(f"Batched audio segment uploaded to cloud storage successfully: {batch_audio_filepath}")
+            except Exception as e:
+                logger.error(f"Error uploading batched audio segment to cloud storage: {e}")
+                batch_warnings.append(f"Error uploading individual audio segment to cloud storage: {e}")
+        return batch_audio_filepath, offsets, batch_warnings
+
+    async def _synthesize_turn_group_async(
+        self,
+        task_id: str,
+        indices: List[int],
+        dialogue_turns_list: List[DialogueTurn],
+        total_turns: Optional[int],
+        audio_segments_dir: str,
+        persona_research_map: Dict[str, PersonaResearch],
+        semaphore: asyncio.Semaphore
+    ) -> List[Tuple[Optional[str], Optional[float], List[str]]]:
+        """
+        Synthesize a group of turns, several turns in one SSML request.
+
+        If batched synthesis fails the turns are synthesized one by one.
+
+        Returns:
+            (audio path, offset of the turn within it, warnings) per turn
+        """
+        if len(indices) > 1:
+            async with semaphore:
+                self._check_cancellation(task_id)
+                audio_path, offsets, batch_warnings = await self._generate_turn_batch_audio_async(
+                    task_id, indices, dialogue_turns_list, audio_segments_dir, persona_research_map
+                )
+            if audio_path:
+                return [
+                    (audio_path, offset, batch_warnings if k == 0 else [])
+                    for k, offset in enumerate(offsets)
+                ]
+
+        async def run_turn(i: int) -> Tuple[Optional[str], List[str]]:
+            async with semaphore:
+                self._check_cancellation(task_id)
+                return await self._generate_turn_audio_async(
+                    task_id, i, dialogue_turns_list[i], total_turns, audio_segments_dir, persona_research_map
+                )
+
+        turn_results = await asyncio.gather(*(run_turn(i) for i in indices))
+        return [
+            (audio_path, 0.0 if audio_path else None, turn_warnings)
+            for audio_path, turn_warnings in turn_results
+        ]
+
+    @staticmethod
+    async def _add_group_to_preview(
+        preview: EpisodePreview,
+        indices: List[int],
+        results: List[Tuple[Optional[str], Optional[float], List[str]]]
+    ) -> None:
+        previewed = set()
+        for i, (audio_path, _, _) in zip(indices, results):
+            # A file shared by several turns is added once, with its first turn
+            await preview.add_turn_audio(i, None if audio_path in previewed else audio_path)
+            previewed.add(audio_path)
+
+    @staticmethod
+    def _collect_group_audio(
+        groups: List[List[int]],
+        group_results: List[List[Tuple[Optional[str], Optional[float], List[str]]]],
+        dialogue_turns_list: List[DialogueTurn],
+        warnings_list: List[str],
+        turn_audio_index: Optional[List[TurnAudioSpan]]
+    ) -> List[str]:
+        """List the audio files of synthesized groups in turn order, indexing where each turn starts."""
+        audio_paths: List[str] = []
+        for indices, results in zip(groups, group_results):
+            for i, (audio_path, offset, turn_warnings) in zip(indices, results):
+                if audio_path:
+                    # Turns of one batch share the file, which is listed once
+                    if not audio_paths or audio_paths[-1] != audio_path:
+                        audio_paths.append(audio_path)
+                    if turn_audio_index is not None:
+                        turn_audio_index.append(TurnAudioSpan(
+                            turn_id=dialogue_turns_list[i].turn_id,
+                            audio_file_index=len(audio_paths) - 1,
+                            offset_seconds=offset
+                        ))
+                warnings_list.extend(turn_warnings)
+        return audio_paths
+
+    async def _generate_dialogue_audio_async(
+        self,
+        task_id: str,
+        dialogue_turns_list: List[DialogueTurn],
+        persona_research_map: Dict[str, PersonaResearch],
+        audio_segments_dir: str,
+        warnings_list: List[str],
+        preview: Optional[EpisodePreview] = None,
+        turn_audio_index: Optional[List[TurnAudioSpan]] = None
+    ) -> List[str]:
+        """
+        Synthesize audio for all dialogue turns with bounded concurrency.
+
+        Up to ``TTS_MAX_CONCURRENCY`` requests are in flight at once. Audio paths are
+        returned in turn order and per-turn warnings are appended to warnings_list
+        in turn order, regardless of completion order. Finished turns are fed to
+        the episode preview, if given.
+
+        With ``DIALOGUE_TTS_BATCHING``, consecutive turns of the same voice are
+        synthesized in one SSML request and share an audio file. Where each turn
+        starts among the returned files is appended to turn_audio_index, if given.
+        """
+        status_manager = get_status_manager()
+        total_turns = len(dialogue_turns_list)
+        semaphore = asyncio.Semaphore(get_config().tts_max_concurrency)
+        completed_turns = 0
+
+        if get_config().dialogue_tts_batching:
+            groups = self._group_turns_for_tts(dialogue_turns_list, persona_research_map)
+            logger.info(f"Batching {total_turns} dialogue turns into {len(groups)} TTS requests")
+        else:
+            groups = [[i] for i in range(total_turns)]
+
+        async def run_group(indices: List[int]) -> List[Tuple[Optional[str], Optional[float], List[str]]]:
+            nonlocal completed_turns
+            results = await self._synthesize_turn_group_async(
+                task_id, indices, dialogue_turns_list, total_turns, audio_segments_dir, persona_research_map, semaphore
+            )
+            if preview:
+                await self._add_group_to_preview(preview, indices, results)
+            completed_turns += len(indices)
+            status_manager.update_status(
+                task_id,
+                "generating_audio_segments",
+                f"Generated audio {completed_turns}/{total_turns} - {dialogue_turns_list[indices[-1]].speaker_id}",
+                75.0 + (15.0 * (completed_turns / total_turns))  # Progress from 75% to 90%
+            )
+            return results
+
+        group_results = await asyncio.gather(*(run_group(indices) for indices in groups))
+        if preview:
+            await preview.flush()
+
+        return self._collect_group_audio(groups, group_results, dialogue_turns_list, warnings_list, turn_audio_index)
+
+    async def _generate_dialogue_with_streaming_audio_async(
+        self,
+        task_id: str,
+        podcast_outline: PodcastOutline,
+        source_analyses: List[SourceAnalysis],
+        persona_research_docs: List[PersonaResearch],
+        persona_details_map: Dict[str, Dict[str, str]],
+        user_custom_prompt_for_dialogue: str,
+        persona_research_map: Dict[str, PersonaResearch],
+        tmpdir_path: str,
+        warnings_list: List[str],
+        preview: Optional[EpisodePreview] = None,
+        turn_audio_index: Optional[List[TurnAudioSpan]] = None
+    ) -> Tuple[List[DialogueTurn], List[str]]:
+        """
+        Generate dialogue and synthesize its audio as a pipeline.
+
+        Each dialogue turn is queued for TTS (and segment upload) as soon as the
+        LLM yields it, so audio for early turns is produced while later ones are
+        still being written: per segment by default, per turn with
+        ``DIALOGUE_STREAM_TURNS``. TTS stays bounded by ``TTS_MAX_CONCURRENCY``.
+        The preview, if given, receives the transcript after every segment and
+        the audio of finished turns.
+
+        With ``DIALOGUE_TTS_BATCHING``, a run of turns whose voice can be batched
+        is held back until the voice changes or the segment ends and is then
+        synthesized in one request, as in _generate_dialogue_audio_async.
+
+        Returns:
+            Tuple of (dialogue turns in order, audio paths in turn order)
+        """
+        status_manager = get_status_manager()
+        audio_segments_dir = os.path.join(tmpdir_path, "audio_segments")
+        ensure_directory_exists(audio_segments_dir)
+        status_manager.add_progress_log(
+            task_id,
+            "generating_dialogue",
+            "tts_streaming_start",
+            f"Streaming dialogue into TTS for {len(podcast_outline.segments)} segments"
+        )
+
+        semaphore = asyncio.Semaphore(get_config().tts_max_concurrency)
+        batching = get_config().dialogue_tts_batching
+        dialogue_turns: List[DialogueTurn] = []
+        groups: List[List[int]] = []
+        group_tasks: List[asyncio.Task] = []
+        pending_group: List[int] = []  # Turns held back to be batched with the next ones
+        pending_voice = None
+        total_turns: Optional[int] = None  # Known once the LLM has finished all segments
+        completed_turns = 0
+
+        async def run_group(indices: List[int]) -> List[Tuple[Optional[str], Optional[float], List[str]]]:
+            nonlocal completed_turns
+            results = await self._synthesize_turn_group_async(
+                task_id, indices, dialogue_turns, total_turns, audio_segments_dir, persona_research_map, semaphore
+            )
+            if preview:
+                await self._add_group_to_preview(preview, indices, results)
+            completed_turns += len(indices)
+            if total_turns:
+                status_manager.update_status(
+                    task_id,
+                    "generating_audio_segments",
+                    f"Generated audio {completed_turns}/{total_turns} - {dialogue_turns[indices[-1]].speaker_id}",
+                    75.0 + (15.0 * (completed_turns / total_turns))  # Progress from 75% to 90%
+                )
+            return results
+
+        def queue_pending_group() -> None:
+            nonlocal pending_group, pending_voice
+            if pending_group:
+                groups.append(pending_group)
+                group_tasks.append(asyncio.create_task(run_group(pending_group)))
+            pending_group, pending_voice = [], None
+
+        try:
+            total_segments = max(1, len(podcast_outline.segments))
+            segments_done = 0
+            async for _, turn, segment_complete in self.llm_service.generate_dialogue_turns_async(
+                podcast_outline=podcast_outline,
+                source_analyses=source_analyses,
+                persona_research_docs=persona_research_docs,
+                persona_details_map=persona_details_map,
+                user_custom_prompt_for_dialogue=user_custom_prompt_for_dialogue,
+                warnings_list=warnings_list
+            ):
+                self._check_cancellation(task_id)
+                voice = self._tts_batch_voice(turn, persona_research_map) if batching else None
+                if not (pending_group and voice is not None and voice == pending_voice and self._fits_tts_batch(
+                    [dialogue_turns[j].text for j in pending_group] + [turn.text]
+                )):
+                    queue_pending_group()
+                pending_group.append(len(dialogue_turns))
+                pending_voice = voice
+                dialogue_turns.append(turn)
+                if voice is None:
+                    # Nothing to batch with, synthesize the turn right away
+                    queue_pending_group()
+                if not segment_complete:
+                    continue
+                # Batches do not wait for the next segment
+                queue_pending_group()
+                segments_done += 1
+                if preview:
+                    preview.update_transcript(dialogue_turns)
+                status_manager.update_status(
+                    task_id,
+                    "generating_dialogue",
+                    f"Generated dialogue for segment {segments_done}/{total_segments}, {len(dialogue_turns)} turns queued for audio",
+                    60.0 + (15.0 * (segments_done / total_segments))  # Progress from 60% to 75%
+                )
+            queue_pending_group()
+
+            if not dialogue_turns:
+                raise LLMProcessingError("Failed to generate any dialogue turns for the podcast")
+
+            total_turns = len(dialogue_turns)
+            status_manager.update_status(
+                task_id,
+                "generating_audio_segments",
+                f"Generated {total_turns} dialogue turns, finishing audio ({completed_turns} done)",
+                75.0 + (15.0 * (completed_turns / total_turns))
+            )
+            status_manager.update_artifacts(
+                task_id,
+                dialogue_script_complete=True
+            )
+            group_results = await asyncio.gather(*group_tasks)
+        except BaseException:
+            # Dialogue generation failed or the task was cancelled: stop queued TTS work
+            for group_task in group_tasks:
+                group_task.cancel()
+            await asyncio.gather(*group_tasks, return_exceptions=True)
+            raise
+        if preview:
+            await preview.flush()
+
+        audio_paths = self._collect_group_audio(groups, group_results, dialogue_turns, warnings_list, turn_audio_index)
+
+        status_manager.add_progress_log(
+            task_id,
+            "generating_audio_segments",
+            "tts_generation_complete",
+            f"✓ TTS complete: {len(audio_paths)} audio files generated for {total_turns} turns"
+        )
+        return dialogue_turns, audio_paths
+
+    @staticmethod
+    def _source_analysis_cache_key(model_name: str, source_text: str) -> str:
+        """Content hash for sharing a source's analysis across tasks; changes with the model and analysis prompt."""
+        return hashlib.sha256(f"{model_name}\0{SOURCE_ANALYSIS_TEMPLATE}\0{source_text}".encode("utf-8")).hexdigest()
+
+    async def _analyze_single_source_async(
+        self,
+        task_id: str,
+        index: int,
+        source_text: str,
+        source_count: int,
+        shared_context_text: Optional[str] = None
+    ) -> SourceAnalysis:
+        """
+        Analyze one extracted source, reusing an analysis cached by an earlier task for the same content.
+
+        shared_context_text is the combined text of all sources; when given, the
+        LLM answers against its cached context (shared with persona research)
+        instead of creating one per source.
+        """
+        status_manager = get_status_manager()
+        config = get_config()
+        cache_ttl = config.source_analysis_cache_ttl_seconds
+        cache_key = self._source_analysis_cache_key(self.llm_service.model_name, source_text)
+
+        if cache_ttl > 0:
+            try:
+                cached = status_manager.get_cached_source_analysis(cache_key, cache_ttl)
+                if cached:
+                    logger.info(f"Reusing cached analysis for source {index + 1}/{source_count}")
+                    status_manager.add_progress_log(
+                        task_id,
+                        "analyzing_sources",
+                        "source_analysis_cache_hit",
+                        f"✓ Reused cached analysis for source {index + 1}/{source_count}"
+                    )
+                    return SourceAnalysis(**cached)
+            except Exception as e:
+                logger.warning(f"Source analysis cache lookup failed for source {index + 1}: {e}")
+
+        # llm_service.analyze_source_text_async returns a SourceAnalysis object directly or raises an error
+        if shared_context_text:
+            source_analysis_obj = await self.llm_service.analyze_source_text_async(
+                source_text,
+                analysis_instructions="",  # Using empty string as default analysis instructions
+                context_text=shared_context_text,
+                context_reference=source_section_reference(index + 1)
+            )
+        else:
+            source_analysis_obj = await self.llm_service.analyze_source_text_async(
+                source_text,
+                analysis_instructions=""  # Using empty string as default analysis instructions
+            )
+        if source_analysis_obj and cache_ttl > 0:
+            try:
+                status_manager.save_cached_source_analysis(cache_key, source_analysis_obj.model_dump(mode="json"))
+            except Exception as e:
+                logger.warning(f"Failed to cache analysis for source {index + 1}: {e}")
+        return source_analysis_obj
+
+    async def _run_source_analysis_stage(
+        self,
+        task_id: str,
+        extracted_texts: List[str],
+        checkpoints: Dict[str, Any],
+        warnings_list: List[str],
+        shared_context_text: Optional[str] = None
+    ) -> List[SourceAnalysis]:
+        """
+        Analyze each extracted source independently and concurrently with the LLM.
+
+        Per-source analyses are cached by content hash, so a source already
+        analyzed for another task is not sent to the LLM again. Failures are
+        recorded as warnings per source; an empty list lets later stages fall
+        back to the extracted text alone. shared_context_text is passed on to
+        _analyze_single_source_async.
+        """
+        status_manager = get_status_manager()
+        source_analyses: List[SourceAnalysis] = []
+
+        # 3. LLM - Source Analysis
+        logger.info("STEP: Starting Source Analysis...")
+        
+        status_manager.add_progress_log(
+            task_id,
+            "analyzing_sources",
+            "llm_source_analysis_start",
+            f"Analyzing {len(extracted_texts)} sources ({sum(len(text) for text in extracted_texts):,} characters)"
+        )
+        
+        if "source_analysis" in checkpoints:
+            checkpoint = checkpoints["source_analysis"]
+            # Checkpoints from before per-source analysis hold a single analysis
+            checkpoint_items = checkpoint if isinstance(checkpoint, list) else [checkpoint]
+            source_analyses = [SourceAnalysis(**item) for item in checkpoint_items]
+            logger.info(f"Restored {len(source_analyses)} source analyses from checkpoint.")
+        else:
+            logger.info("STEP: Attempting LLM Source Analysis...")
+            status_manager.add_progress_log(
+                task_id,
+                "analyzing_sources",
+                "llm_processing",
+                "Sending content to LLM for analysis"
+            )
+            results = await asyncio.gather(
+                *(
+                    self._analyze_single_source_async(
+                        task_id, index, text, len(extracted_texts), shared_context_text
+                    )
+                    for index, text in enumerate(extracted_texts)
+                ),
+                return_exceptions=True
+            )
+            for index, result in enumerate(results):
+                if isinstance(result, asyncio.CancelledError):
+                    raise result
+                if isinstance(result, LLMProcessingError):  # Specific LLM errors from the service
+                    logger.error(f"LLM processing error during analysis of source {index + 1}: {result}")
+                    warnings_list.append(f"LLM source analysis failed for source {index + 1}: {result}")
+                    status_manager.add_progress_log(
+                        task_id,
+                        "analyzing_sources",
+                        "llm_processing_error",
+                        f"✗ LLM processing failed for source {index + 1}: {result}"
+                    )
+                elif isinstance(result, ValidationError):  # Malformed data that fails model validation
+                    logger.error(f"Validation error during analysis of source {index + 1}: {result}")
+                    warnings_list.append(f"Source analysis validation failed for source {index + 1}: {result}")
+                    status_manager.add_progress_log(
+                        task_id,
+                        "analyzing_sources",
+                        "validation_error",
+                        f"✗ Response validation failed for source {index + 1}: {result}"
+                    )
+                elif isinstance(result, BaseException):  # Any other unexpected errors
+                    logger.error(f"Error during analysis of source {index + 1}: {result}", exc_info=result)
+                    warnings_list.append(f"Critical error during analysis of source {index + 1}: {result}")
+                    status_manager.add_progress_log(
+                        task_id,
+                        "analyzing_sources",
+                        "critical_error",
+                        f"✗ Critical error for source {index + 1}: {result}"
+                    )
+                elif result:
+                    source_analyses.append(result)
+                else:
+                    logger.error(f"LLM source analysis returned no data for source {index + 1}.")
+                    warnings_list.append(f"LLM source analysis returned no data for source {index + 1}.")
+                    status_manager.add_progress_log(
+                        task_id,
+                        "analyzing_sources",
+                        "analysis_empty",
+                        f"⚠ LLM returned empty analysis for source {index + 1}"
+                    )
+            if source_analyses:
+                self._save_stage_checkpoint(
+                    task_id, "source_analysis", [analysis.model_dump(mode="json") for analysis in source_analyses]
+                )
+
+        if source_analyses:
+            logger.info("Source analysis successful.")
+            status_manager.add_progress_log(
+                task_id,
+                "analyzing_sources",
+                "llm_analysis_success",
+                f"✓ Generated {len(source_analyses)} source analyses with "
+                f"{sum(len(analysis.summary_points) for analysis in source_analyses)} points"
+            )
+
+        logger.info("STEP: Source Analysis phase complete.")
+        
+        # Update artifacts after source analysis (status is reported by the analysis graph)
+        if source_analyses:
+            status_manager.update_artifacts(
+                task_id,
+                source_analysis_complete=True
+            )
+        
+        # Check for cancellation after source analysis
+        if task_id:
+            self._check_cancellation(task_id)
+
+        return source_analyses
+
+    async def _run_persona_research_stage(
+        self,
+        task_id: str,
+        request_data: PodcastRequest,
+        extracted_text: str,
+        checkpoints: Dict[str, Any],
+        warnings_list: List[str]
+    ) -> List[PersonaResearch]:
+        """Research the requested prominent persons with the LLM."""
+        status_manager = get_status_manager()
+        persona_research_objects: List[PersonaResearch] = []
+
+        # 4. LLM - Persona Research (concurrent, bounded)
+        logger.info("STEP: Starting Persona Research...")
+        if "persona_research" in checkpoints:
+            persona_research_objects = [PersonaResearch(**pr) for pr in checkpoints["persona_research"]]
+            logger.info(f"Restored {len(persona_research_objects)} personas from checkpoint.")
+        elif request_data.prominent_persons and extracted_text:
+            status_manager.add_progress_log(
+                task_id,
+                "researching_personas",
+                "persona_research_start",
+                f"Researching {len(request_data.prominent_persons)} person(s): {', '.join(request_data.prominent_persons)}"
+            )
+            persona_research_objects = await self._research_personas_async(
+                task_id,
+                request_data.prominent_persons,
+                extracted_text,
+                warnings_list
+            )
+            self._save_stage_checkpoint(
+                task_id,
+                "persona_research",
+                [pr.model_dump(mode="json") for pr in persona_research_objects]
+            )
+        else:
+            logger.info("No prominent persons requested or no extracted text for persona research.")
+
+        logger.info(f"STEP: Persona Research complete. Found {len(persona_research_objects)} personas researched.")
+
+        # Update artifacts after persona research (status is reported by the analysis graph)
+        status_manager.update_artifacts(
+            task_id,
+            persona_research_complete=True
         )
 
-    def _check_cancellation(self, task_id: Optional[str] = None) -> None:
+        # Check for cancellation after persona research
+        if task_id:
+            self._check_cancellation(task_id)
+
+        return persona_research_objects
+
+    def _build_analysis_graph(
+        self,
+        task_id: str,
+        request_data: PodcastRequest,
+        checkpoints: Dict[str, Any],
+        warnings_list: List[str]
+    ) -> StageGraph:
         """
-        Check if the current task has been cancelled.
-        Raises CancelledError if the task was cancelled.
-        
-        Args:
-            task_id: Optional task ID to check. If not provided, checks current async task.
+        Build the stage graph that turns extracted text into source analyses and persona research.
+
+        Source analysis works on the individual source texts ("extracted_texts")
+        and persona research on the combined text ("extracted_text"); both answer
+        against the combined text's cached source context. Neither needs the
+        other's results, so they run concurrently and join at the outline stage. Whichever branch finishes first moves the
+        status to the branch still running (30%); the caller reports the join.
         """
-        if not task_id:
-            # For async tasks, we'll need to get the task_id from context
-            # This is simplified since we're moving away from thread-based execution
-            return
-        
-        # Check if this task has been cancelled
-        task_runner = get_task_runner()
-        if task_id in task_runner._running_tasks:
-            task = task_runner._running_tasks[task_id]
-            if task.cancelled():
-                raise asyncio.CancelledError(f"Task {task_id} was cancelled")
+        status_manager = get_status_manager()
+        finished_branches: List[str] = []
 
-    def _select_host_voice(self, gender: str, used_voice_ids: set[str]) -> Tuple[str, Dict[str, float]]:
-        """Select a host voice profile from the TTS cache avoiding conflicts."""
-        default_profile = {"voice_id": "en-US-Chirp3-HD-Achird", "speaking_rate": 1.0}
-        if not self.tts_service:
-            logger.warning("TTS service unavailable, using fallback host voice")
-            return default_profile["voice_id"], {
-                "speaking_rate": default_profile["speaking_rate"]
-            }
+        def report_branch_finished(branch: str, remaining_status: PodcastProgressStatus, description: str) -> None:
+            finished_branches.append(branch)
+            if len(finished_branches) == 1:
+                status_manager.update_status(task_id, remaining_status, description, 30.0)
+
+        async def source_analysis_stage(inputs: Dict[str, Any]) -> Dict[str, Any]:
+            source_analyses = await self._run_source_analysis_stage(
+                task_id, inputs["extracted_texts"], checkpoints, warnings_list, inputs["extracted_text"]
+            )
+            if source_analyses:
+                key_points = sum(len(analysis.summary_points) for analysis in source_analyses)
+                description = f"Analyzed {len(source_analyses)} sources with {key_points} key points, researching personas"
+            else:
+                description = "Source analysis unavailable, researching personas"
+            report_branch_finished("source_analysis", "researching_personas", description)
+            return {"source_analyses": source_analyses}
+
+        async def persona_research_stage(inputs: Dict[str, Any]) -> Dict[str, Any]:
+            persona_research_objects = await self._run_persona_research_stage(
+                task_id, request_data, inputs["extracted_text"], checkpoints, warnings_list
+            )
+            report_branch_finished(
+                "persona_research",
+                "analyzing_sources",
+                f"Researched {len(persona_research_objects)} personas, analyzing sources"
+            )
+            return {"persona_research": persona_research_objects}
+
+        return StageGraph([
+            WorkflowStage(
+                name="source_analysis",
+                run=source_analysis_stage,
+                requires=("extracted_texts", "extracted_text"),
+                provides=("source_analyses",)
+            ),
+            WorkflowStage(
+                name="persona_research",
+                run=persona_research_stage,
+                requires=("extracted_text",),
+                provides=("persona_research",)
+            ),
+        ])
+
+    async def _run_analysis_branches_async(
+        self,
+        task_id: str,
+        request_data: PodcastRequest,
+        extracted_text: str,
+        extracted_texts: List[str],
+        checkpoints: Dict[str, Any],
+        warnings_list: List[str]
+    ) -> Dict[str, Any]:
+        """Run the analysis graph, then release the cached source context both branches shared."""
         try:
-            voices = self.tts_service.get_voices_by_gender(gender)
-            logger.debug(f"Retrieved {len(voices)} voices for host gender '{gender}'")
-            available = [v for v in voices if v.get("voice_id") not in used_voice_ids]
-            if not available:
-                logger.debug("All host voices in use; allowing reuse")
-                available = voices
-            if not available:
-                logger.warning(f"No voices available for gender '{gender}', using default")
-                return default_profile["voice_id"], {
-                    "speaking_rate": default_profile["speaking_rate"]
-                }
-            chosen = random.choice(available)
-            voice_id = chosen.get("voice_id", default_profile["voice_id"])
-            params = {
-                "speaking_rate": chosen.get("speaking_rate", default_profile["speaking_rate"])
-            }
-            logger.debug(
-                f"Host voice selected: {voice_id}, Params: {{'speaking_rate': {params['speaking_rate']}}}"
+            return await self._build_analysis_graph(
+                task_id, request_data, checkpoints, warnings_list
+            ).run(
+                {"extracted_text": extracted_text, "extracted_texts": extracted_texts},
+                check_cancelled=lambda: self._check_cancellation(task_id)
             )
-            return voice_id, params
-        except Exception as e:
-            logger.error(f"Error selecting host voice: {e}")
-            return default_profile["voice_id"], {
-                "speaking_rate": default_profile["speaking_rate"]
-            }
+        finally:
+            if get_config().llm_source_context_caching:
+                await self.llm_service.release_source_context_async(extracted_text)
 
     async def _execute_podcast_generation_core(self, task_id: str, request_data: PodcastRequest) -> PodcastEpisode:
         """
@@ -420,21 +1805,33 @@ class PodcastGeneratorService:
             return error_episode
 
         # Initialize containers for intermediate data - use Pydantic objects directly (Phase 5)
-        source_analysis_obj: Optional[SourceAnalysis] = None  # Direct Pydantic object storage
+        source_analyses: List[SourceAnalysis] = []  # One analysis per extracted source
         persona_research_objects: List[PersonaResearch] = []  # Direct Pydantic object storage
         llm_podcast_outline_filepath: Optional[str] = None
         llm_dialogue_turns_filepath: Optional[str] = None
         llm_transcript_filepath: Optional[str] = None
         individual_turn_audio_paths: List[str] = [] # NEW: To hold paths to individual dialogue turn audio files
+        turn_audio_index: Optional[List[TurnAudioSpan]] = None  # Start of each turn within those files
+        episode_preview: Optional[EpisodePreview] = None  # Published until the final episode replaces it
 
         podcast_title = "Generation Incomplete"
         podcast_summary = "Full generation pending or failed at an early stage."
         podcast_transcript = "Transcript generation pending."
         podcast_episode_data: dict = {} # Initialize the dictionary
 
+        # Outputs of stages completed by a previous run of this task (see resume_podcast_generation_async)
+        checkpoints = self._load_stage_checkpoints(task_id)
+
         # Create a non-cleaning temporary directory for testing
         tmpdir_path = tempfile.mkdtemp(prefix="podcast_job_")
         logger.info(f"Created NON-CLEANING temporary directory for podcast job: {tmpdir_path}")
+
+        # Synthesized turn audio is handed to upload, preview and stitching in memory
+        audio_store: Optional[InMemoryAudioStore] = None
+        audio_store_token = None
+        if get_config().tts_audio_in_memory:
+            audio_store = InMemoryAudioStore(get_config().tts_audio_memory_max_bytes)
+            audio_store_token = current_audio_store.set(audio_store)
         
         try:
             logger.info(f"STEP_ENTRY: Core processing for request_data.source_urls: {request_data.source_urls}, request_data.source_pdf_path: {request_data.source_pdf_path}")
@@ -447,42 +1844,44 @@ class PodcastGeneratorService:
             extracted_texts: List[str] = []
             source_attributions = []
             
-            # Process multiple URLs if provided
-            if request_data.source_urls:
-                for url in request_data.source_urls:
+            if "extraction" in checkpoints:
+                extracted_texts = checkpoints["extraction"]["texts"]
+                source_attributions = checkpoints["extraction"]["source_attributions"]
+                logger.info(f"Restored {len(extracted_texts)} extracted sources from checkpoint.")
+                status_manager.add_progress_log(
+                    task_id,
+                    "preprocessing_sources",
+                    "checkpoint_restored",
+                    f"Restored {len(extracted_texts)} extracted sources from checkpoint"
+                )
+            else:
+                # Process multiple URLs concurrently if provided
+                if request_data.source_urls:
+                    extracted_texts, source_attributions = await self._extract_sources_async(
+                        request_data.source_urls,
+                        warnings_list
+                    )
+            
+                # Process PDF if provided (as a fallback or additional source)
+                if request_data.source_pdf_path and not extracted_texts:  # Only use PDF if no URLs worked
                     try:
-                        # Check if this is a YouTube URL and handle accordingly
-                        if is_valid_youtube_url(str(url)):
-                            logger.info(f"Detected YouTube URL, extracting transcript: {url}")
-                            text = await extract_transcript_from_youtube(str(url))
-                        else:
-                            logger.info(f"Processing general URL: {url}")
-                            text = await extract_content_from_url(str(url))
-                        
+                        pdf_path_str = str(request_data.source_pdf_path)
+                        text = await extract_text_from_pdf_path(pdf_path_str)
                         if text:
                             extracted_texts.append(text)
-                            source_attributions.append(url)
-                            logger.info(f"Successfully extracted text from URL: {url}")
+                            source_attributions.append(pdf_path_str)
+                            logger.info(f"Successfully extracted text from PDF path: {pdf_path_str}")
                         else:
-                            logger.warning(f"Empty content extracted from URL: {url}")
+                            logger.warning(f"Empty content extracted from PDF: {pdf_path_str}")
                     except ExtractionError as e:
-                        logger.error(f"Content extraction from URL {url} failed: {e}")
-                        warnings_list.append(f"Failed to extract content from URL {url}: {e}")
-            
-            # Process PDF if provided (as a fallback or additional source)
-            if request_data.source_pdf_path and not extracted_texts:  # Only use PDF if no URLs worked
-                try:
-                    pdf_path_str = str(request_data.source_pdf_path)
-                    text = await extract_text_from_pdf_path(pdf_path_str)
-                    if text:
-                        extracted_texts.append(text)
-                        source_attributions.append(pdf_path_str)
-                        logger.info(f"Successfully extracted text from PDF path: {pdf_path_str}")
-                    else:
-                        logger.warning(f"Empty content extracted from PDF: {pdf_path_str}")
-                except ExtractionError as e:
-                    logger.error(f"Content extraction from PDF path {request_data.source_pdf_path} failed: {e}")
-                    warnings_list.append(f"Failed to extract content from PDF: {e}")
+                        logger.error(f"Content extraction from PDF path {request_data.source_pdf_path} failed: {e}")
+                        warnings_list.append(f"Failed to extract content from PDF: {e}")
+                
+                if extracted_texts:
+                    self._save_stage_checkpoint(task_id, "extraction", {
+                        "texts": extracted_texts,
+                        "source_attributions": [str(attribution) for attribution in source_attributions]
+                    })
             
             # Combine all extracted texts with source markers
             combined_text = ""
@@ -527,187 +1926,20 @@ class PodcastGeneratorService:
             if task_id:
                 self._check_cancellation(task_id)
             
-            # 3. LLM - Source Analysis
-            logger.info("STEP: Starting Source Analysis...")
-            
-            status_manager.add_progress_log(
-                task_id,
-                "analyzing_sources",
-                "llm_source_analysis_start",
-                f"Analyzing {len(extracted_text):,} characters of content"
+            # 3-4. LLM - Source Analysis and Persona Research (concurrent branches)
+            analysis_results = await self._run_analysis_branches_async(
+                task_id, request_data, extracted_text, extracted_texts, checkpoints, warnings_list
             )
-            
-            try:
-                logger.info("STEP: Attempting LLM Source Analysis...")
-                status_manager.add_progress_log(
-                    task_id,
-                    "analyzing_sources",
-                    "llm_processing",
-                    "Sending content to LLM for analysis"
-                )
-                
-                # llm_service.analyze_source_text_async now returns a SourceAnalysis object directly or raises an error
-                source_analysis_obj = await self.llm_service.analyze_source_text_async(
-                    extracted_text, 
-                    analysis_instructions=""  # Using empty string as default analysis instructions
-                )
-                
-                if source_analysis_obj:
-                    logger.info("Source analysis successful.")
-                    status_manager.add_progress_log(
-                        task_id,
-                        "analyzing_sources",
-                        "llm_analysis_success",
-                        f"✓ Generated analysis with {len(source_analysis_obj.summary_points)} points"
-                    )
-                    
-                    logger.info(f"Source analysis created successfully: {source_analysis_obj is not None}")
-                    
-                    status_manager.add_progress_log(
-                        task_id,
-                        "analyzing_sources",
-                        "analysis_saved",
-                        f"Analysis saved to memory"
-                    )
-                else:
-                    # This case should ideally not be reached if analyze_source_text_async raises an error on failure or returns None
-                    logger.error("LLM source analysis returned no data (or None unexpectedly).")
-                    warnings_list.append("LLM source analysis returned no data.")
-                    status_manager.add_progress_log(
-                        task_id,
-                        "analyzing_sources",
-                        "analysis_empty",
-                        "⚠ LLM returned empty analysis"
-                    )
-
-            except LLMProcessingError as llm_e: # Catch specific LLM errors from the service
-                logger.error(f"LLM processing error during source analysis: {llm_e}")
-                warnings_list.append(f"LLM source analysis failed: {llm_e}")
-                status_manager.add_progress_log(
-                    task_id,
-                    "analyzing_sources",
-                    "llm_processing_error",
-                    f"✗ LLM processing failed: {llm_e}"
-                )
-            except ValidationError as val_e: # Catch Pydantic validation errors (e.g., if service returns malformed data that passes initial parsing but fails model validation)
-                logger.error(f"Validation error during source analysis processing: {val_e}")
-                warnings_list.append(f"Source analysis validation failed: {val_e}")
-                status_manager.add_progress_log(
-                    task_id,
-                    "analyzing_sources",
-                    "validation_error", 
-                    f"✗ Response validation failed: {val_e}"
-                )
-            except Exception as e: # Catch any other unexpected errors
-                logger.error(f"Error during source analysis: {e}", exc_info=True)
-                warnings_list.append(f"Critical error during source analysis: {e}")
-                status_manager.add_progress_log(
-                    task_id,
-                    "analyzing_sources",
-                    "critical_error",
-                    f"✗ Critical error: {e}"
-                )
-
-            logger.info("STEP: Source Analysis phase complete.")
-            
-            # Update status after source analysis
-            if source_analysis_obj:
-                status_manager.update_status(
-                    task_id,
-                    "researching_personas",
-                    f"Source analysis complete, researching personas with {len(source_analysis_obj.summary_points)} key points",
-                    30.0
-                )
-                status_manager.update_artifacts(
-                    task_id,
-                    source_analysis_complete=True
-                )
-            
-            # Check for cancellation after source analysis
-            if task_id:
-                self._check_cancellation(task_id)
-            
-            # 4. LLM - Persona Research (Iterative)
-            logger.info("STEP: Starting Persona Research...")
-            if request_data.prominent_persons and extracted_text:
-                status_manager.add_progress_log(
-                    task_id,
-                    "researching_personas",
-                    "persona_research_start",
-                    f"Researching {len(request_data.prominent_persons)} person(s): {', '.join(request_data.prominent_persons)}"
-                )
-                
-                for person_name in request_data.prominent_persons:
-                    try:
-                        logger.info(f"STEP: Attempting Persona Research for '{person_name}'...")
-                        status_manager.add_progress_log(
-                            task_id,
-                            "researching_personas",
-                            "persona_research_individual",
-                            f"Researching {person_name}"
-                        )
-                        
-                        persona_research_obj = await self.llm_service.research_persona_async(
-                            source_text=extracted_text, person_name=person_name
-                        )
-                        if persona_research_obj:
-                            logger.info(f"STEP: Persona Research for '{person_name}' successful. Object created.")
-                            status_manager.add_progress_log(
-                                task_id,
-                                "researching_personas",
-                                "persona_research_success",
-                                f"✓ Generated persona research for {person_name}"
-                            )
-                            
-                            persona_research_objects.append(persona_research_obj)
-                            logger.info(f"Persona research for {person_name} saved to memory")
-                            logger.info(f"STEP: Persona Research object created successfully: {persona_research_obj is not None}")
-                            
-                            status_manager.add_progress_log(
-                                task_id,
-                                "researching_personas",
-                                "persona_saved",
-                                f"Research saved to memory: {person_name}"
-                            )
-                        else:
-                            logger.error(f"Persona research for {person_name} returned None.")
-                            warnings_list.append(f"Persona research for {person_name} failed to produce a result.")
-                            status_manager.add_progress_log(
-                                task_id,
-                                "researching_personas",
-                                "persona_research_empty",
-                                f"⚠ Persona research for {person_name} returned no data"
-                            )
-                    except ValueError as e:
-                        logger.error(f"Persona research for {person_name} failed (ValueError): {e}", exc_info=True)
-                        warnings_list.append(f"Persona research for {person_name} failed: {e}")
-                        logger.error(f"STEP: Persona Research for '{person_name}' FAILED.")
-                        status_manager.add_progress_log(
-                            task_id,
-                            "researching_personas",
-                            "persona_research_error",
-                            f"✗ Persona research failed for {person_name}: {e}"
-                        )
-            else:
-                logger.info("No prominent persons requested or no extracted text for persona research.")
+            source_analyses = analysis_results["source_analyses"]
+            persona_research_objects = analysis_results["persona_research"]
 
-            logger.info(f"STEP: Persona Research complete. Found {len(persona_research_objects)} personas researched.")
-
-            # Update status after persona research
+            # Join point: both branches are done, move on to the outline
             status_manager.update_status(
                 task_id,
                 "generating_outline",
-                f"Researched {len(persona_research_objects)} personas, generating outline",
+                f"Source analysis {'complete' if source_analyses else 'unavailable'}, researched {len(persona_research_objects)} personas, generating outline",
                 45.0
             )
-            status_manager.update_artifacts(
-                task_id,
-                persona_research_complete=True
-            )
-
-            # Check for cancellation after persona research
-            if task_id:
-                self._check_cancellation(task_id)
             
             # 4.5. Assign Invented Names and Genders to Personas
             logger.info("STEP: Assigning invented names and genders to personas...")
@@ -776,7 +2008,7 @@ class PodcastGeneratorService:
             podcast_outline_obj: Optional[PodcastOutline] = None
             if extracted_text:
                 # Check if we have source analysis data
-                has_source_analysis = bool(source_analysis_obj)
+                has_source_analysis = bool(source_analyses)
                 if not has_source_analysis:
                     logger.warning("Source analysis failed, but continuing with outline generation using extracted text only")
                     warnings_list.append("Outline generated without source analysis due to LLM processing errors")
@@ -802,7 +2034,7 @@ class PodcastGeneratorService:
                     )
 
                     # If source analysis is missing, create a minimal fallback analysis from extracted text
-                    fallback_source_analyses = [source_analysis_obj] if source_analysis_obj else []
+                    fallback_source_analyses = list(source_analyses)
                     if not has_source_analysis and extracted_text:
                         logger.info("Creating fallback source analysis for outline generation")
                         # Create a simple analysis structure that the outline generation can use
@@ -819,16 +2051,22 @@ class PodcastGeneratorService:
                             "⚠ Created fallback analysis for outline generation"
                         )
 
-                    # Fix None parameter passing issues for generate_podcast_outline_async method call
-                    podcast_outline_obj = await self.llm_service.generate_podcast_outline_async(
-                        source_analyses=fallback_source_analyses or [],  # Ensure never None
-                        persona_research_docs=persona_research_objects,
-                        desired_podcast_length_str=desired_length_str or "5-7 minutes",
-                        num_prominent_persons=num_persons,
-                        names_prominent_persons_list=request_data.prominent_persons or [],
-                        persona_details_map=persona_details_map,
-                        user_provided_custom_prompt=request_data.custom_prompt_for_outline or ""
-                    )
+                    if "outline" in checkpoints:
+                        podcast_outline_obj = PodcastOutline(**checkpoints["outline"])
+                        logger.info("Restored podcast outline from checkpoint.")
+                    else:
+                        # Fix None parameter passing issues for generate_podcast_outline_async method call
+                        podcast_outline_obj = await self.llm_service.generate_podcast_outline_async(
+                            source_analyses=fallback_source_analyses or [],  # Ensure never None
+                            persona_research_docs=persona_research_objects,
+                            desired_podcast_length_str=desired_length_str or "5-7 minutes",
+                            num_prominent_persons=num_persons,
+                            names_prominent_persons_list=request_data.prominent_persons or [],
+                            persona_details_map=persona_details_map,
+                            user_provided_custom_prompt=request_data.custom_prompt_for_outline or ""
+                        )
+                        if podcast_outline_obj:
+                            self._save_stage_checkpoint(task_id, "outline", podcast_outline_obj.model_dump(mode="json"))
                     if podcast_outline_obj:
                         logger.info("Podcast outline generated successfully.")
                         status_manager.add_progress_log(
@@ -902,9 +2140,27 @@ class PodcastGeneratorService:
             if task_id:
                 self._check_cancellation(task_id)
             
+            # Preview episode published while dialogue and audio are still being produced
+            episode_preview = EpisodePreview(
+                task_id,
+                PodcastEpisode(
+                    title=podcast_title,
+                    summary=podcast_summary,
+                    transcript="",
+                    audio_filepath="",
+                    source_attributions=[str(attribution) for attribution in source_attributions],
+                    warnings=[],
+                    llm_podcast_outline_path=llm_podcast_outline_filepath
+                ),
+                os.path.join(tmpdir_path, "preview.mp3"),
+                get_config().preview_audio_publish_every_turns,
+                self.cloud_storage_manager
+            )
+            
             # 6. LLM - Dialogue Turns Generation
             logger.info("STEP: Starting Dialogue Turns Generation...")
             dialogue_turns_list: Optional[List[DialogueTurn]] = None
+            tts_streamed = False  # True when TTS already ran alongside dialogue generation
             if podcast_outline_obj and extracted_text:
                 status_manager.add_progress_log(
                     task_id,
@@ -933,10 +2189,10 @@ class PodcastGeneratorService:
 
                     # Convert JSON strings to Pydantic objects using migration helpers for safe transition
                     source_analysis_objects = []
-                    if source_analysis_obj: # Should always be true if we reached here
+                    if source_analyses: # Should always be true if we reached here
                         # Use migration helper for safe conversion
                         try:
-                            source_analysis_objects = [source_analysis_obj]
+                            source_analysis_objects = list(source_analyses)
                             if not source_analysis_objects:
                                 logger.warning("No valid source analyses found after parsing")
                                 warnings_list.append("Failed to process source analysis for dialogue generation.")
@@ -966,14 +2222,37 @@ class PodcastGeneratorService:
                         f"Sending outline and context to LLM for dialogue generation with {len(source_analysis_objects)} sources and {len(persona_research_objects_for_dialogue)} personas"
                     )
 
-                    # PHASE 3: Use new generate_with_fallback method for robust dialogue generation
-                    dialogue_turns_list = await self.llm_service.generate_dialogue_async(
-                        podcast_outline=podcast_outline_obj,
-                        source_analyses=source_analysis_objects, 
-                        persona_research_docs=persona_research_objects_for_dialogue,
-                        persona_details_map=persona_details_map,  # Keep for backward compatibility during transition
-                        user_custom_prompt_for_dialogue=request_data.custom_prompt_for_dialogue or ""
-                    )
+                    if "dialogue" in checkpoints:
+                        dialogue_turns_list = [DialogueTurn(**turn) for turn in checkpoints["dialogue"]]
+                        logger.info(f"Restored {len(dialogue_turns_list)} dialogue turns from checkpoint.")
+                    elif get_config().dialogue_tts_streaming and self.tts_service:
+                        # Pipelined mode: TTS for each segment starts while later segments are written
+                        turn_audio_index = []
+                        dialogue_turns_list, individual_turn_audio_paths = await self._generate_dialogue_with_streaming_audio_async(
+                            task_id,
+                            podcast_outline_obj,
+                            source_analysis_objects,
+                            persona_research_objects_for_dialogue,
+                            persona_details_map,
+                            request_data.custom_prompt_for_dialogue or "",
+                            persona_research_map,
+                            tmpdir_path,
+                            warnings_list,
+                            episode_preview,
+                            turn_audio_index
+                        )
+                        tts_streamed = True
+                    else:
+                        # PHASE 3: Use new generate_with_fallback method for robust dialogue generation
+                        dialogue_turns_list = await self.llm_service.generate_dialogue_async(
+                            podcast_outline=podcast_outline_obj,
+                            source_analyses=source_analysis_objects, 
+                            persona_research_docs=persona_research_objects_for_dialogue,
+                            persona_details_map=persona_details_map,  # Keep for backward compatibility during transition
+                            user_custom_prompt_for_dialogue=request_data.custom_prompt_for_dialogue or ""
+                        )
+                    if dialogue_turns_list and "dialogue" not in checkpoints:
+                        self._save_stage_checkpoint(task_id, "dialogue", [turn.model_dump(mode="json") for turn in dialogue_turns_list])
                     if dialogue_turns_list:
                         logger.info(f"Podcast dialogue turns generated successfully ({len(dialogue_turns_list)} turns).")
                         status_manager.add_progress_log(
@@ -1035,6 +2314,12 @@ class PodcastGeneratorService:
                             "transcript_constructed",
                             f"✓ Transcript created: {len(podcast_transcript)} characters, {'using PodcastDialogue' if podcast_dialogue else 'using legacy method'}"
                         )
+                        
+                        # Publish the transcript and outline before audio generation starts
+                        episode_preview.episode.transcript = podcast_transcript
+                        episode_preview.episode.llm_transcript_path = llm_transcript_filepath
+                        episode_preview.episode.warnings = list(warnings_list)
+                        episode_preview.publish()
                     else:
                         logger.error("Dialogue generation returned None or empty list of turns.")
                         warnings_list.append("Dialogue generation failed to produce turns.")
@@ -1072,8 +2357,8 @@ class PodcastGeneratorService:
 
             logger.info("STEP: Dialogue Turns Generation phase complete.")
             
-            # Update status after dialogue generation
-            if dialogue_turns_list:
+            # Update status after dialogue generation (streaming mode already reported it)
+            if dialogue_turns_list and not tts_streamed:
                 status_manager.update_status(
                     task_id,
                     "generating_audio_segments",
@@ -1091,7 +2376,9 @@ class PodcastGeneratorService:
             
             # 7. TTS Generation for Dialogue Turns
             logger.info("STEP: Starting TTS generation for dialogue turns...")
-            if dialogue_turns_list and self.tts_service:
+            if tts_streamed:
+                logger.info(f"STEP: TTS already completed alongside dialogue generation. {len(individual_turn_audio_paths)} audio files generated.")
+            elif dialogue_turns_list and self.tts_service:
                 status_manager.add_progress_log(
                     task_id,
                     "generating_audio_segments",
@@ -1110,105 +2397,16 @@ class PodcastGeneratorService:
                     f"Created audio directory: {os.path.basename(audio_segments_dir)}"
                 )
 
-                total_turns = len(dialogue_turns_list)
-                for i, turn in enumerate(dialogue_turns_list):
-                    # Update status with incremental progress
-                    progress = 75.0 + (15.0 * (i / total_turns))  # Progress from 75% to 90%
-                    status_manager.update_status(
-                        task_id,
-                        "generating_audio_segments",
-                        f"Generating audio {i+1}/{total_turns} - {turn.speaker_id}",
-                        progress
-                    )
-                    
-                    status_manager.add_progress_log(
-                        task_id,
-                        "generating_audio_segments",
-                        "tts_turn_start",
-                        f"Processing turn {i+1}/{total_turns}: {turn.speaker_id}"
-                    )
-                    
-                    turn_audio_filename = f"turn_{i:03d}_{turn.speaker_id.replace(' ','_')}.mp3"
-                    turn_audio_filepath = os.path.join(audio_segments_dir, turn_audio_filename)
-                    logger.info(f"Generating TTS for turn {i} (Speaker: {turn.speaker_id}): {turn.text[:50]}...")
-                    try:
-                        logger.info(f"STEP: Attempting TTS for turn {i}...")
-                        
-                        # Initialize voice parameters
-                        voice_name = None
-                        speaker_gender = None
-                        voice_params = None
-                        
-                        # Try to find matching persona with voice info
-                        if turn.speaker_id in persona_research_map:
-                            pr = persona_research_map[turn.speaker_id]
-                            # Priority 1: Use specific voice ID if available
-                            if pr.tts_voice_id:
-                                voice_name = pr.tts_voice_id
-                                logger.info(f"Using specific voice ID for {turn.speaker_id}: {voice_name}")
-                            # Priority 2: Use gender if no specific voice
-                            elif pr.gender:
-                                speaker_gender = pr.gender
-                                logger.info(f"Using gender from PersonaResearch for {turn.speaker_id}: {speaker_gender}")
-                            # Priority 3: Use voice params if available
-                            if pr.tts_voice_params:
-                                voice_params = pr.tts_voice_params
-                        # Fallback to turn.speaker_gender if no persona found
-                        elif hasattr(turn, 'speaker_gender') and turn.speaker_gender:
-                            speaker_gender = turn.speaker_gender
-                            logger.info(f"Falling back to turn.speaker_gender for {turn.speaker_id}: {speaker_gender}")
-                        # No PersonaResearch or speaker_gender available - log warning and use default
-                        else:
-                            logger.warning(f"No PersonaResearch or speaker_gender found for {turn.speaker_id}. Using default Neutral voice.")
-                            speaker_gender = "Neutral"
-                            logger.warning(f"No voice information found for {turn.speaker_id}, defaulting to Neutral gender")
-                        
-                        # Make the TTS call with all available voice parameters
-                        success = await self.tts_service.text_to_audio_async(
-                            text_input=turn.text,
-                            output_filepath=turn_audio_filepath,
-                            speaker_gender=speaker_gender or "Neutral",  # Provide default
-                            voice_name=voice_name or "",  # Provide default
-                            voice_params=voice_params or {}  # Provide default
-                        )
-                        if success:
-                            individual_turn_audio_paths.append(turn_audio_filepath)
-                            logger.info(f"STEP: TTS for turn {i} successful. Audio saved to {turn_audio_filepath}")
-                            logger.info(f"Generated audio for turn {i}: {turn_audio_filepath}")
-                            status_manager.add_progress_log(
-                                task_id,
-                                "generating_audio_segments",
-                                "tts_turn_success",
-                                f"✓ Generated audio for turn {i+1}: {turn.speaker_id}"
-                            )
-                            # Upload the individual audio segment to cloud storage
-                            if self.cloud_storage_manager:
-                                try:
-                                    logger.info(f"Uploading individual audio segment to cloud storage: {turn_audio_filepath}")
-                                    await self.cloud_storage_manager.upload_audio_segment_async(turn_audio_filepath)
-                                    logger.info(f"Individual audio segment uploaded to cloud storage successfully: {turn_audio_filepath}")
-                                except Exception as e:
-                                    logger.error(f"Error uploading individual audio segment to cloud storage: {e}")
-                                    warnings_list.append(f"Error uploading individual audio segment to cloud storage: {e}")
-                        else:
-                            logger.warning(f"STEP: TTS for turn {i} FAILED. Skipping audio for this turn.")
-                            logger.warning(f"TTS generation failed for turn {i}. Skipping audio for this turn.")
-                            warnings_list.append(f"TTS failed for turn {i}: {turn.text[:30]}...")
-                            status_manager.add_progress_log(
-                                task_id,
-                                "generating_audio_segments",
-                                "tts_turn_failed",
-                                f"✗ TTS failed for turn {i+1}: {turn.speaker_id}"
-                            )
-                    except Exception as e:
-                        logger.error(f"Error during TTS for turn {i}: {e}", exc_info=True)
-                        warnings_list.append(f"TTS critical error for turn {i}: {e}")
-                        status_manager.add_progress_log(
-                            task_id,
-                            "generating_audio_segments",
-                            "tts_turn_error",
-                            f"✗ Critical TTS error for turn {i+1}: {e}"
-                        )
+                turn_audio_index = []
+                individual_turn_audio_paths = await self._generate_dialogue_audio_async(
+                    task_id,
+                    dialogue_turns_list,
+                    persona_research_map,
+                    audio_segments_dir,
+                    warnings_list,
+                    episode_preview,
+                    turn_audio_index
+                )
                 
                 logger.info(f"STEP: TTS generation for all turns complete. {len(individual_turn_audio_paths)} audio files generated.")
                 status_manager.add_progress_log(
@@ -1364,7 +2562,8 @@ class PodcastGeneratorService:
                 llm_podcast_outline_path=llm_podcast_outline_filepath,
                 llm_dialogue_turns_path=llm_dialogue_turns_filepath,
                 llm_transcript_path=llm_transcript_filepath,
-                dialogue_turn_audio_paths=individual_turn_audio_paths
+                dialogue_turn_audio_paths=individual_turn_audio_paths,
+                dialogue_turn_audio_index=turn_audio_index or None
             )
             logger.info(f"STEP_COMPLETED_TRY_BLOCK: PodcastEpisode object created. Title: {podcast_episode.title}, Audio: {podcast_episode.audio_filepath}, Warnings: {len(podcast_episode.warnings)}")
             
@@ -1463,7 +2662,14 @@ class PodcastGeneratorService:
             
             return podcast_episode
 
+        except asyncio.CancelledError:
+            if episode_preview:
+                episode_preview.discard()
+            raise
+
         except Exception as main_e:
+            if episode_preview:
+                episode_preview.discard()
             logger.critical(f"STEP_CRITICAL_FAILURE: Unhandled exception in core processing: {main_e}", exc_info=True)
             warnings_list.append(f"CRITICAL FAILURE: {main_e}")
             
@@ -1480,6 +2686,14 @@ class PodcastGeneratorService:
                 warnings=warnings_list
             )
         finally:
+            if audio_store is not None:
+                # Write segments still in memory to their paths, which the episode refers to
+                try:
+                    spilled = await asyncio.to_thread(audio_store.spill_all)
+                    logger.info(f"STEP_FINALLY: Wrote {spilled} in-memory audio segments to {tmpdir_path}")
+                except Exception as e:
+                    logger.error(f"STEP_FINALLY: Failed to write in-memory audio segments: {e}")
+                current_audio_store.reset(audio_store_token)
             if 'tmpdir_path' in locals():
                 logger.info(f"STEP_FINALLY: Temporary directory (NOT cleaned up): {tmpdir_path}")
             # Note: We're NOT removing tmpdir_path for debugging purposes
@@ -4,14 +4,18 @@ Prompt templates for MySalonCast LLM service.
 
 from .templates import (
     SOURCE_ANALYSIS_TEMPLATE,
+    SOURCE_ANALYSIS_REDUCE_TEMPLATE,
     PERSONA_RESEARCH_TEMPLATE,
     PODCAST_OUTLINE_TEMPLATE,
     SEGMENT_DIALOGUE_TEMPLATE,
+    DIALOGUE_TRANSITION_TEMPLATE,
 )
 
 __all__ = [
     "SOURCE_ANALYSIS_TEMPLATE",
+    "SOURCE_ANALYSIS_REDUCE_TEMPLATE",
     "PERSONA_RESEARCH_TEMPLATE", 
     "PODCAST_OUTLINE_TEMPLATE",
     "SEGMENT_DIALOGUE_TEMPLATE",
+    "DIALOGUE_TRANSITION_TEMPLATE",
 ]
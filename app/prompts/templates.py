@@ -55,6 +55,24 @@ Analyze this text:
 {source_text}
 ---"""
 
+# Reduce step of chunked source analysis: merges per-chunk analyses into one briefing
+SOURCE_ANALYSIS_REDUCE_TEMPLATE = """You are an expert research analyst and debate coach. A long source document was split into {chunk_count} consecutive parts, and each part was analyzed separately into a briefing with "summary_points" and "detailed_analysis". Your task is to merge these partial briefings into ONE comprehensive and balanced briefing for the whole document, following the same standards as the partial briefings: objective, data-driven, and highlighting evidence that supports multiple sides of a debate.
+
+Merging Instructions:
+
+1. summary_points:
+Combine the summary points of all parts into one JSON list of strings. Merge points that describe the same fact or argument, keep every distinct key statistic, date, figure, name and outcome, and order the points so they follow the structure of the whole document. Do not drop points just because they come from a later part.
+
+2. detailed_analysis:
+Write a single string of 500-1000 words that weaves the partial analyses into one coherent narrative. Identify the 3-5 central themes of the whole document (themes may span several parts), the core tensions and evidence for each side, points of genuine controversy, and any biases or limitations of the source. Do not describe the document as having been split into parts.
+
+Your final output MUST be a single JSON object with exactly two keys: "summary_points" and "detailed_analysis".
+
+Partial briefings, in document order:
+---
+{partial_analyses}
+---"""
+
 # Persona research prompt template
 PERSONA_RESEARCH_TEMPLATE = """
 You are a debate coach and you are preparing {person_name} for a podcast appearance. Your work will contribute to a podcast aiming to be educational, entertaining, and to highlight viewpoint diversity by authentically representing {person_name}'s perspectives.
@@ -280,6 +298,8 @@ Instructions:
 
 {source_guidance}
 
+{continuity_guidance}
+
 Output Format:
 Provide the dialogue as a JSON array of dialogue turn objects. Each object should have:
 - "turn_id": A sequential number starting from the provided current_turn_id
@@ -293,3 +313,17 @@ Example format:
 
 {user_custom_prompt}
 """
+
+# Smoothing pass for dialogue segments generated in parallel: rewrites the two turns at a segment boundary
+DIALOGUE_TRANSITION_TEMPLATE = """You are an expert podcast dialogue editor. The podcast "{podcast_title}" was written segment by segment, and the segments were written independently. Below are the last turn of one segment and the first turn of the next segment.
+
+Previous segment: {previous_segment_title}
+Next segment: {next_segment_title}
+
+Rewrite these two turns so the conversation flows naturally from one segment into the next: remove repeated greetings, introductions or sign-offs, and add a brief transition where the topic changes. Keep each turn's speaker, meaning, facts and approximate length. Do not add or remove turns.
+
+Your final output MUST be a JSON object with a single key "turns": a list of exactly two dialogue turn objects, in the same order as the input, each with "turn_id", "speaker_id", "text" and "source_mentions".
+
+Turns to rewrite:
+{boundary_turns}
+"""
@@ -0,0 +1,94 @@
+"""
+Gemini context caching for extracted source text.
+
+Source analysis and every persona research call embed the same (often very long)
+source text. With context caching the text is uploaded once as a cached context
+and each prompt only references it, so repeated input tokens are billed at the
+cached rate and time-to-first-token drops.
+"""
+
+import asyncio
+import json
+import logging
+from datetime import timedelta
+from typing import Any, Optional
+
+import google.generativeai as genai
+from google.generativeai.types import GenerationConfig
+from pydantic import TypeAdapter, ValidationError
+
+from app.llm_output_repair import StructuredOutputError
+
+logger = logging.getLogger(__name__)
+
+# Stands in for the source text in prompts answered against a cached context
+SOURCE_CONTEXT_REFERENCE = "[The full source text is provided in the cached context of this conversation.]"
+
+SOURCE_CONTEXT_INSTRUCTION = (
+    "The following document is the source text for a podcast. "
+    "Later requests refer to it as the source text."
+)
+
+
+def source_section_reference(source_number: int) -> str:
+    """Stands in for one source's text when the cached context holds the combined text of all sources."""
+    return (
+        f"[Source {source_number} of the source text in the cached context of this conversation: "
+        f"only the text under the '--- SOURCE {source_number}: ... ---' marker, up to the next source marker.]"
+    )
+
+
+class GeminiSourceContextCache:
+    """Creates, queries and deletes Gemini cached contents holding a source text."""
+
+    async def create_async(self, model_name: str, source_text: str, ttl_seconds: int) -> Any:
+        """
+        Upload source_text as a cached context.
+
+        Returns:
+            Opaque handle passed to generate_async and delete_async
+        """
+        cached_content = await asyncio.to_thread(
+            genai.caching.CachedContent.create,
+            model=f"models/{model_name}",
+            display_name="mysaloncast-source-context",
+            system_instruction=SOURCE_CONTEXT_INSTRUCTION,
+            contents=[source_text],
+            ttl=timedelta(seconds=ttl_seconds),
+        )
+        logger.info(f"Created Gemini cached context {cached_content.name} for {len(source_text)} characters of source text")
+        return cached_content
+
+    async def generate_async(
+        self,
+        handle: Any,
+        prompt: str,
+        result_type: Optional[type],
+        timeout_seconds: int
+    ) -> Any:
+        """
+        Answer a prompt against a cached context.
+
+        Returns:
+            The response text, or an instance of result_type parsed from a JSON response
+
+        Raises:
+            StructuredOutputError: If the response does not validate as result_type
+        """
+        model = genai.GenerativeModel.from_cached_content(cached_content=handle)
+        generation_config = GenerationConfig(response_mime_type="application/json") if result_type else None
+        response = await asyncio.wait_for(
+            model.generate_content_async(prompt, generation_config=generation_config),
+            timeout=timeout_seconds,
+        )
+        if result_type is None:
+            return response.text
+        try:
+            return TypeAdapter(result_type).validate_python(json.loads(response.text))
+        except (json.JSONDecodeError, ValidationError) as e:
+            raise StructuredOutputError(f"Invalid {result_type} response against cached context: {e}", response.text) from e
+
+    async def delete_async(self, handle: Any) -> None:
+        """Delete a cached context before its TTL runs out."""
+        await asyncio.to_thread(handle.delete)
+        logger.info(f"Deleted Gemini cached context {handle.name}")
@@ -4,14 +4,16 @@ Provides database-backed storage and management of PodcastStatus objects.
 """
 
 import logging
-from typing import Dict, Optional, List
-from datetime import datetime
+from typing import Any, Dict, Optional, List
+from datetime import datetime, timedelta
 import json
 
 from sqlmodel import Session, select
 from app.podcast_models import PodcastStatus, PodcastProgressStatus, PodcastEpisode, ArtifactAvailability, PodcastRequest
 from app.database import (
     PodcastStatusDB, 
+    PodcastCheckpointDB,
+    SourceAnalysisCacheDB,
     get_session, 
     serialize_to_json, 
     deserialize_from_json,
@@ -81,13 +83,19 @@ class StatusManager:
             "logs": serialize_to_json(status.logs)
         }
     
-    def create_status(self, task_id: str, request_data: Optional[dict] = None) -> PodcastStatus:
+    def create_status(
+        self,
+        task_id: str,
+        request_data: Optional[dict] = None,
+        request_fingerprint: Optional[str] = None
+    ) -> PodcastStatus:
         """
         Create a new podcast generation status.
         
         Args:
             task_id: Unique identifier for the task
             request_data: Original request data (optional)
+            request_fingerprint: PodcastRequest.fingerprint() for duplicate detection (optional)
             
         Returns:
             Newly created PodcastStatus object
@@ -110,7 +118,7 @@ class StatusManager:
             )
             
             # Convert to database model
-            db_status = PodcastStatusDB(**self._model_to_db(status))
+            db_status = PodcastStatusDB(**self._model_to_db(status), request_fingerprint=request_fingerprint)
             
             # Save to database
             session.add(db_status)
@@ -343,6 +351,175 @@ class StatusManager:
             
             logger.info(f"Set episode for task_id: {task_id} - Title: {episode.title}")
             return self._db_to_model(db_status)
+
+    def clear_episode(self, task_id: str) -> Optional[PodcastStatus]:
+        """
+        Remove the episode of a task, e.g. a preview left by a failed or cancelled run.
+
+        Args:
+            task_id: Task identifier to update
+
+        Returns:
+            Updated PodcastStatus if found, None otherwise
+        """
+        with get_session() as session:
+            db_status = session.get(PodcastStatusDB, task_id)
+            if not db_status:
+                logger.error(f"Cannot clear episode - task_id not found: {task_id}")
+                return None
+
+            db_status.result_episode = None
+            db_status.last_updated_at = datetime.utcnow()
+
+            session.add(db_status)
+            session.commit()
+            session.refresh(db_status)
+
+            return self._db_to_model(db_status)
+
+    def clear_error(self, task_id: str) -> Optional[PodcastStatus]:
+        """
+        Clear error fields of a task, e.g. before it is resumed.
+        
+        Args:
+            task_id: Task identifier to update
+            
+        Returns:
+            Updated PodcastStatus if found, None otherwise
+        """
+        with get_session() as session:
+            db_status = session.get(PodcastStatusDB, task_id)
+            if not db_status:
+                logger.error(f"Cannot clear error - task_id not found: {task_id}")
+                return None
+            
+            db_status.error_message = None
+            db_status.error_details = None
+            db_status.last_updated_at = datetime.utcnow()
+            
+            session.add(db_status)
+            session.commit()
+            session.refresh(db_status)
+            
+            return self._db_to_model(db_status)
+    
+    def save_checkpoint(self, task_id: str, stage: str, payload: Any) -> None:
+        """
+        Persist the output of a completed workflow stage, replacing any previous one.
+        
+        Args:
+            task_id: Task identifier
+            stage: Workflow stage name
+            payload: JSON-serializable stage output
+        """
+        with get_session() as session:
+            db_checkpoint = session.get(PodcastCheckpointDB, (task_id, stage))
+            if db_checkpoint:
+                db_checkpoint.payload = serialize_to_json(payload)
+                db_checkpoint.created_at = datetime.utcnow()
+            else:
+                db_checkpoint = PodcastCheckpointDB(
+                    task_id=task_id,
+                    stage=stage,
+                    payload=serialize_to_json(payload)
+                )
+            session.add(db_checkpoint)
+            session.commit()
+            
+            logger.info(f"Saved checkpoint for task_id: {task_id} - Stage: {stage}")
+    
+    def get_checkpoints(self, task_id: str) -> Dict[str, Any]:
+        """
+        Get all saved stage outputs for a task.
+        
+        Args:
+            task_id: Task identifier
+            
+        Returns:
+            Dict mapping stage name to its deserialized output (empty if none)
+        """
+        with get_session() as session:
+            statement = select(PodcastCheckpointDB).where(PodcastCheckpointDB.task_id == task_id)
+            results = session.exec(statement).all()
+            return {db_checkpoint.stage: deserialize_from_json(db_checkpoint.payload) for db_checkpoint in results}
+    
+    def delete_checkpoints(self, task_id: str) -> int:
+        """
+        Remove all saved stage outputs for a task.
+        
+        Args:
+            task_id: Task identifier
+            
+        Returns:
+            Number of checkpoints deleted
+        """
+        with get_session() as session:
+            statement = select(PodcastCheckpointDB).where(PodcastCheckpointDB.task_id == task_id)
+            results = session.exec(statement).all()
+            for db_checkpoint in results:
+                session.delete(db_checkpoint)
+            session.commit()
+            if results:
+                logger.info(f"Deleted {len(results)} checkpoints for task_id: {task_id}")
+            return len(results)
+    
+    def get_cached_source_analysis(self, content_hash: str, max_age_seconds: int) -> Optional[Any]:
+        """
+        Get a source analysis cached by any task for the same source content.
+        
+        Args:
+            content_hash: Hash of the analysis prompt and extracted source text
+            max_age_seconds: Entries older than this are ignored
+            
+        Returns:
+            The deserialized analysis, or None if not cached or expired
+        """
+        with get_session() as session:
+            db_entry = session.get(SourceAnalysisCacheDB, content_hash)
+            if not db_entry or db_entry.created_at < datetime.utcnow() - timedelta(seconds=max_age_seconds):
+                return None
+            return deserialize_from_json(db_entry.payload)
+    
+    def save_cached_source_analysis(self, content_hash: str, payload: Any) -> None:
+        """
+        Cache a source analysis for reuse by later tasks with the same source content.
+        
+        Args:
+            content_hash: Hash of the analysis prompt and extracted source text
+            payload: JSON-serializable SourceAnalysis data
+        """
+        with get_session() as session:
+            db_entry = session.get(SourceAnalysisCacheDB, content_hash)
+            if db_entry:
+                db_entry.payload = serialize_to_json(payload)
+                db_entry.created_at = datetime.utcnow()
+            else:
+                db_entry = SourceAnalysisCacheDB(content_hash=content_hash, payload=serialize_to_json(payload))
+            session.add(db_entry)
+            session.commit()
+            
+            logger.info(f"Cached source analysis {content_hash[:12]}")
+    
+    def find_statuses_by_fingerprint(self, request_fingerprint: str, since: datetime) -> List[PodcastStatus]:
+        """
+        Find tasks created from an identical request.
+        
+        Args:
+            request_fingerprint: PodcastRequest.fingerprint() to match
+            since: Only consider tasks created at or after this time (UTC)
+            
+        Returns:
+            Matching PodcastStatus objects, newest first
+        """
+        with get_session() as session:
+            statement = (
+                select(PodcastStatusDB)
+                .where(PodcastStatusDB.request_fingerprint == request_fingerprint)
+                .where(PodcastStatusDB.created_at >= since)
+                .order_by(PodcastStatusDB.created_at.desc())
+            )
+            results = session.exec(statement).all()
+            return [self._db_to_model(db_status) for db_status in results]
     
     def list_all_statuses(self, limit: int = 100, offset: int = 0) -> List[PodcastStatus]:
         """
@@ -376,6 +553,7 @@ class StatusManager:
                 session.delete(db_status)
                 session.commit()
                 logger.info(f"Deleted status for task_id: {task_id}")
+                self.delete_checkpoints(task_id)
                 return True
             logger.warning(f"Cannot delete - task_id not found: {task_id}")
             return False
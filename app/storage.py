@@ -325,18 +325,19 @@ class CloudStorageManager(StorageManager):
             for key, _ in sorted_items[:excess_count]:
                 del self._text_cache[key]
     
-    async def upload_audio_file_async(self, local_path: str, cloud_path: str) -> Optional[str]:
+    async def upload_audio_file_async(self, local_path: str, cloud_path: str, audio: Optional[bytes] = None) -> Optional[str]:
         """
         Upload an audio file to cloud storage asynchronously.
         
         Args:
             local_path: Path to the local file
             cloud_path: Target cloud storage path (e.g., "episodes/task_id/final_podcast.mp3")
+            audio: Content of the file if it is held in memory; uploaded instead of reading local_path
             
         Returns:
             Cloud storage URL if successful, None otherwise
         """
-        if not os.path.exists(local_path):
+        if audio is None and not os.path.exists(local_path):
             logging.error(f"Local file not found: {local_path}")
             return None
             
@@ -347,7 +348,10 @@ class CloudStorageManager(StorageManager):
                 
                 # Upload with appropriate content type
                 content_type = "audio/mpeg" if local_path.endswith(".mp3") else "audio/wav"
-                blob.upload_from_filename(local_path, content_type=content_type)
+                if audio is not None:
+                    blob.upload_from_string(audio, content_type=content_type)
+                else:
+                    blob.upload_from_filename(local_path, content_type=content_type)
                 
                 # Make blob publicly readable for both cloud and local environments
                 blob.make_public()
@@ -369,17 +373,18 @@ class CloudStorageManager(StorageManager):
             logging.info(f"Cloud storage not available, keeping local path: {local_path}")
             return local_path
     
-    async def upload_audio_segment_async(self, local_path: str) -> Optional[str]:
+    async def upload_audio_segment_async(self, local_path: str, audio: Optional[bytes] = None) -> Optional[str]:
         """
         Upload an individual audio segment to cloud storage.
         
         Args:
             local_path: Path to the local audio segment file
+            audio: Content of the segment if it is held in memory; uploaded instead of reading local_path
             
         Returns:
             Cloud storage URL if successful, None otherwise
         """
-        if not os.path.exists(local_path):
+        if audio is None and not os.path.exists(local_path):
             logging.error(f"Audio segment file not found: {local_path}")
             return None
             
@@ -390,7 +395,7 @@ class CloudStorageManager(StorageManager):
         timestamp = int(time.time())
         cloud_path = f"segments/{timestamp}/{filename}"
         
-        return await self.upload_audio_file_async(local_path, cloud_path)
+        return await self.upload_audio_file_async(local_path, cloud_path, audio)
     
     async def upload_podcast_episode_async(self, podcast_episode) -> bool:
         """
@@ -5,14 +5,60 @@ Handles running podcast generation tasks in the background using asyncio and Thr
 
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
 from typing import Dict, Optional, Callable, Any, List
 import logging
+import threading
 from datetime import datetime
 import traceback
 
 logger = logging.getLogger(__name__)
 
 
+class CancellationToken:
+    """
+    Cancellation flag for one background task.
+    
+    Backed by a threading.Event so it can be checked both from the event loop
+    and from worker threads (TTS synthesis, uploads) that run on its behalf.
+    """
+    
+    def __init__(self, task_id: str):
+        self.task_id = task_id
+        self.reason: Optional[str] = None
+        self._event = threading.Event()
+    
+    def cancel(self, reason: str = "Task was cancelled by user request") -> None:
+        """Mark the task as cancelled."""
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+    
+    @property
+    def is_cancelled(self) -> bool:
+        """Check if cancellation has been requested."""
+        return self._event.is_set()
+    
+    def raise_if_cancelled(self) -> None:
+        """Raise CancelledError if cancellation has been requested."""
+        if self._event.is_set():
+            raise asyncio.CancelledError(f"Task {self.task_id} was cancelled: {self.reason}")
+
+
+# Token of the background task the current coroutine runs for. Set by TaskRunner
+# for each submitted async task and inherited by the asyncio tasks it creates.
+current_cancellation_token: ContextVar[Optional[CancellationToken]] = ContextVar(
+    "current_cancellation_token", default=None
+)
+
+
+def raise_if_cancelled() -> None:
+    """Raise CancelledError if the background task of the current context was cancelled."""
+    token = current_cancellation_token.get()
+    if token is not None:
+        token.raise_if_cancelled()
+
+
 class TaskRunner:
     """Manages background task execution for podcast generation."""
     
@@ -27,6 +73,7 @@ class TaskRunner:
         self._executor = ThreadPoolExecutor(max_workers=max_workers)
         self._running_tasks: Dict[str, asyncio.Task] = {}
         self._task_futures: Dict[str, asyncio.Future] = {}
+        self._cancellation_tokens: Dict[str, CancellationToken] = {}
         self._lifetime_submitted_count = 0  # Track all tasks submitted during this instance's lifetime
         logger.info(f"TaskRunner initialized with max_workers={max_workers}")
     
@@ -82,7 +129,9 @@ class TaskRunner:
             raise ValueError(f"Task {task_id} is already running")
         
         # Create an asyncio task that runs the async function directly
-        task = asyncio.create_task(self._monitor_async_task(task_id, async_func, *args, **kwargs))
+        token = CancellationToken(task_id)
+        self._cancellation_tokens[task_id] = token
+        task = asyncio.create_task(self._monitor_async_task(task_id, token, async_func, *args, **kwargs))
         
         self._running_tasks[task_id] = task
         self._lifetime_submitted_count += 1  # Increment the lifetime counter
@@ -110,16 +159,25 @@ class TaskRunner:
             self._running_tasks.pop(task_id, None)
             self._task_futures.pop(task_id, None)
     
-    async def _monitor_async_task(self, task_id: str, async_func: Callable, *args, **kwargs) -> Any:
+    async def _monitor_async_task(
+        self,
+        task_id: str,
+        token: CancellationToken,
+        async_func: Callable,
+        *args,
+        **kwargs
+    ) -> Any:
         """
         Monitor a running async task and clean up when complete.
         
         Args:
             task_id: The task identifier
+            token: Cancellation token made current for the task's context
             async_func: The async function to execute
             *args: Positional arguments for the function
             **kwargs: Keyword arguments for the function
         """
+        current_cancellation_token.set(token)
         try:
             result = await async_func(*args, **kwargs)
             logger.info(f"Async task {task_id} completed successfully")
@@ -131,26 +189,44 @@ class TaskRunner:
         finally:
             # Clean up task references
             self._running_tasks.pop(task_id, None)
+            self._cancellation_tokens.pop(task_id, None)
             # Note: no need to pop from _task_futures since async tasks don't use futures
     
     def is_task_running(self, task_id: str) -> bool:
         """Check if a task is currently running."""
         return task_id in self._running_tasks
     
+    def is_cancellation_requested(self, task_id: str) -> bool:
+        """Check if a running task has been asked to cancel but has not finished unwinding yet."""
+        token = self._cancellation_tokens.get(task_id)
+        return token is not None and token.is_cancelled
+    
+    def get_cancellation_token(self, task_id: str) -> Optional[CancellationToken]:
+        """Get the cancellation token of a running async task."""
+        return self._cancellation_tokens.get(task_id)
+    
     def get_running_task_count(self) -> int:
-        """Get the number of currently running tasks."""
-        return len(self._running_tasks)
+        """
+        Get the number of currently running tasks.
+        Tasks that are only unwinding after a cancellation no longer count against capacity.
+        """
+        return sum(1 for task_id in self._running_tasks if not self.is_cancellation_requested(task_id))
     
     def can_accept_new_task(self) -> bool:
         """Check if the runner can accept a new task."""
         return self.get_running_task_count() < self.max_workers
     
-    async def cancel_task(self, task_id: str) -> bool:
+    async def cancel_task(self, task_id: str, reason: str = "Task was cancelled by user request") -> bool:
         """
         Attempt to cancel a running task.
         
+        The task's cancellation token is set first so that worker threads and
+        queued work see it, then the asyncio task is cancelled to interrupt
+        whatever it is currently awaiting.
+        
         Args:
             task_id: The task to cancel
+            reason: Why the task is being cancelled
             
         Returns:
             True if cancellation was initiated, False if task not found
@@ -160,6 +236,9 @@ class TaskRunner:
         
         task = self._running_tasks.get(task_id)
         if task and not task.done():
+            token = self._cancellation_tokens.get(task_id)
+            if token is not None:
+                token.cancel(reason)
             task.cancel()
             logger.info(f"Cancellation requested for task {task_id}")
             return True
@@ -173,7 +252,10 @@ class TaskRunner:
         Returns:
             Dict containing queue status metrics
         """
-        active_count = sum(1 for task in self._running_tasks.values() if not task.done())
+        active_count = sum(
+            1 for task_id, task in self._running_tasks.items()
+            if not task.done() and not self.is_cancellation_requested(task_id)
+        )
         
         return {
             "max_workers": self.max_workers,
@@ -196,7 +278,7 @@ class TaskRunner:
                 active_tasks.append({
                     "task_id": task_id,
                     "running": not task.done(),
-                    "cancelled": task.cancelled()
+                    "cancelled": task.cancelled() or self.is_cancellation_requested(task_id)
                 })
         return active_tasks
     
@@ -0,0 +1,228 @@
+"""
+Content-addressed cache for synthesized speech.
+
+Audio is stored on local disk under a hash of the synthesis input, the voice
+selection and the audio config, so repeated intros and outros, retried tasks and
+re-renders are answered without calling Google Cloud TTS. The directory is kept
+within a byte budget by evicting the least recently used files. Optionally the
+cache is backed by the audio bucket, so entries survive instance restarts and
+are shared between instances.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from app.config import get_config
+
+logger = logging.getLogger(__name__)
+
+# Prefix for cached audio in the audio bucket
+GCS_CACHE_PREFIX = "tts-cache/"
+
+
+class TtsCacheMetrics:
+    """Track TTS synthesis cache hits and misses."""
+
+    def __init__(self):
+        self.hits = 0
+        self.gcs_hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self.errors = 0
+        self.saved_seconds = 0.0
+
+    def get_metrics(self, size_bytes: int, entries: int) -> Dict[str, Any]:
+        """Get current metrics snapshot."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "gcs_hits": self.gcs_hits,
+            "misses": self.misses,
+            "hit_rate_pct": round((self.hits / lookups) * 100, 1) if lookups > 0 else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions,
+            "errors": self.errors,
+            "entries": entries,
+            "size_bytes": size_bytes,
+            "estimated_seconds_saved": round(self.saved_seconds, 1),
+        }
+
+
+class TtsSynthesisCache:
+    """Disk-backed synthesized audio cache with a byte budget and LRU eviction."""
+
+    def __init__(self, directory: str, max_bytes: int, gcs_client: Any = None, gcs_bucket: Optional[str] = None):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.gcs_client = gcs_client
+        self.gcs_bucket = gcs_bucket
+        self.metrics = TtsCacheMetrics()
+        self._lock = threading.Lock()
+
+        os.makedirs(directory, exist_ok=True)
+        # key -> size in bytes, least recently used first; file mtimes persist the order across restarts
+        self._index: "OrderedDict[str, int]" = OrderedDict()
+        entries = []
+        for name in os.listdir(directory):
+            if name.endswith(".audio"):
+                stat = os.stat(os.path.join(directory, name))
+                entries.append((stat.st_mtime, name[:-len(".audio")], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+        self._size_bytes = sum(self._index.values())
+        logger.info(
+            f"TTS synthesis cache at {directory} ({len(self._index)} entries, {self._size_bytes} of {max_bytes} bytes"
+            f"{', backed by gs://' + gcs_bucket + '/' + GCS_CACHE_PREFIX if gcs_client and gcs_bucket else ''})"
+        )
+
+    @staticmethod
+    def make_key(synthesis_input: Dict[str, Any], voice: Dict[str, Any], audio_config: Dict[str, Any]) -> str:
+        """Hash the synthesis input, voice selection and audio config into a cache key."""
+        material = json.dumps(
+            {"input": synthesis_input, "voice": voice, "audio_config": audio_config},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.audio")
+
+    def _gcs_blob(self, key: str):
+        return self.gcs_client.bucket(self.gcs_bucket).blob(f"{GCS_CACHE_PREFIX}{key}")
+
+    def get(self, key: str, synthesis_seconds: float = 0.0) -> Optional[bytes]:
+        """
+        Look up cached audio, falling back to the bucket when it is configured.
+
+        synthesis_seconds is the typical synthesis time, counted as saved on a hit.
+        Blocking; call it from a worker thread.
+        """
+        try:
+            with open(self._path(key), "rb") as f:
+                audio = f.read()
+            now = time.time()
+            os.utime(self._path(key), (now, now))
+            with self._lock:
+                if key in self._index:
+                    self._index.move_to_end(key)
+                self.metrics.hits += 1
+                self.metrics.saved_seconds += synthesis_seconds
+            return audio
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            # A corrupt entry is treated as a miss and synthesized again
+            logger.warning(f"TTS synthesis cache lookup failed: {e}")
+            with self._lock:
+                self.metrics.errors += 1
+
+        if self.gcs_client and self.gcs_bucket:
+            try:
+                blob = self._gcs_blob(key)
+                if blob.exists():
+                    audio = blob.download_as_bytes()
+                    self._store_local(key, audio)
+                    with self._lock:
+                        self.metrics.hits += 1
+                        self.metrics.gcs_hits += 1
+                        self.metrics.saved_seconds += synthesis_seconds
+                    return audio
+            except Exception as e:
+                logger.warning(f"TTS synthesis cache lookup in gs://{self.gcs_bucket} failed: {e}")
+                with self._lock:
+                    self.metrics.errors += 1
+
+        with self._lock:
+            self.metrics.misses += 1
+        return None
+
+    def set(self, key: str, audio: bytes) -> None:
+        """Store synthesized audio locally (and in the bucket when configured). Blocking."""
+        if not audio:
+            return
+        try:
+            self._store_local(key, audio)
+            with self._lock:
+                self.metrics.stores += 1
+        except Exception as e:
+            logger.warning(f"Failed to store synthesized audio in cache: {e}")
+            with self._lock:
+                self.metrics.errors += 1
+
+        if self.gcs_client and self.gcs_bucket:
+            try:
+                self._gcs_blob(key).upload_from_string(audio, content_type="application/octet-stream")
+            except Exception as e:
+                logger.warning(f"Failed to store synthesized audio in gs://{self.gcs_bucket}: {e}")
+                with self._lock:
+                    self.metrics.errors += 1
+
+    def _store_local(self, key: str, audio: bytes) -> None:
+        if len(audio) > self.max_bytes:
+            return
+        # Write under a temporary name so concurrent readers never see partial audio
+        temp_path = f"{self._path(key)}.{threading.get_ident()}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(audio)
+        os.replace(temp_path, self._path(key))
+        with self._lock:
+            self._size_bytes += len(audio) - self._index.pop(key, 0)
+            self._index[key] = len(audio)
+            self._evict_locked()
+
+    def _evict_locked(self) -> None:
+        while self._size_bytes > self.max_bytes and self._index:
+            key, size = self._index.popitem(last=False)
+            self._size_bytes -= size
+            self.metrics.evictions += 1
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                pass
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get current metrics snapshot."""
+        with self._lock:
+            return self.metrics.get_metrics(size_bytes=self._size_bytes, entries=len(self._index))
+
+
+# Global cache instance
+_tts_synthesis_cache: Optional[TtsSynthesisCache] = None
+_tts_synthesis_cache_lock = threading.Lock()
+
+
+def get_tts_synthesis_cache() -> Optional[TtsSynthesisCache]:
+    """Get or create the global TTS synthesis cache, or None if caching is disabled."""
+    global _tts_synthesis_cache
+    config = get_config()
+    if not config.tts_cache_enabled:
+        return None
+    with _tts_synthesis_cache_lock:
+        if _tts_synthesis_cache is None:
+            gcs_client, gcs_bucket = None, None
+            if config.tts_cache_gcs_enabled:
+                from app.storage import get_storage_manager
+                storage_manager = get_storage_manager()
+                if storage_manager.is_cloud_storage_available:
+                    gcs_client, gcs_bucket = storage_manager.client, config.audio_bucket
+                else:
+                    logger.warning("TTS_CACHE_GCS_ENABLED is set but Cloud Storage is not available, caching on local disk only")
+            try:
+                _tts_synthesis_cache = TtsSynthesisCache(
+                    config.tts_cache_dir,
+                    config.tts_cache_max_bytes,
+                    gcs_client=gcs_client,
+                    gcs_bucket=gcs_bucket,
+                )
+            except Exception as e:
+                logger.warning(f"TTS synthesis cache unavailable, continuing without it: {e}")
+                return None
+        return _tts_synthesis_cache
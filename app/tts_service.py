@@ -4,14 +4,20 @@ import asyncio
 import logging
 import os
 from google.cloud import texttospeech
+from google.cloud import texttospeech_v1beta1
 from dotenv import load_dotenv
+import html
 import json
+import re
 import time
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List, Any
-from concurrent.futures import ThreadPoolExecutor
-import functools
-import atexit
+from typing import Optional, Dict, List, Any, Tuple
+import weakref
+
+from app.audio_store import current_audio_store
+from app.config import get_config
+from app.task_runner import current_cancellation_token
+from app.tts_cache import get_tts_synthesis_cache
 
 # Load environment variables from env file
 load_dotenv()
@@ -20,6 +26,13 @@ load_dotenv()
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
+# Pause inserted between dialogue turns synthesized in one SSML request
+SSML_TURN_BREAK_MS = 300
+
+# Voice types (third part of names like "en-US-Neural2-F") that accept SSML with <mark> tags;
+# Chirp, Chirp3-HD and Journey voices only take plain text
+SSML_MARK_VOICE_TYPES = ("Standard", "Wavenet", "Neural2", "News", "Studio", "Polyglot")
+
 class TtsMetrics:
     """Track TTS service performance metrics."""
     
@@ -49,16 +62,16 @@ class TtsMetrics:
         # Remove jobs older than 1 minute
         self.last_minute_jobs = [t for t in self.last_minute_jobs if current_time - t <= 60]
     
-    def get_metrics(self, active_workers: int, max_workers: int, queue_size: int) -> dict:
+    def get_metrics(self, in_flight: int, max_concurrency: int, waiting: int) -> dict:
         """Get current metrics snapshot."""
         total_jobs = self.jobs_completed + self.jobs_failed
         avg_time = (self.total_processing_time / self.jobs_completed) if self.jobs_completed > 0 else 0
         
         return {
-            "active_workers": active_workers,
-            "max_workers": max_workers,
-            "queue_size": queue_size,
-            "worker_utilization_pct": round((active_workers / max_workers) * 100, 1),
+            "in_flight": in_flight,
+            "max_concurrency": max_concurrency,
+            "waiting": waiting,
+            "utilization_pct": round((in_flight / max_concurrency) * 100, 1) if max_concurrency > 0 else 0.0,
             "jobs_completed": self.jobs_completed,
             "jobs_failed": self.jobs_failed,
             "success_rate_pct": round((self.jobs_completed / total_jobs) * 100, 1) if total_jobs > 0 else 100,
@@ -104,139 +117,66 @@ class GoogleCloudTtsService:
     # Cache expiration time (24 hours)
     CACHE_EXPIRATION = 24 * 60 * 60  # seconds
     
-    # Shared thread pool executor for TTS calls to prevent shutdown issues
-    _executor = None
-    _shutdown_registered = False
+    # Async clients and concurrency limits per event loop (gRPC asyncio channels are bound to their loop)
+    _async_clients = weakref.WeakKeyDictionary()
+    _semaphores = weakref.WeakKeyDictionary()
+    _in_flight = 0
+    _waiting = 0
     _metrics = TtsMetrics()
     
     @classmethod
-    def _get_executor(cls):
-        """Get or create a shared thread pool executor for TTS operations."""
-        if cls._executor is None or cls._executor._shutdown:
-            cls._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="tts_worker")
-            logger.info("Created shared TTS thread pool executor")
-            
-            # Register shutdown handler only once
-            if not cls._shutdown_registered:
-                atexit.register(cls._shutdown_executor)
-                cls._shutdown_registered = True
-                
-        return cls._executor
+    def _get_async_client(cls, api_version: str = "v1"):
+        """
+        Get or create the async TTS client for the running event loop.
+
+        api_version "v1beta1" selects the beta API, which reports SSML mark timepoints.
+        """
+        loop = asyncio.get_running_loop()
+        clients = cls._async_clients.setdefault(loop, {})
+        client = clients.get(api_version)
+        if client is None:
+            if api_version == "v1beta1":
+                client = texttospeech_v1beta1.TextToSpeechAsyncClient()
+            else:
+                client = texttospeech.TextToSpeechAsyncClient()
+            clients[api_version] = client
+            logger.info(f"Created async TTS client ({api_version})")
+        return client
     
     @classmethod
-    def _shutdown_executor(cls):
-        """Safely shutdown the shared thread pool executor."""
-        if cls._executor and not cls._executor._shutdown:
+    async def close_async_clients(cls) -> None:
+        """
+        Close the async TTS clients of the running event loop and their gRPC channels.
+
+        Called when the app shuts down; clients are created again on next use.
+        """
+        clients = cls._async_clients.pop(asyncio.get_running_loop(), {})
+        for api_version, client in clients.items():
             try:
-                cls._executor.shutdown(wait=True, cancel_futures=False)
-                logger.info("TTS thread pool executor shutdown complete")
+                await client.transport.close()
+                logger.info(f"Closed async TTS client ({api_version})")
             except Exception as e:
-                logger.warning(f"Error during TTS executor shutdown: {e}")
-    
+                logger.warning(f"Failed to close async TTS client ({api_version}): {e}")
+
     @classmethod
-    def _executor_is_healthy(cls):
-        """Check if the executor is available and not shutdown."""
-        return cls._executor is not None and not cls._executor._shutdown
+    def _get_semaphore(cls) -> asyncio.Semaphore:
+        """Get or create the semaphore limiting concurrent synthesis calls on the running event loop."""
+        loop = asyncio.get_running_loop()
+        semaphore = cls._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = cls._semaphores[loop] = asyncio.Semaphore(get_config().tts_service_max_concurrency)
+        return semaphore
 
     @classmethod
     def get_current_metrics(cls) -> Dict[str, Any]:
         """Get current TTS service metrics and performance statistics."""
-        try:
-            # Get executor info
-            if cls._executor is None:
-                return {
-                    "executor_status": "not_initialized",
-                    "max_workers": 0,
-                    "active_workers": 0,
-                    "queue_size": 0,
-                    "worker_utilization_pct": 0.0,
-                    "total_jobs_completed": cls._metrics.jobs_completed if cls._metrics else None,
-                    "total_jobs_failed": cls._metrics.jobs_failed if cls._metrics else None,
-                    "success_rate_pct": 100.0 if not cls._metrics or cls._metrics.jobs_failed == 0 else 
-                                      (cls._metrics.jobs_completed / (cls._metrics.jobs_completed + cls._metrics.jobs_failed)) * 100,
-                    "avg_processing_time_sec": cls._metrics.get_avg_processing_time() if cls._metrics else None,
-                    "min_processing_time_sec": cls._metrics.min_processing_time if cls._metrics else None,
-                    "max_processing_time_sec": cls._metrics.max_processing_time if cls._metrics else None,
-                    "jobs_last_minute": cls._metrics.get_jobs_last_minute() if cls._metrics else 0,
-                    "last_updated": datetime.now().isoformat()
-                }
-            
-            executor = cls._executor
-            max_workers = executor._max_workers
-            
-            # Calculate active workers more safely
-            active_workers = 0
-            try:
-                # Try different ways to get active thread count
-                if hasattr(executor, '_threads'):
-                    total_threads = len(executor._threads) if hasattr(executor._threads, '__len__') else executor._threads
-                    if hasattr(executor, '_idle_semaphore'):
-                        idle_sem = executor._idle_semaphore
-                        if hasattr(idle_sem, '_value'):
-                            idle_count = idle_sem._value if isinstance(idle_sem._value, int) else len(idle_sem._value)
-                            active_workers = max(0, total_threads - idle_count)
-                        else:
-                            active_workers = total_threads  # Fallback
-                    else:
-                        active_workers = total_threads  # Fallback
-                else:
-                    active_workers = 0
-            except Exception:
-                # Fallback to 0 if we can't determine
-                active_workers = 0
-            
-            # Calculate queue size more safely
-            queue_size = 0
-            try:
-                if hasattr(executor, '_work_queue'):
-                    work_queue = executor._work_queue
-                    if hasattr(work_queue, 'qsize'):
-                        queue_size = work_queue.qsize()
-                    elif hasattr(work_queue, '__len__'):
-                        queue_size = len(work_queue)
-            except Exception:
-                queue_size = 0
-            
-            # Calculate utilization
-            utilization_pct = (active_workers / max_workers * 100) if max_workers > 0 else 0.0
-            
-            # Get metrics data
-            total_completed = cls._metrics.jobs_completed if cls._metrics else 0
-            total_failed = cls._metrics.jobs_failed if cls._metrics else 0
-            success_rate = 100.0 if total_failed == 0 and total_completed > 0 else \
-                          (total_completed / (total_completed + total_failed) * 100) if (total_completed + total_failed) > 0 else 100.0
-            
-            return {
-                "executor_status": "healthy" if not executor._shutdown else "shutdown",
-                "max_workers": max_workers,
-                "active_workers": active_workers,
-                "queue_size": queue_size,
-                "worker_utilization_pct": utilization_pct,
-                "total_jobs_completed": total_completed,
-                "total_jobs_failed": total_failed,
-                "success_rate_pct": success_rate,
-                "avg_processing_time_sec": cls._metrics.get_avg_processing_time() if cls._metrics else None,
-                "min_processing_time_sec": cls._metrics.min_processing_time if cls._metrics else None,
-                "max_processing_time_sec": cls._metrics.max_processing_time if cls._metrics else None,
-                "jobs_last_minute": cls._metrics.get_jobs_last_minute() if cls._metrics else 0,
-                "last_updated": datetime.now().isoformat()
-            }
-            
-        except Exception as e:
-            # Return minimal safe metrics on any error
-            return {
-                "executor_status": "error",
-                "max_workers": 0,
-                "active_workers": 0,
-                "queue_size": 0,
-                "worker_utilization_pct": 0.0,
-                "total_jobs_completed": None,
-                "total_jobs_failed": None,
-                "success_rate_pct": 0.0,
-                "avg_processing_time_sec": None,
-                "error": str(e),
-                "last_updated": datetime.now().isoformat()
-            }
+        metrics = cls._metrics.get_metrics(
+            in_flight=cls._in_flight,
+            max_concurrency=get_config().tts_service_max_concurrency,
+            waiting=cls._waiting
+        )
+        metrics["last_updated"] = datetime.now().isoformat()
+        return metrics
 
     @classmethod 
     def log_metrics_if_needed(cls):
@@ -253,15 +193,14 @@ class GoogleCloudTtsService:
         
         # Log comprehensive metrics
         logger.info(
-            f"TTS Metrics - Status: {metrics['executor_status']}, "
-            f"Workers: {metrics['active_workers']}/{metrics['max_workers']} "
-            f"({metrics['worker_utilization_pct']:.1f}%), "
-            f"Queue: {metrics['queue_size']}, "
-            f"Completed: {metrics['total_jobs_completed']}, "
-            f"Failed: {metrics['total_jobs_failed']}, "
+            f"TTS Metrics - In flight: {metrics['in_flight']}/{metrics['max_concurrency']} "
+            f"({metrics['utilization_pct']:.1f}%), "
+            f"Waiting: {metrics['waiting']}, "
+            f"Completed: {metrics['jobs_completed']}, "
+            f"Failed: {metrics['jobs_failed']}, "
             f"Success Rate: {metrics['success_rate_pct']:.1f}%, "
-            f"Avg Time: {metrics['avg_processing_time_sec']:.2f}s, "
-            f"Last Minute: {metrics['jobs_last_minute']}"
+            f"Avg Time: {metrics['avg_processing_time_ms']:.0f}ms, "
+            f"Last Minute: {metrics['jobs_completed_last_minute']}"
         )
 
     def __init__(self):
@@ -270,6 +209,7 @@ class GoogleCloudTtsService:
         Assumes GOOGLE_APPLICATION_CREDENTIALS environment variable is set.
         """
         try:
+            # Only used to list voices; synthesis runs on the async client (see _get_async_client)
             self.client = texttospeech.TextToSpeechClient()
             self.voice_cache = self._load_or_refresh_voice_cache()
             logger.info("GoogleCloudTtsService initialized successfully.")
@@ -413,6 +353,137 @@ class GoogleCloudTtsService:
             return []
         return self.voice_cache[gender]
 
+    @staticmethod
+    def _split_text_for_synthesis(text: str, max_bytes: int) -> List[str]:
+        """
+        Split text into chunks of at most max_bytes UTF-8 bytes (the API limits input by bytes).
+        Chunks end at sentence boundaries where possible, then at clause boundaries,
+        and only split between words inside overly long clauses.
+        """
+        def size(part: str) -> int:
+            return len(part.encode("utf-8"))
+
+        def pack(parts: List[str]) -> List[str]:
+            packed: List[str] = []
+            current = ""
+            for part in parts:
+                candidate = f"{current} {part}" if current else part
+                if current and size(candidate) > max_bytes:
+                    packed.append(current)
+                    current = part
+                else:
+                    current = candidate
+            if current:
+                packed.append(current)
+            return packed
+
+        def split_oversized(part: str, separators: List[str]) -> List[str]:
+            if size(part) <= max_bytes:
+                return [part]
+            if not separators:
+                # A single word over the limit: cut it so no chunk can exceed max_bytes (4 bytes per character at most)
+                step = max(1, max_bytes // 4)
+                return [part[i:i + step] for i in range(0, len(part), step)]
+            pieces = [piece for piece in re.split(separators[0], part) if piece]
+            return [smaller for piece in pieces for smaller in split_oversized(piece, separators[1:])]
+
+        text = text.strip()
+        if size(text) <= max_bytes:
+            return [text]
+        return pack(split_oversized(text, [r"(?<=[.!?…])\s+", r"(?<=[,;:])\s+", r"\s+"]))
+
+    @staticmethod
+    def _write_audio_file(output_filepath: str, audio_content: bytes):
+        """
+        Write synthesized audio to output_filepath, creating its directory if needed.
+
+        If the current task keeps its audio in memory, the audio is handed to its
+        store instead (see app.audio_store).
+        """
+        audio_store = current_audio_store.get()
+        if audio_store is not None:
+            audio_store.put(output_filepath, audio_content)
+            return
+        output_dir = os.path.dirname(output_filepath)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        with open(output_filepath, "wb") as out_file:
+            out_file.write(audio_content)
+
+    @staticmethod
+    def _build_voice_and_audio_config(
+        language_code: Optional[str],
+        speaker_gender: Optional[str],
+        voice_name: Optional[str],
+        voice_params: Optional[dict]
+    ) -> Tuple[texttospeech.VoiceSelectionParams, texttospeech.AudioConfig]:
+        """Build the voice selection and MP3 audio config of a synthesis request."""
+        voice_selection_params = texttospeech.VoiceSelectionParams(
+            language_code=language_code
+        )
+
+        # If a specific voice name is provided, it overrides gender selection
+        if voice_name:
+            # Example: "en-US-Neural2-F"
+            # Extract language code from voice name if possible
+            if '-' in voice_name:
+                # Extract language code from voice name (e.g., "en-GB" from "en-GB-Neural2-C")
+                extracted_lang_code = '-'.join(voice_name.split('-')[:2]).lower()
+                # Use extracted language code if available, otherwise use provided language_code
+                voice_language_code = extracted_lang_code
+                logger.info(f"Extracted language code '{voice_language_code}' from voice name '{voice_name}'")
+            else:
+                voice_language_code = language_code
+
+            voice_selection_params = texttospeech.VoiceSelectionParams(
+                language_code=voice_language_code,
+                name=voice_name,
+            )
+        # Otherwise use gender if provided
+        elif speaker_gender:
+            if speaker_gender.lower() == "male":
+                voice_selection_params.ssml_gender = texttospeech.SsmlVoiceGender.MALE
+            elif speaker_gender.lower() == "female":
+                voice_selection_params.ssml_gender = texttospeech.SsmlVoiceGender.FEMALE
+            elif speaker_gender.lower() == "neutral":
+                voice_selection_params.ssml_gender = texttospeech.SsmlVoiceGender.NEUTRAL
+            else:
+                logger.warning(f"Unsupported speaker_gender '{speaker_gender}'. Using default voice.")
+        # If neither voice_name nor speaker_gender is provided, the API will use a default voice for the language.
+
+        audio_config = texttospeech.AudioConfig(
+            audio_encoding=texttospeech.AudioEncoding.MP3
+        )
+
+        if voice_params:
+            if 'speaking_rate' in voice_params:
+                audio_config.speaking_rate = voice_params['speaking_rate']
+
+        return voice_selection_params, audio_config
+
+    async def _synthesize_unless_cancelled(self, cancellation_token, request, api_version: str = "v1"):
+        """
+        Run synthesize_speech on the async client once a concurrency slot is free,
+        skipping jobs whose task was cancelled while they waited for the slot.
+        """
+        cls = type(self)
+        semaphore = self._get_semaphore()
+        cls._waiting += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            cls._waiting -= 1
+        try:
+            if cancellation_token is not None:
+                cancellation_token.raise_if_cancelled()
+            cls._in_flight += 1
+            try:
+                return await self._get_async_client(api_version).synthesize_speech(request=request)
+            finally:
+                cls._in_flight -= 1
+        finally:
+            semaphore.release()
+
     async def text_to_audio_async(
         self,
         text_input: str,
@@ -443,50 +514,18 @@ class GoogleCloudTtsService:
             logger.error("Text input and output filepath cannot be empty.")
             return False
 
+        # Cancellation token of the podcast task this synthesis runs for (if any)
+        cancellation_token = current_cancellation_token.get()
+        if cancellation_token is not None:
+            cancellation_token.raise_if_cancelled()
+
         try:
             synthesis_input = texttospeech.SynthesisInput(text=text_input)
 
-            voice_selection_params = texttospeech.VoiceSelectionParams(
-                language_code=language_code
+            voice_selection_params, audio_config = self._build_voice_and_audio_config(
+                language_code, speaker_gender, voice_name, voice_params
             )
 
-            # If a specific voice name is provided, it overrides gender selection
-            if voice_name:
-                # Example: "en-US-Neural2-F"
-                # Extract language code from voice name if possible
-                if '-' in voice_name:
-                    # Extract language code from voice name (e.g., "en-GB" from "en-GB-Neural2-C")
-                    extracted_lang_code = '-'.join(voice_name.split('-')[:2]).lower()
-                    # Use extracted language code if available, otherwise use provided language_code
-                    voice_language_code = extracted_lang_code
-                    logger.info(f"Extracted language code '{voice_language_code}' from voice name '{voice_name}'")
-                else:
-                    voice_language_code = language_code
-                    
-                voice_selection_params = texttospeech.VoiceSelectionParams(
-                    language_code=voice_language_code,
-                    name=voice_name,
-                )
-            # Otherwise use gender if provided
-            elif speaker_gender:
-                if speaker_gender.lower() == "male":
-                    voice_selection_params.ssml_gender = texttospeech.SsmlVoiceGender.MALE
-                elif speaker_gender.lower() == "female":
-                    voice_selection_params.ssml_gender = texttospeech.SsmlVoiceGender.FEMALE
-                elif speaker_gender.lower() == "neutral":
-                    voice_selection_params.ssml_gender = texttospeech.SsmlVoiceGender.NEUTRAL
-                else:
-                    logger.warning(f"Unsupported speaker_gender '{speaker_gender}'. Using default voice.")
-            # If neither voice_name nor speaker_gender is provided, the API will use a default voice for the language.
-
-            audio_config = texttospeech.AudioConfig(
-                audio_encoding=texttospeech.AudioEncoding.MP3
-            )
-
-            if voice_params:
-                if 'speaking_rate' in voice_params:
-                    audio_config.speaking_rate = voice_params['speaking_rate']
-
             # Enhanced logging with all voice parameters
             log_message = f"Requesting speech synthesis for text: '{text_input[:50]}...' with "
             log_message += f"lang='{language_code}'"
@@ -503,85 +542,49 @@ class GoogleCloudTtsService:
                 
             logger.info(log_message)
 
+            # Identical text, voice and audio config were synthesized before: reuse that audio
+            cache = get_tts_synthesis_cache()
+            cache_key = None
+            if cache is not None:
+                cache_key = cache.make_key(
+                    texttospeech.SynthesisInput.to_dict(synthesis_input),
+                    texttospeech.VoiceSelectionParams.to_dict(voice_selection_params),
+                    texttospeech.AudioConfig.to_dict(audio_config),
+                )
+                cached_audio = await asyncio.to_thread(cache.get, cache_key, self._metrics.get_avg_processing_time())
+                if cached_audio is not None:
+                    self._write_audio_file(output_filepath, cached_audio)
+                    logger.info(f"Audio content from TTS synthesis cache written to file: {output_filepath}")
+                    return True
+
             # Log metrics periodically during active TTS operations
             self.log_metrics_if_needed()
 
-            # The synthesize_speech method is blocking, so run it in a separate thread
-            # Check executor health before attempting to use it
-            if not self._executor_is_healthy():
-                logger.warning("TTS executor is shutdown, attempting to recreate...")
-                # Try to recreate the executor
-                self._executor = None
-                executor = self._get_executor()
-                if not self._executor_is_healthy():
-                    logger.error("Unable to create healthy TTS executor, falling back to synchronous execution")
-                    # Fall back to synchronous execution as last resort
-                    synthesis_func = functools.partial(
-                        self.client.synthesize_speech,
-                        request={
-                            "input": synthesis_input,
-                            "voice": voice_selection_params,
-                            "audio_config": audio_config,
-                        }
-                    )
-                    try:
-                        response = synthesis_func()
-                    except Exception as e:
-                        logger.error(f"Synchronous TTS fallback failed: {e}")
-                        raise RuntimeError(f"TTS synthesis failed with synchronous fallback: {e}")
-                else:
-                    executor = self._get_executor()
-            else:
-                executor = self._get_executor()
-            
-            if self._executor_is_healthy():
-                # Create a partial function to avoid event loop issues
-                synthesis_func = functools.partial(
-                    self.client.synthesize_speech,
-                    request={
-                        "input": synthesis_input,
-                        "voice": voice_selection_params,
-                        "audio_config": audio_config,
-                    }
-                )
-                
-                # Submit to our dedicated executor and await the result
-                try:
-                    start_time = time.time()
-                    future = executor.submit(synthesis_func)
-                    response = await asyncio.wrap_future(future)
-                    processing_time = time.time() - start_time
-                    self._metrics.record_job(processing_time, True)
-                except RuntimeError as e:
-                    if "cannot schedule new futures after interpreter shutdown" in str(e):
-                        logger.warning("Executor shutdown during TTS call, falling back to synchronous execution")
-                        # Fall back to synchronous execution
-                        response = synthesis_func()
-                        processing_time = time.time() - start_time
-                        self._metrics.record_job(processing_time, True)
-                    else:
-                        raise
-            else:
-                # If executor is not healthy, use synchronous execution
-                synthesis_func = functools.partial(
-                    self.client.synthesize_speech,
+            # Turns over the API's input limit are split at sentence boundaries; the chunks are
+            # synthesized concurrently and their MP3s concatenated (MP3 frames can be joined as-is)
+            chunks = self._split_text_for_synthesis(text_input, get_config().tts_max_input_bytes)
+            if len(chunks) > 1:
+                logger.info(f"Synthesizing {len(text_input.encode('utf-8'))}-byte text in {len(chunks)} chunks")
+
+            start_time = time.time()
+            responses = await asyncio.gather(*(
+                self._synthesize_unless_cancelled(
+                    cancellation_token,
                     request={
-                        "input": synthesis_input,
+                        "input": texttospeech.SynthesisInput(text=chunk),
                         "voice": voice_selection_params,
                         "audio_config": audio_config,
                     }
                 )
-                response = synthesis_func()
-                processing_time = time.time() - start_time
-                self._metrics.record_job(processing_time, True)
+                for chunk in chunks
+            ))
+            audio_content = b"".join(response.audio_content for response in responses)
+            self._metrics.record_job(time.time() - start_time, True)
             
-            # Ensure output directory exists
-            output_dir = os.path.dirname(output_filepath)
-            if output_dir:
-                 os.makedirs(output_dir, exist_ok=True)
+            if cache is not None:
+                await asyncio.to_thread(cache.set, cache_key, audio_content)
 
-            with open(output_filepath, "wb") as out_file:
-                out_file.write(response.audio_content)
+            self._write_audio_file(output_filepath, audio_content)
             logger.info(f"Audio content written to file: {output_filepath}")
             return True
 
@@ -590,6 +593,122 @@ class GoogleCloudTtsService:
             self._metrics.record_job(0, False)
             return False
 
+    @staticmethod
+    def supports_ssml_marks(voice_name: Optional[str]) -> bool:
+        """Check if a voice accepts SSML with <mark> tags; a voice left to the API is not assumed to."""
+        parts = (voice_name or "").split("-")
+        return len(parts) >= 3 and parts[2] in SSML_MARK_VOICE_TYPES
+
+    @staticmethod
+    def build_turns_ssml(turn_texts: List[str], break_ms: int = SSML_TURN_BREAK_MS) -> str:
+        """
+        Build one SSML document speaking turn_texts in order, with a pause between turns.
+
+        Each turn starts with a <mark name="turn_N"/> so the API reports where it begins.
+        """
+        parts = []
+        for i, text in enumerate(turn_texts):
+            if i > 0:
+                parts.append(f'<break time="{break_ms}ms"/>')
+            parts.append(f'<mark name="turn_{i}"/>{html.escape(text, quote=False)}')
+        return f"<speak>{''.join(parts)}</speak>"
+
+    async def turns_to_audio_async(
+        self,
+        turn_texts: List[str],
+        output_filepath: str,
+        language_code: Optional[str] = "en-US",
+        speaker_gender: str = None,
+        voice_name: str = None,
+        voice_params: dict = None
+    ) -> Optional[List[Optional[float]]]:
+        """
+        Synthesizes consecutive turns of one voice in a single SSML request and saves the audio.
+
+        Args:
+            turn_texts: Texts of the turns, in speaking order.
+            output_filepath: The path to save the output audio file.
+            language_code, speaker_gender, voice_name, voice_params: As for text_to_audio_async.
+
+        Returns:
+            Start offset in seconds of each turn within the audio (None for a turn whose
+            mark was not reported), or None if synthesis failed or the SSML is over the
+            input limit or the voice does not accept SSML marks; callers then synthesize
+            the turns one by one.
+        """
+        if not turn_texts or not output_filepath:
+            logger.error("Turn texts and output filepath cannot be empty.")
+            return None
+
+        if not self.supports_ssml_marks(voice_name):
+            logger.info(f"Voice '{voice_name or speaker_gender or 'default'}' does not accept SSML marks, not batching turns")
+            return None
+
+        ssml = self.build_turns_ssml(turn_texts)
+        if len(ssml.encode("utf-8")) > get_config().tts_max_input_bytes:
+            logger.warning(f"SSML for {len(turn_texts)} turns exceeds the TTS input limit, not batching them")
+            return None
+
+        cancellation_token = current_cancellation_token.get()
+        if cancellation_token is not None:
+            cancellation_token.raise_if_cancelled()
+
+        try:
+            voice_selection_params, audio_config = self._build_voice_and_audio_config(
+                language_code, speaker_gender, voice_name, voice_params
+            )
+            voice = texttospeech.VoiceSelectionParams.to_dict(voice_selection_params)
+            audio = texttospeech.AudioConfig.to_dict(audio_config)
+            logger.info(
+                f"Requesting SSML speech synthesis for {len(turn_texts)} turns "
+                f"({len(ssml.encode('utf-8'))} bytes) with voice='{voice_name or speaker_gender or 'default'}'"
+            )
+
+            # Audio and turn offsets are cached under separate keys of the same request
+            cache = get_tts_synthesis_cache()
+            audio_key = offsets_key = None
+            if cache is not None:
+                audio_key = cache.make_key({"ssml": ssml}, voice, audio)
+                offsets_key = cache.make_key({"ssml": ssml, "timepoints": "SSML_MARK"}, voice, audio)
+                cached_audio = await asyncio.to_thread(cache.get, audio_key, self._metrics.get_avg_processing_time())
+                cached_offsets = await asyncio.to_thread(cache.get, offsets_key) if cached_audio is not None else None
+                if cached_audio is not None and cached_offsets is not None:
+                    self._write_audio_file(output_filepath, cached_audio)
+                    logger.info(f"Audio content from TTS synthesis cache written to file: {output_filepath}")
+                    return json.loads(cached_offsets)
+
+            self.log_metrics_if_needed()
+
+            # Mark timepoints are only reported by the v1beta1 API
+            request = texttospeech_v1beta1.SynthesizeSpeechRequest(
+                input=texttospeech_v1beta1.SynthesisInput(ssml=ssml),
+                voice=texttospeech_v1beta1.VoiceSelectionParams(voice),
+                audio_config=texttospeech_v1beta1.AudioConfig(audio),
+                enable_time_pointing=[texttospeech_v1beta1.SynthesizeSpeechRequest.TimepointType.SSML_MARK],
+            )
+            start_time = time.time()
+            response = await self._synthesize_unless_cancelled(cancellation_token, request, api_version="v1beta1")
+            self._metrics.record_job(time.time() - start_time, True)
+
+            mark_times = {timepoint.mark_name: timepoint.time_seconds for timepoint in response.timepoints}
+            # The first turn starts the audio even if its mark was not reported
+            offsets = [0.0 if i == 0 else mark_times.get(f"turn_{i}") for i in range(len(turn_texts))]
+            if None in offsets:
+                logger.warning(f"TTS response is missing turn marks for {output_filepath}, turn offsets are incomplete")
+
+            if cache is not None:
+                await asyncio.to_thread(cache.set, audio_key, response.audio_content)
+                await asyncio.to_thread(cache.set, offsets_key, json.dumps(offsets).encode("utf-8"))
+
+            self._write_audio_file(output_filepath, response.audio_content)
+            logger.info(f"Audio content for {len(turn_texts)} turns written to file: {output_filepath}")
+            return offsets
+
+        except Exception as e:
+            logger.error(f"Error during batched text-to-speech synthesis: {e}", exc_info=True)
+            self._metrics.record_job(0, False)
+            return None
+
 # Example usage (for testing purposes, can be removed later)
 async def main_tts_test():
     print("Testing TTS Service...")
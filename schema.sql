@@ -6,9 +6,26 @@ CREATE TABLE IF NOT EXISTS podcast_status (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     last_updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     request_data TEXT NOT NULL,
+    request_fingerprint TEXT,
     result_episode TEXT,
     error_message TEXT,
     error_details TEXT,
     artifacts TEXT DEFAULT '{}',
     logs TEXT DEFAULT '[]'
 );
+
+CREATE INDEX IF NOT EXISTS ix_podcast_status_request_fingerprint ON podcast_status (request_fingerprint);
+
+CREATE TABLE IF NOT EXISTS podcast_checkpoint (
+    task_id TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (task_id, stage)
+);
+
+CREATE TABLE IF NOT EXISTS source_analysis_cache (
+    content_hash TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
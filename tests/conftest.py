@@ -0,0 +1,50 @@
+"""
+Shared fixtures for the test suite.
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Add the project root to the path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.podcast_workflow import PodcastGeneratorService
+from app.tts_service import GoogleCloudTtsService
+
+
+@pytest.fixture
+def status_manager():
+    """StatusManager mock returned by the workflow's get_status_manager"""
+    manager = MagicMock()
+    with patch("app.podcast_workflow.get_status_manager", return_value=manager):
+        yield manager
+
+
+@pytest.fixture
+def make_tts_service():
+    """Factory for a GoogleCloudTtsService without credentials or a voice catalogue"""
+
+    def make():
+        service = GoogleCloudTtsService.__new__(GoogleCloudTtsService)
+        service.voice_cache = {}
+        return service
+
+    return make
+
+
+@pytest.fixture
+def make_generator_service():
+    """Factory for a PodcastGeneratorService wired to the given collaborators"""
+
+    def make(tts_service=None, llm_service=None, cloud_storage_manager=None):
+        service = PodcastGeneratorService.__new__(PodcastGeneratorService)
+        service.config = None
+        service.tts_service = tts_service
+        service.llm_service = llm_service
+        service.cloud_storage_manager = cloud_storage_manager
+        return service
+
+    return make
@@ -0,0 +1,117 @@
+"""
+Test suite for the in-memory hand-off of synthesized audio within a task.
+"""
+
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+# Add the project root to the path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.audio_store import InMemoryAudioStore, current_audio_store, read_audio
+from app.podcast_models import DialogueTurn, PodcastEpisode
+from app.podcast_workflow import EpisodePreview
+from app.storage import CloudStorageManager
+
+
+class FakeTtsClient:
+    """TextToSpeechAsyncClient that answers with the requested text as audio"""
+
+    async def synthesize_speech(self, request):
+        return MagicMock(audio_content=request["input"].text.encode())
+
+
+@pytest.fixture
+def audio_store():
+    store = InMemoryAudioStore(max_bytes=1000)
+    token = current_audio_store.set(store)
+    yield store
+    current_audio_store.reset(token)
+
+
+class TestInMemoryAudioStore:
+    """Test InMemoryAudioStore"""
+
+    def test_audio_over_budget_spills_to_disk(self, tmp_path):
+        store = InMemoryAudioStore(max_bytes=10)
+        store.put(str(tmp_path / "a.mp3"), b"a" * 6)
+        store.put(str(tmp_path / "b.mp3"), b"b" * 6)
+
+        assert store.get(str(tmp_path / "a.mp3")) == b"a" * 6
+        assert store.get(str(tmp_path / "b.mp3")) is None
+        assert (tmp_path / "b.mp3").read_bytes() == b"b" * 6
+        assert not (tmp_path / "a.mp3").exists()
+        assert store.size_bytes == 6
+
+    def test_spill_all_writes_and_releases_audio(self, tmp_path):
+        store = InMemoryAudioStore(max_bytes=100)
+        store.put(str(tmp_path / "segments" / "a.mp3"), b"audio")
+
+        assert store.spill_all() == 1
+
+        assert (tmp_path / "segments" / "a.mp3").read_bytes() == b"audio"
+        assert store.get(str(tmp_path / "segments" / "a.mp3")) is None
+        assert store.size_bytes == 0
+
+    def test_read_audio_prefers_memory_over_disk(self, tmp_path, audio_store):
+        (tmp_path / "a.mp3").write_bytes(b"stale")
+        audio_store.put(str(tmp_path / "a.mp3"), b"fresh")
+        (tmp_path / "b.mp3").write_bytes(b"on disk")
+
+        assert read_audio(str(tmp_path / "a.mp3")) == b"fresh"
+        assert read_audio(str(tmp_path / "b.mp3")) == b"on disk"
+
+
+class TestInMemoryHandOff:
+    """Test that synthesized audio reaches upload, preview and stitching without temp files"""
+
+    @pytest.mark.asyncio
+    async def test_turn_audio_kept_in_memory_for_upload_and_preview(
+        self, tmp_path, audio_store, status_manager, make_generator_service, make_tts_service
+    ):
+        storage = MagicMock()
+        storage.upload_audio_segment_async = AsyncMock()
+        service = make_generator_service(make_tts_service(), cloud_storage_manager=storage)
+        turns = [DialogueTurn(turn_id=i + 1, speaker_id="Host", speaker_gender="Female", text=f"turn {i}") for i in range(3)]
+        base = PodcastEpisode(title="Preview", summary="", transcript="", audio_filepath="", source_attributions=[], warnings=[])
+        preview = EpisodePreview("task-123456789", base, str(tmp_path / "preview.mp3"), publish_every_turns=10)
+
+        with patch("app.tts_service.texttospeech.TextToSpeechAsyncClient", return_value=FakeTtsClient()):
+            paths = await service._generate_dialogue_audio_async(
+                "task-123456789", turns, {}, str(tmp_path / "segments"), [], preview
+            )
+
+        assert not (tmp_path / "segments").exists()
+        assert [audio_store.get(path) for path in paths] == [b"turn 0", b"turn 1", b"turn 2"]
+        assert [c.args[1] for c in storage.upload_audio_segment_async.call_args_list] == [b"turn 0", b"turn 1", b"turn 2"]
+        assert (tmp_path / "preview.mp3").read_bytes() == b"turn 0turn 1turn 2"
+
+    @pytest.mark.asyncio
+    async def test_stitcher_decodes_audio_from_memory(self, tmp_path, audio_store, make_generator_service):
+        audio_store.put(str(tmp_path / "turn_000.mp3"), b"in memory")
+        (tmp_path / "turn_001.mp3").write_bytes(b"on disk")
+
+        with patch("pydub.AudioSegment.from_file") as from_file, patch("pydub.AudioSegment.from_mp3") as from_mp3:
+            output = await make_generator_service()._stitch_audio_segments_async(
+                [str(tmp_path / "turn_000.mp3"), str(tmp_path / "turn_001.mp3")], str(tmp_path)
+            )
+
+        assert output == str(tmp_path / "final_podcast.mp3")
+        assert from_file.call_args.args[0].getvalue() == b"in memory"
+        from_mp3.assert_called_once_with(str(tmp_path / "turn_001.mp3"))
+
+    @pytest.mark.asyncio
+    async def test_segment_upload_sends_buffered_bytes(self):
+        manager = CloudStorageManager.__new__(CloudStorageManager)
+        manager.config = MagicMock(audio_bucket="audio", is_local_environment=False)
+        manager.client = MagicMock()
+        blob = manager.client.bucket.return_value.blob.return_value
+
+        url = await manager.upload_audio_segment_async("/nonexistent/turn_000_Host.mp3", b"audio")
+
+        assert url == blob.public_url
+        blob.upload_from_string.assert_called_once_with(b"audio", content_type="audio/mpeg")
+        blob.upload_from_filename.assert_not_called()
@@ -0,0 +1,121 @@
+"""
+Test suite for cooperative cancellation of podcast generation tasks.
+"""
+
+import asyncio
+import os
+import sys
+import uuid
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+# Add the project root to the path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.podcast_workflow import PodcastGeneratorService
+from app.status_manager import StatusManager
+from app.task_runner import CancellationToken, TaskRunner, raise_if_cancelled
+from app.tts_service import GoogleCloudTtsService
+
+
+class TestTaskRunnerCancellation:
+    """Test cancellation tokens managed by TaskRunner"""
+
+    @pytest.mark.asyncio
+    async def test_token_is_current_in_child_tasks_and_cancel_frees_capacity(self):
+        runner = TaskRunner(max_workers=1)
+        started = asyncio.Event()
+        unwinding = asyncio.Event()
+        release = asyncio.Event()
+        seen_tokens = []
+
+        async def job():
+            async def child():
+                await asyncio.sleep(3600)
+
+            child_task = asyncio.create_task(child())
+            started.set()
+            try:
+                await child_task
+            except asyncio.CancelledError:
+                # Slow cleanup (e.g. a cancellation webhook) must not hold the slot
+                unwinding.set()
+                try:
+                    raise_if_cancelled()
+                except asyncio.CancelledError:
+                    seen_tokens.append("cancelled")
+                await release.wait()
+                raise
+
+        await runner.submit_async_task("task-1", job)
+        await started.wait()
+        assert not runner.can_accept_new_task()
+
+        assert await runner.cancel_task("task-1") is True
+        await unwinding.wait()
+
+        assert seen_tokens == ["cancelled"]
+        assert runner.is_task_running("task-1")
+        assert runner.is_cancellation_requested("task-1")
+        assert runner.can_accept_new_task()
+
+        release.set()
+        await asyncio.sleep(0.05)
+        assert not runner.is_task_running("task-1")
+        assert runner.get_cancellation_token("task-1") is None
+
+    @pytest.mark.asyncio
+    async def test_check_cancellation_sees_token_from_inside_the_task(self):
+        runner = TaskRunner(max_workers=1)
+        token = CancellationToken("task-2")
+        runner._cancellation_tokens["task-2"] = token
+        service = PodcastGeneratorService()
+
+        with patch("app.podcast_workflow.get_task_runner", return_value=runner):
+            service._check_cancellation("task-2")
+            token.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                service._check_cancellation("task-2")
+
+
+class TestTtsCancellation:
+    """Test that queued TTS work is skipped for cancelled tasks"""
+
+    @pytest.mark.asyncio
+    async def test_queued_synthesis_skipped_after_cancel(self):
+        tts_service = GoogleCloudTtsService.__new__(GoogleCloudTtsService)
+        async_client = AsyncMock()
+        token = CancellationToken("task-3")
+
+        with patch("app.tts_service.texttospeech.TextToSpeechAsyncClient", return_value=async_client):
+            await tts_service._synthesize_unless_cancelled(token, request={"input": "a"})
+            token.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await tts_service._synthesize_unless_cancelled(token, request={"input": "b"})
+
+        assert async_client.synthesize_speech.call_count == 1
+
+
+class TestCancelPodcastGeneration:
+    """Test PodcastGeneratorService.cancel_podcast_generation_async"""
+
+    @pytest.mark.asyncio
+    async def test_orphaned_task_is_marked_cancelled(self):
+        manager = StatusManager()
+        task_id = str(uuid.uuid4())
+        manager.create_status(task_id, {"source_urls": ["https://example.com/"]})
+        manager.update_status(task_id, "generating_dialogue", "Writing dialogue", 60.0)
+        service = PodcastGeneratorService()
+
+        with patch("app.podcast_workflow.get_status_manager", return_value=manager), \
+             patch("app.podcast_workflow.get_task_runner", return_value=TaskRunner(max_workers=1)):
+            assert await service.cancel_podcast_generation_async(task_id) is False
+            assert manager.get_status(task_id).status == "cancelled"
+
+            with pytest.raises(ValueError):
+                await service.cancel_podcast_generation_async(task_id)
+            with pytest.raises(ValueError):
+                await service.cancel_podcast_generation_async(str(uuid.uuid4()))
+
+        manager.delete_status(task_id)
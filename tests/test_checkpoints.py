@@ -0,0 +1,108 @@
+"""
+Test suite for stage checkpointing and resume of podcast generation tasks.
+"""
+
+import os
+import sys
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+# Add the project root to the path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.podcast_workflow import PodcastGeneratorService
+from app.podcast_models import (
+    DialogueTurn, OutlineSegment, PersonaResearch, PodcastOutline, PodcastRequest, SourceAnalysis
+)
+from app.status_manager import StatusManager
+
+
+def _checkpoints():
+    outline = PodcastOutline(
+        title_suggestion="Checkpointed Title",
+        summary_suggestion="Checkpointed summary",
+        segments=[OutlineSegment(segment_id="seg_1", speaker_id="Host", content_cue="Intro")]
+    )
+    persona = PersonaResearch(
+        person_id="ada",
+        name="Ada Lovelace",
+        detailed_profile="Mathematician",
+        gender="Female",
+        tts_voice_id="en-US-Chirp3-HD-Voice0"
+    )
+    turns = [DialogueTurn(turn_id=1, speaker_id="Host", speaker_gender="Female", text="Welcome back")]
+    return {
+        "extraction": {"texts": ["source text"], "source_attributions": ["https://example.com/"]},
+        "source_analysis": SourceAnalysis(summary_points=["point"], detailed_analysis="analysis").model_dump(mode="json"),
+        "persona_research": [persona.model_dump(mode="json")],
+        "outline": outline.model_dump(mode="json"),
+        "dialogue": [turn.model_dump(mode="json") for turn in turns],
+    }
+
+
+class TestStatusManagerCheckpoints:
+    """Test checkpoint persistence in StatusManager"""
+
+    def test_save_get_delete_checkpoints(self):
+        manager = StatusManager()
+        task_id = str(uuid.uuid4())
+
+        manager.save_checkpoint(task_id, "outline", {"title": "first"})
+        manager.save_checkpoint(task_id, "outline", {"title": "second"})
+        manager.save_checkpoint(task_id, "dialogue", [{"turn_id": 1}])
+
+        assert manager.get_checkpoints(task_id) == {
+            "outline": {"title": "second"},
+            "dialogue": [{"turn_id": 1}],
+        }
+        assert manager.delete_checkpoints(task_id) == 2
+        assert manager.get_checkpoints(task_id) == {}
+
+
+class TestResumeFromCheckpoints:
+    """Test that checkpointed stages are restored instead of re-run"""
+
+    @pytest.mark.asyncio
+    async def test_completed_stages_are_not_rerun(self, tmp_path, make_generator_service):
+        status_manager = MagicMock()
+        status_manager.get_checkpoints.return_value = _checkpoints()
+
+        llm = MagicMock()
+        for method in ("analyze_source_text_async", "research_persona_async",
+                       "generate_podcast_outline_async", "generate_dialogue_async"):
+            setattr(llm, method, AsyncMock(side_effect=AssertionError(f"{method} should not run")))
+
+        tts = MagicMock()
+        tts.get_voices_by_gender.return_value = [{"voice_id": "en-US-Chirp3-HD-Voice1", "speaking_rate": 1.0}]
+        tts.text_to_audio_async = AsyncMock(return_value=False)
+
+        service = make_generator_service(tts, llm)
+
+        request = PodcastRequest(source_urls=["https://example.com/"], prominent_persons=["Ada Lovelace"])
+        with patch("app.podcast_workflow.get_status_manager", return_value=status_manager), \
+                patch("app.podcast_workflow.extract_content_from_url", AsyncMock(side_effect=AssertionError)):
+            episode = await service._execute_podcast_generation_core("task-123456789", request)
+
+        assert episode.title == "Checkpointed Title"
+        assert episode.source_attributions == ["https://example.com/"]
+        assert "Host: Welcome back" in episode.transcript
+        tts.text_to_audio_async.assert_awaited_once()
+        status_manager.save_checkpoint.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_resume_rejects_running_task(self):
+        status_manager = MagicMock()
+        status_manager.get_status.return_value = MagicMock(
+            status="generating_audio_segments", request_data=PodcastRequest(source_urls=["https://example.com/"])
+        )
+        task_runner = MagicMock()
+        task_runner.is_task_running.return_value = True
+
+        service = PodcastGeneratorService.__new__(PodcastGeneratorService)
+        with patch("app.podcast_workflow.get_status_manager", return_value=status_manager), \
+                patch("app.podcast_workflow.get_task_runner", return_value=task_runner):
+            with pytest.raises(ValueError, match="still running"):
+                await service.resume_podcast_generation_async("task-123456789")
+        task_runner.submit_async_task.assert_not_called()
@@ -0,0 +1,118 @@
+"""
+Test suite for map-reduce analysis of long source texts.
+"""
+
+import asyncio
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+# Add the project root to the path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.llm_service import GeminiService
+from app.podcast_models import SourceAnalysis
+
+
+def _paragraph(index, sentences=5):
+    return " ".join(f"Paragraph {index} sentence {n} has some facts." for n in range(sentences))
+
+
+LONG_TEXT = "\n\n".join(_paragraph(i) for i in range(12))
+
+
+class RecordingGeminiService(GeminiService):
+    """GeminiService whose LLM calls are answered locally"""
+
+    def __init__(self, fail_chunks=(), fail_reduce=False):
+        self.model_name = "gemini-test"
+        self._source_contexts = {}
+        self.fail_chunks = fail_chunks
+        self.fail_reduce = fail_reduce
+        self.chunk_prompts = []
+        self.reduce_prompts = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate_text_async(self, prompt, timeout_seconds=180, result_type=None):
+        if "partial briefings" in prompt:
+            self.reduce_prompts.append(prompt)
+            if self.fail_reduce:
+                raise RuntimeError("reduce failed")
+            return SourceAnalysis(summary_points=["merged"], detailed_analysis="merged analysis")
+
+        index = len(self.chunk_prompts)
+        self.chunk_prompts.append(prompt)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.02)
+        finally:
+            self.in_flight -= 1
+        if index in self.fail_chunks:
+            raise RuntimeError(f"chunk {index} failed")
+        return SourceAnalysis(summary_points=[f"point {index}"], detailed_analysis=f"analysis {index}")
+
+
+@pytest.fixture
+def chunking_env():
+    with patch.dict(os.environ, {"SOURCE_ANALYSIS_CHUNK_CHARS": "800", "SOURCE_ANALYSIS_MAX_CONCURRENCY": "2"}):
+        yield
+
+
+class TestSplitSourceText:
+    """Test GeminiService._split_source_text"""
+
+    def test_chunks_respect_size_and_paragraph_boundaries(self):
+        chunks = GeminiService._split_source_text(LONG_TEXT, 800)
+
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 800 for chunk in chunks)
+        paragraphs = LONG_TEXT.split("\n\n")
+        assert "\n\n".join(chunks) == LONG_TEXT
+        assert all(any(paragraph in chunk for chunk in chunks) for paragraph in paragraphs)
+
+    def test_long_paragraphs_split_at_sentences_then_words(self):
+        text = _paragraph(0, sentences=40) + "\n\n" + " ".join(["word"] * 500)
+
+        chunks = GeminiService._split_source_text(text, 300)
+
+        assert all(len(chunk) <= 300 for chunk in chunks)
+        assert all(chunk.endswith(".") for chunk in chunks if chunk.startswith("Paragraph"))
+        assert " ".join(chunks).split() == text.split()
+
+
+class TestChunkedSourceAnalysis:
+    """Test map-reduce source analysis in analyze_source_text_async"""
+
+    @pytest.mark.asyncio
+    async def test_chunks_analyzed_concurrently_then_merged(self, chunking_env):
+        service = RecordingGeminiService()
+
+        result = await service.analyze_source_text_async(LONG_TEXT)
+
+        assert result.summary_points == ["merged"]
+        assert len(service.chunk_prompts) == len(GeminiService._split_source_text(LONG_TEXT, 800))
+        assert service.max_in_flight == 2
+        assert len(service.reduce_prompts) == 1
+        assert all(f"point {i}" in service.reduce_prompts[0] for i in range(len(service.chunk_prompts)))
+
+    @pytest.mark.asyncio
+    async def test_failed_chunks_skipped_and_failed_merge_concatenates(self, chunking_env):
+        service = RecordingGeminiService(fail_chunks={0}, fail_reduce=True)
+
+        result = await service.analyze_source_text_async(LONG_TEXT)
+
+        assert "point 0" not in result.summary_points
+        assert result.summary_points == [f"point {i}" for i in range(1, len(service.chunk_prompts))]
+
+    @pytest.mark.asyncio
+    async def test_short_text_uses_single_call(self, chunking_env):
+        service = RecordingGeminiService()
+
+        await service.analyze_source_text_async(_paragraph(0))
+
+        assert len(service.chunk_prompts) == 1
+        assert service.reduce_prompts == []
@@ -238,3 +238,18 @@ async def test_generate_text_async_integration_source_analysis_format(gemini_ser
     except Exception as e:
         # Catch other potential errors like API connection issues, etc.
         pytest.fail(f"An unexpected error occurred during the integration test: {e}\nResponse (first 500 chars): {result_str[:500]}...")
+
+
+@pytest.mark.asyncio
+async def test_generate_text_async_reuses_agent_per_result_type(gemini_service):
+    from app.podcast_models import SourceAnalysis, PodcastOutline
+    analysis = SourceAnalysis(summary_points=["point"], detailed_analysis="analysis")
+
+    with patch("app.llm_service.Agent") as mock_agent_cls:
+        mock_agent_cls.return_value.run = AsyncMock(return_value=Mock(data=analysis))
+        assert await gemini_service.generate_text_async("first prompt", result_type=SourceAnalysis) == analysis
+        assert await gemini_service.generate_text_async("second prompt", result_type=SourceAnalysis) == analysis
+        assert mock_agent_cls.call_count == 1
+
+        await gemini_service.generate_text_async("third prompt", result_type=PodcastOutline)
+        assert mock_agent_cls.call_count == 2
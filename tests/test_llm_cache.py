@@ -0,0 +1,84 @@
+"""
+Test suite for the persistent LLM response cache.
+"""
+
+import os
+import sys
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+# Add the project root to the path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.llm_cache import LlmResponseCache
+from app.llm_service import GeminiService
+from app.podcast_models import SourceAnalysis
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return LlmResponseCache(str(tmp_path / "llm_cache.db"), ttl_seconds=3600, max_entries=3)
+
+
+class TestLlmResponseCache:
+    """Test LlmResponseCache storage, expiry and eviction"""
+
+    def test_round_trips_text_and_models(self, cache):
+        analysis = SourceAnalysis(summary_points=["a", "b"], detailed_analysis="details")
+        model_key = cache.make_key("model", "prompt", SourceAnalysis)
+        text_key = cache.make_key("model", "prompt", None)
+        assert model_key != text_key
+        assert model_key != cache.make_key("other-model", "prompt", SourceAnalysis)
+
+        cache.set(model_key, "model", analysis, SourceAnalysis, generation_seconds=12.0)
+        cache.set(text_key, "model", "plain text", None)
+
+        assert cache.get(model_key, SourceAnalysis) == (True, analysis)
+        assert cache.get(text_key, None) == (True, "plain text")
+        assert cache.get(cache.make_key("model", "other prompt", None), None) == (False, None)
+
+        metrics = cache.metrics.get_metrics()
+        assert metrics["hits"] == 2
+        assert metrics["misses"] == 1
+        assert metrics["estimated_seconds_saved"] == 12.0
+
+    def test_expired_entries_are_misses(self, cache):
+        cache.ttl_seconds = 0
+        key = cache.make_key("model", "prompt", None)
+        cache.set(key, "model", "stale", None)
+        time.sleep(0.01)
+        assert cache.get(key, None) == (False, None)
+
+    def test_least_recently_used_entries_are_evicted(self, cache):
+        keys = [cache.make_key("model", f"prompt {i}", None) for i in range(4)]
+        for i, key in enumerate(keys[:3]):
+            cache.set(key, "model", f"response {i}", None)
+            time.sleep(0.01)
+        # Touch the oldest entry so the second one becomes least recently used
+        assert cache.get(keys[0], None)[0]
+        cache.set(keys[3], "model", "response 3", None)
+
+        assert cache.get(keys[0], None)[0]
+        assert cache.get(keys[1], None) == (False, None)
+        assert cache.get(keys[3], None)[0]
+        assert cache.metrics.evictions == 1
+
+
+class TestGenerateTextCaching:
+    """Test that GeminiService.generate_text_async uses the cache"""
+
+    @pytest.mark.asyncio
+    async def test_repeat_prompt_is_served_from_cache(self, cache):
+        service = GeminiService.__new__(GeminiService)
+        service.model_name = "gemini-test"
+        service.pydantic_agent = MagicMock()
+        service.pydantic_agent.run = AsyncMock(return_value=MagicMock(data="generated"))
+
+        with patch("app.llm_service.get_llm_response_cache", return_value=cache):
+            first = await service.generate_text_async("same prompt")
+            second = await service.generate_text_async("same prompt")
+
+        assert first == second == "generated"
+        assert service.pydantic_agent.run.await_count == 1
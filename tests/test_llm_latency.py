@@ -0,0 +1,184 @@
+"""
+Test suite for adaptive timeouts and hedged requests of LLM calls.
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+from pydantic_ai import Agent
+from pydantic_ai.messages import ModelResponse, TextPart, ToolCallPart
+from pydantic_ai.models.function import FunctionModel
+
+# Add the project root to the path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import app.llm_latency as llm_latency
+from app.llm_latency import LlmLatencyTracker
+from app.llm_service import GeminiService
+from app.podcast_models import PodcastOutline
+
+
+def _tracker(**kwargs):
+    options = dict(min_samples=5, p99_multiplier=2.0, floor_seconds=0.01)
+    options.update(kwargs)
+    return LlmLatencyTracker(**options)
+
+
+def _warm_up(tracker, call_type, seconds, count=10):
+    for _ in range(count):
+        tracker._record_latency(call_type, seconds)
+
+
+def _call(delays):
+    """Call whose n-th request takes delays[n] seconds and answers with its index"""
+    calls = []
+
+    async def call(attempt):
+        index = len(calls)
+        calls.append(attempt)
+        attempt.start()
+        await asyncio.wait_for(asyncio.sleep(delays[index]), attempt.timeout_seconds)
+        return index
+
+    return call, calls
+
+
+class TestAdaptiveTimeouts:
+    """Test LlmLatencyTracker.timeout_for"""
+
+    def test_default_timeout_until_enough_samples(self):
+        tracker = _tracker()
+        _warm_up(tracker, "SourceAnalysis/180s", 2.0, count=4)
+
+        assert tracker.timeout_for("SourceAnalysis/180s", 180) == 180
+
+    def test_timeout_shrinks_to_p99_multiple_within_bounds(self):
+        tracker = _tracker(floor_seconds=1.5)
+        _warm_up(tracker, "fast/180s", 1.0)
+        _warm_up(tracker, "slow/180s", 120.0)
+        _warm_up(tracker, "tiny/180s", 0.5)
+
+        assert tracker.timeout_for("fast/180s", 180) == 2.0
+        assert tracker.timeout_for("slow/180s", 180) == 180
+        assert tracker.timeout_for("tiny/180s", 180) == 1.5
+
+    def test_disabled_adaptive_timeouts_keep_default(self):
+        tracker = _tracker(adaptive_timeouts=False)
+        _warm_up(tracker, "text/180s", 1.0)
+
+        assert tracker.timeout_for("text/180s", 180) == 180
+
+    @pytest.mark.asyncio
+    async def test_stuck_call_times_out_at_adaptive_timeout(self):
+        tracker = _tracker()
+        _warm_up(tracker, "text/360s", 0.02)
+        call, _ = _call([10])
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(tracker.run("text/360s", 360, call), 1.0)
+
+        metrics = tracker.get_metrics()["call_types"]["text/360s"]
+        assert metrics["timeouts"] == 1
+
+
+class TestHedgedRequests:
+    """Test hedging in LlmLatencyTracker.run"""
+
+    @pytest.mark.asyncio
+    async def test_hedge_wins_when_primary_is_slow(self):
+        tracker = _tracker(adaptive_timeouts=False, hedge_requests=True, hedge_max_fraction=1.0)
+        _warm_up(tracker, "PodcastDialogue/360s", 0.02)
+        call, calls = _call([0.5, 0.01])
+
+        assert await tracker.run("PodcastDialogue/360s", 360, call) == 1
+
+        assert len(calls) == 2
+        metrics = tracker.get_metrics()
+        assert metrics["total_hedges"] == 1
+        assert metrics["call_types"]["PodcastDialogue/360s"]["hedge_wins"] == 1
+
+    @pytest.mark.asyncio
+    async def test_fast_call_is_not_hedged(self):
+        tracker = _tracker(adaptive_timeouts=False, hedge_requests=True, hedge_max_fraction=1.0)
+        _warm_up(tracker, "text/180s", 0.2)
+        call, calls = _call([0.01, 0.01])
+
+        assert await tracker.run("text/180s", 180, call) == 0
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_unhedged_run_sends_one_request(self):
+        tracker = _tracker(adaptive_timeouts=False, hedge_requests=True, hedge_max_fraction=1.0)
+        _warm_up(tracker, "PodcastDialogue/360s", 0.02)
+        call, calls = _call([0.2, 0.01])
+
+        assert await tracker.run("PodcastDialogue/360s", 360, call, hedge=False) == 0
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_hedge_budget_caps_duplicate_requests(self):
+        tracker = _tracker(adaptive_timeouts=False, hedge_requests=True, hedge_max_fraction=0.25)
+        _warm_up(tracker, "text/180s", 0.01, count=100)
+
+        for _ in range(4):
+            call, _ = _call([0.05, 0.05])
+            await tracker.run("text/180s", 180, call)
+
+        assert tracker.get_metrics()["total_hedges"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_primary_waits_for_hedge(self):
+        tracker = _tracker(adaptive_timeouts=False, hedge_requests=True, hedge_max_fraction=1.0)
+        _warm_up(tracker, "text/180s", 0.01)
+        calls = []
+
+        async def call(attempt):
+            calls.append(attempt)
+            attempt.start()
+            if len(calls) == 1:
+                await asyncio.sleep(0.05)
+                raise RuntimeError("primary failed")
+            await asyncio.sleep(0.1)
+            return "hedged answer"
+
+        assert await tracker.run("text/180s", 180, call) == "hedged answer"
+
+
+@pytest.mark.asyncio
+async def test_generate_text_async_records_latency_per_call_type(monkeypatch):
+    tracker = _tracker()
+    monkeypatch.setattr(llm_latency, "_llm_latency_tracker", tracker)
+    service = GeminiService.__new__(GeminiService)
+    service.model_name = "gemini-test"
+    service.pydantic_agent = Agent(FunctionModel(lambda messages, info: ModelResponse(parts=[TextPart("hello")])))
+    service._agents_by_result_type = {}
+
+    assert await service.generate_text_async("latency prompt", timeout_seconds=42) == "hello"
+
+    assert tracker.get_metrics()["call_types"]["text/42s"]["samples"] == 1
+
+
+@pytest.mark.asyncio
+async def test_reprompt_is_a_separate_latency_sample(monkeypatch):
+    tracker = _tracker()
+    monkeypatch.setattr(llm_latency, "_llm_latency_tracker", tracker)
+    outputs = ['{"title_suggestion": "missing segments"}', '{"title_suggestion": "T", "summary_suggestion": "S", "segments": []}']
+    requests = []
+
+    def respond(messages, info):
+        requests.append(messages)
+        return ModelResponse(parts=[ToolCallPart(info.output_tools[0].name, outputs[len(requests) - 1])])
+
+    service = GeminiService.__new__(GeminiService)
+    service.model_name = "gemini-test"
+    service.pydantic_agent = Agent(FunctionModel(respond))
+    service._agents_by_result_type = {}
+
+    result = await service.generate_text_async("outline", timeout_seconds=42, result_type=PodcastOutline)
+
+    assert result.title_suggestion == "T"
+    # The invalid first answer and the re-prompt are two calls; only the answered one is a sample
+    stats = tracker.get_metrics()["call_types"]["PodcastOutline/42s"]
+    assert stats["calls"] == 2 and stats["samples"] == 1
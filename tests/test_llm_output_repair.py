@@ -0,0 +1,172 @@
+"""
+Test suite for local repair of structured LLM output that failed validation.
+"""
+
+import json
+import os
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic import ValidationError
+from pydantic_ai import Agent
+from pydantic_ai.messages import ModelResponse, TextPart, ToolCallPart
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+# Add the project root to the path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.llm_output_repair import coerce_to_result_type, parse_json_lenient
+from app.llm_service import GeminiService
+from app.common_exceptions import LLMProcessingError
+from app.podcast_models import OutlineSegment, PodcastDialogue, PodcastOutline, SourceAnalysis
+
+
+class TestParseJsonLenient:
+    """Test parse_json_lenient"""
+
+    def test_fenced_json_with_surrounding_text(self):
+        text = 'Here is the briefing:\n```json\n{"summary_points": ["a"], "detailed_analysis": "b",}\n```\nEnjoy!'
+
+        assert parse_json_lenient(text) == {"summary_points": ["a"], "detailed_analysis": "b"}
+
+    def test_array_wrapped_in_prose(self):
+        text = 'Sure! [{"turn_id": 1, "speaker_id": "Host", "text": "Hi"},] Hope this helps.'
+
+        assert parse_json_lenient(text) == [{"turn_id": 1, "speaker_id": "Host", "text": "Hi"}]
+
+    def test_unrecoverable_text_raises(self):
+        with pytest.raises(json.JSONDecodeError):
+            parse_json_lenient("not a json string {[")
+
+
+class TestCoerceToResultType:
+    """Test coerce_to_result_type"""
+
+    def test_bare_list_and_scalar_types_are_coerced(self):
+        data = [{"turn_id": "1", "speaker_id": 7, "text": 42, "source_mentions": None}]
+
+        dialogue = PodcastDialogue.model_validate(coerce_to_result_type(data, PodcastDialogue))
+
+        assert dialogue.turns[0].speaker_id == "7"
+        assert dialogue.turns[0].text == "42"
+        assert dialogue.turns[0].source_mentions == []
+
+    def test_single_string_becomes_list(self):
+        data = {"summary_points": "only point", "detailed_analysis": "details"}
+
+        analysis = SourceAnalysis.model_validate(coerce_to_result_type(data, SourceAnalysis))
+
+        assert analysis.summary_points == ["only point"]
+
+
+def _service_with_model_outputs(outputs):
+    """GeminiService whose model answers each request with the next raw tool call arguments"""
+    requests = []
+
+    def respond(messages, info: AgentInfo):
+        requests.append(messages)
+        return ModelResponse(parts=[ToolCallPart(info.output_tools[0].name, outputs[len(requests) - 1])])
+
+    service = GeminiService.__new__(GeminiService)
+    service.model_name = "gemini-test"
+    service.pydantic_agent = Agent(FunctionModel(respond))
+    service._agents_by_result_type = {}
+    return service, requests
+
+
+def _service_failing_validation():
+    """GeminiService whose structured calls never validate; text calls are recorded too"""
+    calls = []
+    try:
+        PodcastOutline.model_validate({})
+    except ValidationError as e:
+        validation_error = e
+
+    async def run_structured(agent, prompt, run_kwargs, result_type, llm_attempt):
+        calls.append(result_type)
+        raise validation_error
+
+    def respond(messages, info: AgentInfo):
+        calls.append(str)
+        return ModelResponse(parts=[TextPart('{"title_suggestion": "T", "summary_suggestion": "S", "segments": []}')])
+
+    service = GeminiService.__new__(GeminiService)
+    service.model_name = "gemini-test"
+    service.pydantic_agent = Agent(FunctionModel(respond))
+    service._agents_by_result_type = {}
+    service._run_structured_agent_async = run_structured
+    return service, calls
+
+
+class TestStructuredOutputRepair:
+    """Test that generate_text_async repairs invalid structured output locally"""
+
+    @pytest.mark.asyncio
+    async def test_invalid_output_repaired_without_second_call(self):
+        service, requests = _service_with_model_outputs([
+            '```json\n{" summary_points": "one point", "detailed_analysis": 5,}\n```'
+        ])
+        metrics_before = GeminiService.get_json_repair_metrics()
+
+        result = await service.generate_text_async("analyze", result_type=SourceAnalysis)
+
+        assert result == SourceAnalysis(summary_points=["one point"], detailed_analysis="5")
+        assert len(requests) == 1
+        metrics = GeminiService.get_json_repair_metrics()
+        assert metrics["repaired"] == metrics_before["repaired"] + 1
+        assert metrics["reprompts"] == metrics_before["reprompts"]
+
+    @pytest.mark.asyncio
+    async def test_unrepairable_output_reprompts_once(self):
+        service, requests = _service_with_model_outputs([
+            '{"title_suggestion": "missing segments"}',
+            json.dumps({"title_suggestion": "T", "summary_suggestion": "S", "segments": []}),
+        ])
+        metrics_before = GeminiService.get_json_repair_metrics()
+
+        result = await service.generate_text_async("outline", result_type=PodcastOutline)
+
+        assert result.title_suggestion == "T"
+        assert len(requests) == 2
+        metrics = GeminiService.get_json_repair_metrics()
+        assert metrics["failed"] == metrics_before["failed"] + 1
+        assert metrics["reprompts"] == metrics_before["reprompts"] + 1
+
+    @pytest.mark.asyncio
+    async def test_repeated_unrepairable_output_raises(self):
+        service, requests = _service_with_model_outputs(['{"turns": "nope"}', '{"turns": "still nope"}'])
+
+        with pytest.raises(RuntimeError):
+            await service.generate_text_async("dialogue", result_type=PodcastDialogue)
+        assert len(requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_outline_failing_twice_costs_two_calls(self):
+        service, calls = _service_failing_validation()
+        metrics_before = GeminiService.get_json_repair_metrics()
+
+        with pytest.raises(LLMProcessingError):
+            await service.generate_podcast_outline_async(
+                source_analyses=[SourceAnalysis(summary_points=["a"], detailed_analysis="b")],
+                persona_research_docs=[],
+                desired_podcast_length_str="5 minutes",
+                num_prominent_persons=0,
+                names_prominent_persons_list=[],
+                persona_details_map={}
+            )
+
+        assert len(calls) == 2
+        assert GeminiService.get_json_repair_metrics()["reprompts"] == metrics_before["reprompts"] + 1
+
+    @pytest.mark.asyncio
+    async def test_segment_dialogue_failing_twice_costs_two_calls(self):
+        service, calls = _service_failing_validation()
+        segment = OutlineSegment(segment_id="s1", segment_title="Intro", speaker_id="Host", content_cue="Hello", estimated_duration_seconds=60)
+        metrics_before = GeminiService.get_json_repair_metrics()
+
+        turns = await service._generate_segment_dialogue(segment, "dialogue prompt", 1, {})
+
+        assert turns == []
+        assert len(calls) == 2
+        assert GeminiService.get_json_repair_metrics()["reprompts"] == metrics_before["reprompts"] + 1
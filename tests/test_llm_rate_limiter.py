@@ -0,0 +1,148 @@
+"""
+Test suite for the process-wide Gemini rate limiter.
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+# Add the project root to the path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.llm_rate_limiter import CallPriority, GeminiRateLimiter, call_priority, current_call_priority, estimate_tokens
+
+
+def _limiter(requests_per_minute=0, tokens_per_minute=0, max_concurrent_requests=0, **kwargs):
+    return GeminiRateLimiter(requests_per_minute, tokens_per_minute, max_concurrent_requests, poll_interval=0.005, **kwargs)
+
+
+class TestGeminiRateLimiter:
+    """Test GeminiRateLimiter"""
+
+    @pytest.mark.asyncio
+    async def test_request_budget_throttles_bursts(self):
+        # 600/min refills one request every 0.1s once the burst of 600 is spent
+        limiter = _limiter(requests_per_minute=600)
+        limiter._request_bucket.tokens = 1
+
+        started = time.monotonic()
+        for _ in range(3):
+            async with limiter.limit(10):
+                pass
+        elapsed = time.monotonic() - started
+
+        assert elapsed >= 0.18
+        metrics = limiter.get_metrics()
+        assert metrics["requests"] == 3
+        assert metrics["throttled_requests"] == 2
+        assert metrics["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap(self):
+        limiter = _limiter(max_concurrent_requests=2)
+        in_flight = 0
+        max_in_flight = 0
+
+        async def call():
+            nonlocal in_flight, max_in_flight
+            async with limiter.limit(10):
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0.02)
+                in_flight -= 1
+
+        await asyncio.gather(*(call() for _ in range(6)))
+
+        assert max_in_flight == 2
+        assert limiter.get_metrics()["max_queue_depth"] >= 4
+
+    @pytest.mark.asyncio
+    async def test_high_priority_served_before_waiting_low_priority(self):
+        limiter = _limiter(max_concurrent_requests=1)
+        order = []
+        release = asyncio.Event()
+
+        async def blocker():
+            async with limiter.limit(10):
+                await release.wait()
+
+        async def call(name, priority):
+            with call_priority(priority):
+                async with limiter.limit(10):
+                    order.append(name)
+
+        blocking = asyncio.create_task(blocker())
+        await asyncio.sleep(0.01)
+        waiting = [asyncio.create_task(call(f"low{i}", CallPriority.LOW)) for i in range(2)]
+        await asyncio.sleep(0.01)
+        waiting.append(asyncio.create_task(call("high", CallPriority.HIGH)))
+        await asyncio.sleep(0.01)
+        release.set()
+        await asyncio.gather(blocking, *waiting)
+
+        assert order == ["high", "low0", "low1"]
+        assert current_call_priority.get() == CallPriority.NORMAL
+
+    @pytest.mark.asyncio
+    async def test_waiting_calls_age_past_newer_higher_priority_calls(self):
+        limiter = _limiter(max_concurrent_requests=1, aging_seconds=0.01)
+        order = []
+        release = asyncio.Event()
+
+        async def blocker():
+            async with limiter.limit(10):
+                await release.wait()
+
+        async def call(name, priority):
+            async with limiter.limit(10, priority):
+                order.append(name)
+
+        blocking = asyncio.create_task(blocker())
+        await asyncio.sleep(0.01)
+        low = asyncio.create_task(call("low", CallPriority.LOW))
+        await asyncio.sleep(0.05)
+        high = asyncio.create_task(call("high", CallPriority.HIGH))
+        await asyncio.sleep(0.01)
+        release.set()
+        await asyncio.gather(blocking, low, high)
+
+        assert order == ["low", "high"]
+
+    @pytest.mark.asyncio
+    async def test_reported_usage_corrects_token_budget(self):
+        limiter = _limiter(tokens_per_minute=6000)
+
+        async with limiter.limit(1000) as permit:
+            permit.record_usage(3000)
+
+        assert limiter._token_bucket.tokens == pytest.approx(3000, abs=50)
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_error_drains_budget(self):
+        limiter = _limiter(requests_per_minute=600)
+
+        limiter.report_rate_limited()
+
+        assert limiter._request_bucket.tokens <= 0
+        assert limiter.get_metrics()["rate_limit_errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self):
+        limiter = _limiter(max_concurrent_requests=1)
+
+        async with limiter.limit(10):
+            waiter = asyncio.create_task(limiter.limit(10).__aenter__())
+            await asyncio.sleep(0.01)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+
+        assert limiter.get_metrics()["queue_depth"] == 0
+        async with limiter.limit(10):
+            pass
+
+    def test_estimate_tokens(self):
+        assert estimate_tokens("x" * 400, expected_output_tokens=50) == 150
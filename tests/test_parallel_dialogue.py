@@ -0,0 +1,150 @@
+"""
+Test suite for parallel per-segment dialogue generation.
+"""
+
+import asyncio
+import os
+import re
+import sys
+from unittest.mock import patch
+
+import pytest
+
+# Add the project root to the path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.llm_service import GeminiService
+from app.podcast_models import DialogueTurn, OutlineSegment, PodcastDialogue, PodcastOutline
+
+PERSONA_DETAILS = {
+    "Host": {"invented_name": "Host", "gender": "Female", "real_name": "Host"},
+    "ada": {"invented_name": "Amelia", "gender": "Female", "real_name": "Ada Lovelace"},
+}
+
+
+def _outline(count):
+    return PodcastOutline(
+        title_suggestion="Parallel Podcast",
+        summary_suggestion="Summary",
+        segments=[
+            OutlineSegment(
+                segment_id=f"seg_{i}",
+                segment_title=f"Title {i}",
+                speaker_id="Host",
+                content_cue=f"cue {i}",
+                estimated_duration_seconds=60
+            )
+            for i in range(count)
+        ]
+    )
+
+
+class RecordingDialogueService(GeminiService):
+    """GeminiService whose LLM calls are answered locally"""
+
+    def __init__(self, empty_segments=(), fail_transitions=False):
+        self.empty_segments = set(empty_segments)
+        self.fail_transitions = fail_transitions
+        self.segment_prompts = []
+        self.transition_prompts = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate_text_async(self, prompt, timeout_seconds=180, result_type=None):
+        if "dialogue editor" in prompt:
+            self.transition_prompts.append(prompt)
+            if self.fail_transitions:
+                raise RuntimeError("transition failed")
+            return PodcastDialogue(turns=[
+                DialogueTurn(turn_id=1, speaker_id="Host", text="smoothed end"),
+                DialogueTurn(turn_id=2, speaker_id="ada", text="smoothed start"),
+            ])
+
+        index = int(re.search(r"Segment ID: seg_(\d+)", prompt).group(1))
+        self.segment_prompts.append(prompt)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # Later segments finish first to prove results are reordered
+            await asyncio.sleep(0.01 * (10 - index))
+        finally:
+            self.in_flight -= 1
+        if index in self.empty_segments:
+            return PodcastDialogue(turns=[])
+        return PodcastDialogue(turns=[
+            DialogueTurn(turn_id=1, speaker_id="ada", text=f"segment {index} opening"),
+            DialogueTurn(turn_id=2, speaker_id="Host", text=f"segment {index} closing"),
+        ])
+
+
+async def _collect(service, outline):
+    return [
+        turns async for turns in service.generate_dialogue_segments_async(
+            podcast_outline=outline,
+            source_analyses=[],
+            persona_research_docs=[],
+            persona_details_map=PERSONA_DETAILS
+        )
+    ]
+
+
+class TestParallelDialogue:
+    """Test DIALOGUE_PARALLEL_SEGMENTS mode of generate_dialogue_segments_async"""
+
+    @pytest.mark.asyncio
+    async def test_segments_generated_concurrently_and_renumbered(self):
+        service = RecordingDialogueService(empty_segments={1})
+
+        with patch.dict(os.environ, {"DIALOGUE_PARALLEL_SEGMENTS": "true", "DIALOGUE_MAX_CONCURRENCY": "2"}):
+            segments = await _collect(service, _outline(4))
+
+        assert service.max_in_flight == 2
+        texts = [[turn.text for turn in turns] for turns in segments]
+        assert texts == [
+            ["segment 0 opening", "segment 0 closing"],
+            ["Let's talk about cue 1"],
+            ["segment 2 opening", "segment 2 closing"],
+            ["segment 3 opening", "segment 3 closing"],
+        ]
+        assert [turn.turn_id for turns in segments for turn in turns] == list(range(1, 8))
+        assert "opening segment" in next(p for p in service.segment_prompts if "seg_0" in p)
+        middle_prompt = next(p for p in service.segment_prompts if "seg_2" in p)
+        assert "Previous segment: Title 1 (cue 1)" in middle_prompt
+        assert "Next segment: Title 3 (cue 3)" in middle_prompt
+        assert service.transition_prompts == []
+
+    @pytest.mark.asyncio
+    async def test_transition_smoothing_rewrites_boundary_turns(self):
+        service = RecordingDialogueService()
+
+        with patch.dict(os.environ, {"DIALOGUE_PARALLEL_SEGMENTS": "true", "DIALOGUE_TRANSITION_SMOOTHING": "true"}):
+            segments = await _collect(service, _outline(3))
+
+        assert len(service.transition_prompts) == 2
+        texts = [[turn.text for turn in turns] for turns in segments]
+        assert texts == [
+            ["segment 0 opening", "smoothed end"],
+            ["smoothed start", "smoothed end"],
+            ["smoothed start", "segment 2 closing"],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failed_or_mismatched_smoothing_keeps_original_turns(self):
+        service = RecordingDialogueService(fail_transitions=True)
+
+        with patch.dict(os.environ, {"DIALOGUE_PARALLEL_SEGMENTS": "true", "DIALOGUE_TRANSITION_SMOOTHING": "true"}):
+            segments = await _collect(service, _outline(2))
+
+        assert [turn.text for turns in segments for turn in turns] == [
+            "segment 0 opening", "segment 0 closing", "segment 1 opening", "segment 1 closing"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_sequential_mode_is_default(self):
+        service = RecordingDialogueService()
+
+        segments = await _collect(service, _outline(3))
+
+        assert service.max_in_flight == 1
+        assert [turn.turn_id for turns in segments for turn in turns] == list(range(1, 7))
+        assert all("Position in Podcast" not in prompt for prompt in service.segment_prompts)
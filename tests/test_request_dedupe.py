@@ -0,0 +1,150 @@
+"""
+Test suite for duplicate podcast request detection by request fingerprint.
+"""
+
+import os
+import sys
+import threading
+import uuid
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+# Add the project root to the path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.podcast_workflow import PodcastGeneratorService
+from app.podcast_models import PodcastRequest
+from app.status_manager import StatusManager
+
+
+def _request(**overrides):
+    data = {
+        "source_urls": [f"https://example.com/{uuid.uuid4()}"],
+        "prominent_persons": ["Ada Lovelace"],
+        "desired_podcast_length_str": "5 minutes",
+    }
+    data.update(overrides)
+    return PodcastRequest(**data)
+
+
+def _task_runner(running_task_ids=()):
+    runner = MagicMock()
+    runner.is_task_running.side_effect = lambda task_id: task_id in running_task_ids
+    runner.is_cancellation_requested.return_value = False
+    runner.can_accept_new_task.return_value = True
+    runner.submit_async_task = AsyncMock()
+    return runner
+
+
+class TestRequestFingerprint:
+    """Test PodcastRequest.fingerprint normalization"""
+
+    def test_insignificant_differences_share_fingerprint(self):
+        url = "https://example.com/article"
+        a = _request(source_urls=[url], prominent_persons=["Ada  Lovelace"], custom_prompt_for_outline="Focus on  math")
+        b = _request(source_urls=[f" {url} "], prominent_persons=["ada lovelace", " "], custom_prompt_for_outline="Focus on math ")
+        assert a.fingerprint() == b.fingerprint()
+
+    def test_significant_differences_change_fingerprint(self):
+        url = "https://example.com/article"
+        base = _request(source_urls=[url])
+        assert base.fingerprint() != _request(source_urls=[url], desired_podcast_length_str="10 minutes").fingerprint()
+        assert base.fingerprint() != _request(source_urls=[url], webhook_url="https://hooks.example.com/").fingerprint()
+
+    def test_pdf_source_hashed_by_content(self, tmp_path):
+        pdf_path = tmp_path / "source.pdf"
+        pdf_path.write_bytes(b"%PDF first upload")
+        first = _request(source_urls=None, source_pdf_path=str(pdf_path)).fingerprint()
+        assert first == _request(source_urls=None, source_pdf_path=str(pdf_path)).fingerprint()
+
+        pdf_path.write_bytes(b"%PDF second upload")
+        assert first != _request(source_urls=None, source_pdf_path=str(pdf_path)).fingerprint()
+
+
+class TestDuplicateRequests:
+    """Test reuse of and attachment to earlier tasks for identical requests"""
+
+    @pytest.mark.asyncio
+    async def test_pdf_hashed_off_the_event_loop(self, tmp_path, status_manager):
+        pdf_path = tmp_path / "source.pdf"
+        pdf_path.write_bytes(b"%PDF upload")
+        hashing_threads = []
+
+        def file_digest(path):
+            hashing_threads.append(threading.current_thread())
+            return "digest"
+
+        with patch("app.podcast_models._file_digest", side_effect=file_digest), \
+             patch("app.podcast_workflow.get_task_runner", return_value=_task_runner()):
+            await PodcastGeneratorService().generate_podcast_async(
+                _request(source_urls=None, source_pdf_path=str(pdf_path))
+            )
+
+        assert len(hashing_threads) == 1
+        assert hashing_threads[0] is not threading.main_thread()
+
+    @pytest.mark.asyncio
+    async def test_completed_task_is_reused(self):
+        manager = StatusManager()
+        request = _request()
+        runner = _task_runner()
+        service = PodcastGeneratorService()
+
+        with patch("app.podcast_workflow.get_status_manager", return_value=manager), \
+             patch("app.podcast_workflow.get_task_runner", return_value=runner), \
+             patch.dict(os.environ, {"REQUEST_DEDUPE_POLICY": "reuse"}):
+            first_task_id = await service.generate_podcast_async(request)
+            manager.update_artifacts(first_task_id, final_podcast_audio_available=True)
+            manager.update_status(first_task_id, "completed", "Podcast generated", 100.0)
+
+            second_task_id = await service.generate_podcast_async(_request(**request.model_dump()))
+
+        assert second_task_id == first_task_id
+        assert runner.submit_async_task.await_count == 1
+        manager.delete_status(first_task_id)
+
+    @pytest.mark.asyncio
+    async def test_in_flight_task_is_attached(self):
+        manager = StatusManager()
+        request = _request()
+        service = PodcastGeneratorService()
+        runner = _task_runner()
+
+        with patch("app.podcast_workflow.get_status_manager", return_value=manager), \
+             patch("app.podcast_workflow.get_task_runner", return_value=runner):
+            first_task_id = await service.generate_podcast_async(request)
+            runner.is_task_running.side_effect = lambda task_id: task_id == first_task_id
+
+            with patch.dict(os.environ, {"REQUEST_DEDUPE_POLICY": "attach"}):
+                second_task_id = await service.generate_podcast_async(request)
+
+        assert second_task_id == first_task_id
+        assert runner.submit_async_task.await_count == 1
+        manager.delete_status(first_task_id)
+
+    @pytest.mark.asyncio
+    async def test_failed_or_disabled_dedupe_starts_new_task(self):
+        manager = StatusManager()
+        request = _request()
+        runner = _task_runner()
+        service = PodcastGeneratorService()
+
+        with patch("app.podcast_workflow.get_status_manager", return_value=manager), \
+             patch("app.podcast_workflow.get_task_runner", return_value=runner):
+            failed_task_id = await service.generate_podcast_async(request)
+            manager.set_error(failed_task_id, "boom")
+            with patch.dict(os.environ, {"REQUEST_DEDUPE_POLICY": "reuse"}):
+                retry_task_id = await service.generate_podcast_async(request)
+
+            manager.update_artifacts(retry_task_id, final_podcast_audio_available=True)
+            manager.update_status(retry_task_id, "completed", "Podcast generated", 100.0)
+            with patch.dict(os.environ, {"REQUEST_DEDUPE_POLICY": "attach"}):
+                attach_only_task_id = await service.generate_podcast_async(request)
+            # Dedupe is off by default
+            off_task_id = await service.generate_podcast_async(request)
+
+        assert len({failed_task_id, retry_task_id, attach_only_task_id, off_task_id}) == 4
+        assert runner.submit_async_task.await_count == 4
+        for task_id in (failed_task_id, retry_task_id, attach_only_task_id, off_task_id):
+            manager.delete_status(task_id)
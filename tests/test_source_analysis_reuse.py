@@ -0,0 +1,139 @@
+"""
+Test suite for per-source analysis and reuse of source analyses across tasks.
+"""
+
+import asyncio
+import os
+import sys
+import uuid
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Add the project root to the path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.common_exceptions import LLMProcessingError
+from app.podcast_models import SourceAnalysis
+from app.status_manager import StatusManager
+
+
+class FakeAnalysisLlmService:
+    """LLM stub that records analyzed sources and their concurrency"""
+
+    def __init__(self, fail_texts=(), model_name="gemini-test"):
+        self.model_name = model_name
+        self.fail_texts = set(fail_texts)
+        self.analyzed = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def analyze_source_text_async(self, source_text, analysis_instructions="", **kwargs):
+        self.analyzed.append(source_text)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        await asyncio.sleep(0.02)
+        self.in_flight -= 1
+        if source_text in self.fail_texts:
+            raise LLMProcessingError(f"cannot analyze {source_text}")
+        return SourceAnalysis(summary_points=[f"about {source_text}"], detailed_analysis=f"analysis of {source_text}")
+
+
+class TestPerSourceAnalysis:
+    """Test that each extracted source is analyzed on its own"""
+
+    @pytest.mark.asyncio
+    async def test_sources_analyzed_concurrently_in_order(self, make_generator_service):
+        status_manager = MagicMock()
+        status_manager.get_cached_source_analysis.return_value = None
+        llm = FakeAnalysisLlmService(fail_texts={"second"})
+        service = make_generator_service(llm_service=llm)
+        warnings = []
+
+        with patch("app.podcast_workflow.get_status_manager", return_value=status_manager):
+            analyses = await service._run_source_analysis_stage(
+                "task-123456789", ["first", "second", "third"], {}, warnings
+            )
+
+        assert llm.peak_in_flight == 3
+        assert [a.summary_points for a in analyses] == [["about first"], ["about third"]]
+        assert len(warnings) == 1 and "source 2" in warnings[0]
+        saved_stage, saved_data = status_manager.save_checkpoint.call_args.args[1:]
+        assert saved_stage == "source_analysis"
+        assert [item["summary_points"] for item in saved_data] == [["about first"], ["about third"]]
+
+    @pytest.mark.asyncio
+    async def test_legacy_single_analysis_checkpoint_is_restored(self, make_generator_service):
+        llm = FakeAnalysisLlmService()
+        service = make_generator_service(llm_service=llm)
+        checkpoint = SourceAnalysis(summary_points=["point"], detailed_analysis="analysis").model_dump(mode="json")
+
+        with patch("app.podcast_workflow.get_status_manager", return_value=MagicMock()):
+            analyses = await service._run_source_analysis_stage(
+                "task-123456789", ["first"], {"source_analysis": checkpoint}, []
+            )
+
+        assert [a.summary_points for a in analyses] == [["point"]]
+        assert llm.analyzed == []
+
+
+class TestSourceAnalysisReuse:
+    """Test that analyses are shared across tasks by content hash"""
+
+    @pytest.mark.asyncio
+    async def test_second_task_reuses_cached_analysis(self, monkeypatch, make_generator_service):
+        monkeypatch.setenv("SOURCE_ANALYSIS_CACHE_TTL_SECONDS", "3600")
+        status_manager = StatusManager()
+        shared_text = f"shared source {uuid.uuid4()}"
+        new_text = f"new source {uuid.uuid4()}"
+
+        with patch("app.podcast_workflow.get_status_manager", return_value=status_manager), \
+             patch.object(status_manager, "add_progress_log"), \
+             patch.object(status_manager, "update_artifacts"), \
+             patch.object(status_manager, "save_checkpoint"):
+            first_llm = FakeAnalysisLlmService()
+            await make_generator_service(llm_service=first_llm)._run_source_analysis_stage(
+                str(uuid.uuid4()), [shared_text], {}, []
+            )
+
+            second_llm = FakeAnalysisLlmService()
+            analyses = await make_generator_service(llm_service=second_llm)._run_source_analysis_stage(
+                str(uuid.uuid4()), [shared_text, new_text], {}, []
+            )
+
+        assert first_llm.analyzed == [shared_text]
+        assert second_llm.analyzed == [new_text]
+        assert [a.summary_points for a in analyses] == [[f"about {shared_text}"], [f"about {new_text}"]]
+
+    @pytest.mark.asyncio
+    async def test_analysis_from_another_model_not_reused(self, monkeypatch, make_generator_service):
+        monkeypatch.setenv("SOURCE_ANALYSIS_CACHE_TTL_SECONDS", "3600")
+        status_manager = StatusManager()
+        shared_text = f"shared source {uuid.uuid4()}"
+
+        with patch("app.podcast_workflow.get_status_manager", return_value=status_manager), \
+             patch.object(status_manager, "add_progress_log"), \
+             patch.object(status_manager, "update_artifacts"), \
+             patch.object(status_manager, "save_checkpoint"):
+            await make_generator_service(llm_service=FakeAnalysisLlmService(model_name="gemini-old"))._run_source_analysis_stage(
+                str(uuid.uuid4()), [shared_text], {}, []
+            )
+            new_model_llm = FakeAnalysisLlmService(model_name="gemini-new")
+            await make_generator_service(llm_service=new_model_llm)._run_source_analysis_stage(
+                str(uuid.uuid4()), [shared_text], {}, []
+            )
+
+        assert new_model_llm.analyzed == [shared_text]
+
+    @pytest.mark.asyncio
+    async def test_reuse_disabled_by_default(self, monkeypatch, make_generator_service):
+        monkeypatch.delenv("SOURCE_ANALYSIS_CACHE_TTL_SECONDS", raising=False)
+        status_manager = MagicMock()
+        llm = FakeAnalysisLlmService()
+
+        with patch("app.podcast_workflow.get_status_manager", return_value=status_manager):
+            await make_generator_service(llm_service=llm)._run_source_analysis_stage("task-123456789", ["first"], {}, [])
+
+        status_manager.get_cached_source_analysis.assert_not_called()
+        status_manager.save_cached_source_analysis.assert_not_called()
+        assert llm.analyzed == ["first"]
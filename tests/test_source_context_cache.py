@@ -0,0 +1,140 @@
+"""
+Test suite for sharing one cached source context across analysis and persona research prompts.
+"""
+
+import asyncio
+import os
+import sys
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+# Add the project root to the path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.llm_service import GeminiService
+from app.podcast_models import PersonaResearch, SourceAnalysis
+from app.source_context_cache import SOURCE_CONTEXT_REFERENCE, source_section_reference
+
+SOURCE_TEXT = "A long source document about the history of computing. " * 400
+
+
+class FakeSourceContextCache:
+    """Local stand-in for the Gemini context caching API"""
+
+    def __init__(self, fail_create=False):
+        self.fail_create = fail_create
+        self.created = []
+        self.prompts = []
+        self.deleted = []
+
+    async def create_async(self, model_name, source_text, ttl_seconds):
+        await asyncio.sleep(0.01)
+        if self.fail_create:
+            raise RuntimeError("caching not supported for this model")
+        handle = f"cachedContents/{len(self.created)}"
+        self.created.append((handle, source_text))
+        return handle
+
+    async def generate_async(self, handle, prompt, result_type, timeout_seconds):
+        self.prompts.append((handle, prompt))
+        if result_type is SourceAnalysis:
+            return SourceAnalysis(summary_points=["point"], detailed_analysis="analysis")
+        return PersonaResearch(person_id="ada", name="Ada Lovelace", detailed_profile="profile", gender="female")
+
+    async def delete_async(self, handle):
+        self.deleted.append(handle)
+
+
+def _service(context_cache):
+    service = GeminiService.__new__(GeminiService)
+    service.model_name = "gemini-test"
+    service.tts_service = None
+    service.source_context_cache = context_cache
+    service._source_contexts = {}
+    service.generate_text_async = AsyncMock(
+        return_value=SourceAnalysis(summary_points=["inline"], detailed_analysis="inline analysis")
+    )
+    return service
+
+
+@pytest.fixture
+def caching_enabled():
+    with patch.dict(os.environ, {"LLM_SOURCE_CONTEXT_CACHING": "true", "LLM_SOURCE_CONTEXT_MIN_CHARS": "1000"}):
+        yield
+
+
+class TestSourceContextCaching:
+    """Test GeminiService source context caching"""
+
+    @pytest.mark.asyncio
+    async def test_analysis_and_personas_share_one_cached_context(self, caching_enabled):
+        context_cache = FakeSourceContextCache()
+        service = _service(context_cache)
+
+        await asyncio.gather(
+            service.analyze_source_text_async(SOURCE_TEXT),
+            *(service.research_persona_async(SOURCE_TEXT, name) for name in ["Ada Lovelace", "Alan Turing", "Grace Hopper"])
+        )
+
+        assert len(context_cache.created) == 1
+        assert len(context_cache.prompts) == 4
+        for handle, prompt in context_cache.prompts:
+            assert handle == "cachedContents/0"
+            assert SOURCE_CONTEXT_REFERENCE in prompt
+            assert SOURCE_TEXT not in prompt
+        service.generate_text_async.assert_not_awaited()
+
+        await service.release_source_context_async(SOURCE_TEXT)
+        assert context_cache.deleted == ["cachedContents/0"]
+
+    @pytest.mark.asyncio
+    async def test_short_source_text_is_sent_inline(self, caching_enabled):
+        context_cache = FakeSourceContextCache()
+        service = _service(context_cache)
+
+        await service.analyze_source_text_async("short text")
+
+        assert context_cache.created == []
+        prompt = service.generate_text_async.await_args.args[0]
+        assert "short text" in prompt
+
+    @pytest.mark.asyncio
+    async def test_failed_context_creation_falls_back_to_inline_prompts(self, caching_enabled):
+        context_cache = FakeSourceContextCache(fail_create=True)
+        service = _service(context_cache)
+
+        await service.analyze_source_text_async(SOURCE_TEXT)
+        await service.analyze_source_text_async(SOURCE_TEXT)
+
+        assert context_cache.prompts == []
+        assert service.generate_text_async.await_count == 2
+        assert SOURCE_TEXT in service.generate_text_async.await_args.args[0]
+        await service.release_source_context_async(SOURCE_TEXT)
+        assert context_cache.deleted == []
+
+    @pytest.mark.asyncio
+    async def test_multi_source_run_shares_and_releases_one_context(
+        self, caching_enabled, status_manager, make_generator_service
+    ):
+        from app.podcast_models import PodcastRequest
+
+        context_cache = FakeSourceContextCache()
+        llm = _service(context_cache)
+        status_manager.get_cached_source_analysis.return_value = None
+        texts = [SOURCE_TEXT, "A second long document about early programming languages. " * 400]
+        combined = "".join(f"\n\n--- SOURCE {i + 1}: https://example.com/{i} ---\n\n{text}" for i, text in enumerate(texts))
+        request = PodcastRequest(source_urls=["https://example.com/0", "https://example.com/1"], prominent_persons=["Ada Lovelace"])
+
+        results = await make_generator_service(None, llm)._run_analysis_branches_async(
+            "task-123456789", request, combined, texts, {}, []
+        )
+
+        assert len(results["source_analyses"]) == 2
+        assert context_cache.created == [("cachedContents/0", combined)]
+        assert len(context_cache.prompts) == 3
+        prompts = [prompt for _, prompt in context_cache.prompts]
+        assert sum(source_section_reference(1) in prompt for prompt in prompts) == 1
+        assert sum(source_section_reference(2) in prompt for prompt in prompts) == 1
+        assert context_cache.deleted == ["cachedContents/0"]
+        assert llm._source_contexts == {}
@@ -0,0 +1,94 @@
+"""
+Test suite for the StageGraph DAG executor used by the podcast workflow.
+"""
+
+import asyncio
+import os
+import sys
+
+import pytest
+
+# Add the project root to the path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.podcast_workflow import StageGraph, WorkflowStage
+
+
+def _stage(name, requires=(), provides=None, delay=0.0, log=None, **kwargs):
+    provides = provides if provides is not None else (name,)
+
+    async def run(inputs):
+        if log is not None:
+            log.append(("start", name))
+        await asyncio.sleep(delay)
+        if log is not None:
+            log.append(("end", name))
+        return {output: f"{output}<-{sorted(inputs)}" for output in provides}
+
+    return WorkflowStage(name=name, run=run, requires=tuple(requires), provides=tuple(provides), **kwargs)
+
+
+class TestStageGraph:
+    """Test scheduling, retry, timeout and failure semantics"""
+
+    @pytest.mark.asyncio
+    async def test_independent_stages_run_concurrently_and_join(self):
+        log = []
+        graph = StageGraph([
+            _stage("a", requires=("text",), delay=0.05, log=log),
+            _stage("b", requires=("text",), delay=0.05, log=log),
+            _stage("c", requires=("a", "b"), log=log),
+        ])
+
+        results = await graph.run({"text": "x"})
+
+        assert set(log[:2]) == {("start", "a"), ("start", "b")}
+        assert log[-2:] == [("start", "c"), ("end", "c")]
+        assert results["c"] == "c<-['a', 'b', 'text']"
+
+    @pytest.mark.asyncio
+    async def test_retries_then_succeeds(self):
+        attempts = []
+
+        async def flaky(inputs):
+            attempts.append(1)
+            if len(attempts) < 3:
+                raise RuntimeError("transient")
+            return {"out": "ok"}
+
+        graph = StageGraph([
+            WorkflowStage(name="flaky", run=flaky, provides=("out",), retries=2, retry_delay_seconds=0.001)
+        ])
+
+        assert (await graph.run({}))["out"] == "ok"
+        assert len(attempts) == 3
+
+    @pytest.mark.asyncio
+    async def test_timeout_failure_cancels_running_siblings(self):
+        log = []
+        graph = StageGraph([
+            _stage("slow", delay=1.0, timeout_seconds=0.01),
+            _stage("sibling", delay=0.5, log=log),
+        ])
+
+        with pytest.raises(asyncio.TimeoutError):
+            await graph.run({})
+        assert ("end", "sibling") not in log
+
+    @pytest.mark.asyncio
+    async def test_cancellation_check_runs_before_each_stage(self):
+        def cancelled():
+            raise asyncio.CancelledError("cancelled")
+
+        graph = StageGraph([_stage("a")])
+        with pytest.raises(asyncio.CancelledError):
+            await graph.run({}, check_cancelled=cancelled)
+
+    @pytest.mark.asyncio
+    async def test_invalid_graphs_are_rejected(self):
+        with pytest.raises(ValueError, match="Duplicate"):
+            StageGraph([_stage("a"), _stage("a", provides=("other",))])
+        with pytest.raises(ValueError, match="No stage provides"):
+            await StageGraph([_stage("a", requires=("missing",))]).run({})
+        with pytest.raises(ValueError, match="cycle"):
+            await StageGraph([_stage("a", requires=("b",)), _stage("b", requires=("a",))]).run({})
@@ -0,0 +1,164 @@
+"""
+Test suite for streaming dialogue generation that emits turns incrementally.
+"""
+
+import asyncio
+import json
+import os
+import sys
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from pydantic_ai import Agent
+from pydantic_ai.models.function import AgentInfo, DeltaToolCall, FunctionModel
+
+# Add the project root to the path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.llm_service import GeminiService
+from app.podcast_models import DialogueTurn, OutlineSegment, PodcastDialogue, PodcastOutline
+
+PERSONA_DETAILS = {
+    "Host": {"invented_name": "Host", "gender": "Female", "real_name": "Host"},
+    "ada": {"invented_name": "Amelia", "gender": "Female", "real_name": "Ada Lovelace"},
+}
+
+
+def _dialogue_json(segment_index, count=3):
+    return json.dumps({"turns": [
+        {"turn_id": i + 1, "speaker_id": "Host" if i % 2 == 0 else "ada", "text": f"segment {segment_index} turn {i}"}
+        for i in range(count)
+    ]})
+
+
+def _outline(count):
+    return PodcastOutline(
+        title_suggestion="Streaming Podcast",
+        summary_suggestion="Summary",
+        segments=[
+            OutlineSegment(segment_id=f"seg_{i}", segment_title=f"Title {i}", speaker_id="Host",
+                           content_cue=f"cue {i}", estimated_duration_seconds=60)
+            for i in range(count)
+        ]
+    )
+
+
+def _streaming_service(events, fail_stream=False, break_after_chunks=None, stall_after_chunks=None):
+    """GeminiService whose model streams each segment's JSON in small chunks"""
+    requests = []
+
+    async def stream_function(messages, info: AgentInfo):
+        segment_index = len(requests)
+        requests.append(messages)
+        if fail_stream:
+            raise RuntimeError("stream broke")
+        payload = _dialogue_json(segment_index)
+        for chunk_index, start in enumerate(range(0, len(payload), 10)):
+            if chunk_index == break_after_chunks:
+                raise RuntimeError("stream broke mid-response")
+            if chunk_index == stall_after_chunks:
+                await asyncio.sleep(3600)
+            events.append(("chunk", segment_index, start))
+            yield {0: DeltaToolCall(name=info.output_tools[0].name if start == 0 else None, json_args=payload[start:start + 10])}
+        events.append(("response_done", segment_index))
+
+    service = GeminiService.__new__(GeminiService)
+    service.model_name = "gemini-test"
+    service.pydantic_agent = Agent(FunctionModel(stream_function=stream_function))
+    service._agents_by_result_type = {}
+    return service
+
+
+async def _collect_turns(service, outline, events, warnings=None):
+    results = []
+    async for segment_index, turn, segment_complete in service.generate_dialogue_turns_async(
+        podcast_outline=outline,
+        source_analyses=[],
+        persona_research_docs=[],
+        persona_details_map=PERSONA_DETAILS,
+        warnings_list=warnings
+    ):
+        events.append(("turn", turn.turn_id))
+        results.append((segment_index, turn, segment_complete))
+    return results
+
+
+class TestGenerateTextStream:
+    """Test GeminiService.generate_text_stream_async"""
+
+    @pytest.mark.asyncio
+    async def test_partial_outputs_end_with_complete_result(self):
+        service = _streaming_service([])
+
+        outputs = [output async for output in service.generate_text_stream_async("prompt", PodcastDialogue)]
+
+        assert len(outputs) > 3
+        assert len(outputs[0].turns) < 3
+        assert outputs[-1] == PodcastDialogue.model_validate_json(_dialogue_json(0))
+
+    @pytest.mark.asyncio
+    async def test_stalled_stream_hits_overall_deadline(self):
+        service = _streaming_service([], stall_after_chunks=4)
+
+        with pytest.raises(TimeoutError):
+            async for _ in service.generate_text_stream_async("prompt", PodcastDialogue, timeout_seconds=0.2):
+                pass
+
+
+class TestStreamingDialogueTurns:
+    """Test DIALOGUE_STREAM_TURNS mode of generate_dialogue_turns_async"""
+
+    @pytest.mark.asyncio
+    async def test_turns_emitted_before_segment_response_finishes(self):
+        events = []
+        service = _streaming_service(events)
+
+        with patch.dict(os.environ, {"DIALOGUE_STREAM_TURNS": "true"}):
+            results = await _collect_turns(service, _outline(2), events)
+
+        assert [turn.turn_id for _, turn, _ in results] == list(range(1, 7))
+        assert [(index, complete) for index, _, complete in results] == [
+            (0, False), (0, False), (0, True), (1, False), (1, False), (1, True)
+        ]
+        assert results[0][1].text == "segment 0 turn 0"
+        assert results[0][1].speaker_gender == "Female"
+        # The first turn reached the consumer while the model was still writing the segment
+        assert events.index(("turn", 1)) < events.index(("response_done", 0))
+
+    @pytest.mark.asyncio
+    async def test_failed_stream_falls_back_to_full_response(self):
+        service = _streaming_service([], fail_stream=True)
+        service.generate_text_async = AsyncMock(return_value=PodcastDialogue(turns=[
+            DialogueTurn(turn_id=1, speaker_id="Host", text="fallback turn")
+        ]))
+
+        with patch.dict(os.environ, {"DIALOGUE_STREAM_TURNS": "true"}):
+            results = await _collect_turns(service, _outline(1), [])
+
+        assert [(turn.text, complete) for _, turn, complete in results] == [("fallback turn", True)]
+
+    @pytest.mark.asyncio
+    async def test_stream_failing_mid_segment_adds_warning(self):
+        # Enough chunks for the first turn to be complete before the stream breaks
+        service = _streaming_service([], break_after_chunks=13)
+        warnings = []
+
+        with patch.dict(os.environ, {"DIALOGUE_STREAM_TURNS": "true"}):
+            results = await _collect_turns(service, _outline(1), [], warnings)
+
+        assert [turn.text for _, turn, _ in results] == ["segment 0 turn 0"]
+        assert len(warnings) == 1 and "cut short after 1 turns" in warnings[0]
+
+    @pytest.mark.asyncio
+    async def test_segment_batches_flattened_by_default(self):
+        service = _streaming_service([])
+        service.generate_text_async = AsyncMock(side_effect=[
+            PodcastDialogue.model_validate_json(_dialogue_json(0, count=2)),
+            PodcastDialogue(turns=[]),
+        ])
+
+        results = await _collect_turns(service, _outline(2), [])
+
+        assert [(index, turn.turn_id, complete) for index, turn, complete in results] == [
+            (0, 1, False), (0, 2, True), (1, 3, True)
+        ]
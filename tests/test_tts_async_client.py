@@ -0,0 +1,128 @@
+"""
+Test suite for the asyncio TTS backend of GoogleCloudTtsService.
+"""
+
+import asyncio
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+# Add the project root to the path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.tts_service import GoogleCloudTtsService
+
+
+class SlowAsyncTtsClient:
+    """TextToSpeechAsyncClient that records how many requests run at once"""
+
+    def __init__(self, fail_texts=()):
+        self.fail_texts = set(fail_texts)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.max_waiting = 0
+
+    async def synthesize_speech(self, request):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        self.max_waiting = max(self.max_waiting, GoogleCloudTtsService.get_current_metrics()["waiting"])
+        try:
+            await asyncio.sleep(0.02)
+        finally:
+            self.in_flight -= 1
+        if request["input"].text in self.fail_texts:
+            raise RuntimeError("synthesis failed")
+        return MagicMock(audio_content=request["input"].text.encode())
+
+
+class TestAsyncTtsBackend:
+    """Test that synthesis runs on the async client within the concurrency limit"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_synthesis_limited_by_semaphore(self, tmp_path, make_tts_service):
+        client = SlowAsyncTtsClient()
+        service = make_tts_service()
+
+        with patch.dict(os.environ, {"TTS_SERVICE_MAX_CONCURRENCY": "3"}), \
+             patch("app.tts_service.texttospeech.TextToSpeechAsyncClient", return_value=client) as client_class:
+            results = await asyncio.gather(*(
+                service.text_to_audio_async(f"turn {i}", str(tmp_path / f"turn_{i}.mp3"), voice_name="en-US-Chirp3-HD-A")
+                for i in range(10)
+            ))
+
+        assert all(results)
+        assert client.max_in_flight == 3
+        assert client.max_waiting > 0
+        # One client is shared by every call on the event loop
+        assert client_class.call_count == 1
+        assert (tmp_path / "turn_4.mp3").read_bytes() == b"turn 4"
+        metrics = GoogleCloudTtsService.get_current_metrics()
+        assert metrics["in_flight"] == 0
+        assert metrics["waiting"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_synthesis_returns_false(self, tmp_path, make_tts_service):
+        client = SlowAsyncTtsClient(fail_texts={"broken"})
+        service = make_tts_service()
+        failed_before = GoogleCloudTtsService.get_current_metrics()["jobs_failed"]
+
+        with patch("app.tts_service.texttospeech.TextToSpeechAsyncClient", return_value=client):
+            assert await service.text_to_audio_async("broken", str(tmp_path / "broken.mp3")) is False
+
+        assert GoogleCloudTtsService.get_current_metrics()["jobs_failed"] == failed_before + 1
+        assert not (tmp_path / "broken.mp3").exists()
+
+
+class TestLongTextChunking:
+    """Test that turns over the input limit are split and synthesized in chunks"""
+
+    def test_chunks_end_at_sentence_boundaries_within_byte_limit(self):
+        text = " ".join(f"Sentence number {i} talks about café history." for i in range(40))
+
+        chunks = GoogleCloudTtsService._split_text_for_synthesis(text, 200)
+
+        assert all(len(chunk.encode("utf-8")) <= 200 for chunk in chunks)
+        assert all(chunk.endswith("history.") for chunk in chunks)
+        assert " ".join(chunks) == text
+
+    def test_overlong_sentence_split_at_clauses_then_words(self):
+        text = ", ".join(["a long clause with several words in it"] * 10) + " " + "word " * 60
+
+        chunks = GoogleCloudTtsService._split_text_for_synthesis(text.strip(), 100)
+
+        assert all(len(chunk.encode("utf-8")) <= 100 for chunk in chunks)
+        assert " ".join(chunks).split() == text.split()
+
+    def test_short_text_is_one_chunk(self):
+        assert GoogleCloudTtsService._split_text_for_synthesis("  Hello there.  ", 100) == ["Hello there."]
+
+    @pytest.mark.asyncio
+    async def test_long_turn_synthesized_concurrently_and_joined_in_order(self, tmp_path, make_tts_service):
+        client = SlowAsyncTtsClient()
+        service = make_tts_service()
+        text = " ".join(f"Point {i} of a very long persona monologue." for i in range(30))
+
+        with patch.dict(os.environ, {"TTS_MAX_INPUT_BYTES": "300"}), \
+             patch("app.tts_service.texttospeech.TextToSpeechAsyncClient", return_value=client):
+            assert await service.text_to_audio_async(text, str(tmp_path / "turn.mp3"))
+
+        assert client.max_in_flight > 1
+        audio = (tmp_path / "turn.mp3").read_bytes().decode()
+        assert audio.replace("monologue.Point", "monologue. Point") == text
+
+    @pytest.mark.asyncio
+    async def test_close_async_clients_closes_channel(self, tmp_path, make_tts_service):
+        client = SlowAsyncTtsClient()
+        client.transport = MagicMock(close=AsyncMock())
+        service = make_tts_service()
+
+        with patch("app.tts_service.texttospeech.TextToSpeechAsyncClient", return_value=client) as client_class:
+            await service.text_to_audio_async("turn 0", str(tmp_path / "turn_0.mp3"))
+            await GoogleCloudTtsService.close_async_clients()
+            await service.text_to_audio_async("turn 1", str(tmp_path / "turn_1.mp3"))
+
+        client.transport.close.assert_awaited_once()
+        # A closed client is replaced on next use
+        assert client_class.call_count == 2
@@ -0,0 +1,237 @@
+"""
+Test suite for batching consecutive same-voice dialogue turns into one SSML TTS request.
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+from google.cloud import texttospeech_v1beta1
+
+# Add the project root to the path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.podcast_models import DialogueTurn, PersonaResearch
+from app.tts_service import GoogleCloudTtsService
+
+
+class FakeBetaTtsClient:
+    """v1beta1 TextToSpeechAsyncClient reporting a timepoint for every mark but the ones in missing_marks"""
+
+    def __init__(self, missing_marks=()):
+        self.requests = []
+        self.missing_marks = set(missing_marks)
+
+    async def synthesize_speech(self, request):
+        self.requests.append(request)
+        marks = [name for name in request.input.ssml.split('"') if name.startswith("turn_")]
+        timepoints = [
+            texttospeech_v1beta1.Timepoint(mark_name=name, time_seconds=1.5 * i)
+            for i, name in enumerate(marks) if name not in self.missing_marks
+        ]
+        return MagicMock(audio_content=request.input.ssml.encode(), timepoints=timepoints)
+
+
+class FakeTtsService:
+    """Workflow-facing TTS stub recording single-turn and batched requests"""
+
+    def __init__(self, batch_fails=False):
+        self.batch_fails = batch_fails
+        self.single_texts = []
+        self.batches = []
+
+    async def text_to_audio_async(self, text_input, output_filepath, **kwargs):
+        self.single_texts.append(text_input)
+        with open(output_filepath, "wb") as f:
+            f.write(b"audio")
+        return True
+
+    async def turns_to_audio_async(self, turn_texts, output_filepath, **kwargs):
+        self.batches.append(turn_texts)
+        if self.batch_fails:
+            return None
+        with open(output_filepath, "wb") as f:
+            f.write(b"audio")
+        return [2.0 * i for i in range(len(turn_texts))]
+
+
+def _persona(name, voice_id):
+    return PersonaResearch(
+        person_id=name.lower(),
+        name=name,
+        detailed_profile=f"Profile of {name}",
+        gender="Male",
+        tts_voice_id=voice_id,
+        tts_voice_params={"speaking_rate": 1.0},
+    )
+
+
+def _make_turns(speakers):
+    return [
+        DialogueTurn(turn_id=i + 1, speaker_id=speaker, text=f"{speaker} says {i}")
+        for i, speaker in enumerate(speakers)
+    ]
+
+
+
+class TestTurnsToAudio:
+    """Test GoogleCloudTtsService.turns_to_audio_async"""
+
+    def test_ssml_marks_each_turn_and_escapes_text(self):
+        ssml = GoogleCloudTtsService.build_turns_ssml(["Q&A <time>", "Next"], break_ms=250)
+
+        assert ssml == (
+            '<speak><mark name="turn_0"/>Q&amp;A &lt;time&gt;'
+            '<break time="250ms"/><mark name="turn_1"/>Next</speak>'
+        )
+
+    @pytest.mark.asyncio
+    async def test_turn_offsets_from_mark_timepoints(self, tmp_path, make_tts_service):
+        client = FakeBetaTtsClient(missing_marks={"turn_2"})
+        output = tmp_path / "turns.mp3"
+
+        with patch("app.tts_service.texttospeech_v1beta1.TextToSpeechAsyncClient", return_value=client):
+            offsets = await make_tts_service().turns_to_audio_async(
+                ["One.", "Two.", "Three."], str(output), voice_name="en-US-Neural2-F"
+            )
+
+        assert offsets == [0.0, 1.5, None]
+        assert len(client.requests) == 1
+        request = client.requests[0]
+        assert request.voice.name == "en-US-Neural2-F"
+        assert list(request.enable_time_pointing) == [texttospeech_v1beta1.SynthesizeSpeechRequest.TimepointType.SSML_MARK]
+        assert output.read_bytes() == request.input.ssml.encode()
+
+    @pytest.mark.asyncio
+    async def test_ssml_over_input_limit_is_not_sent(self, tmp_path, monkeypatch, make_tts_service):
+        monkeypatch.setenv("TTS_MAX_INPUT_BYTES", "100")
+        client = FakeBetaTtsClient()
+
+        with patch("app.tts_service.texttospeech_v1beta1.TextToSpeechAsyncClient", return_value=client):
+            offsets = await make_tts_service().turns_to_audio_async(
+                ["x" * 60, "y" * 60], str(tmp_path / "turns.mp3"), voice_name="en-US-Neural2-F"
+            )
+
+        assert offsets is None
+        assert client.requests == []
+
+    @pytest.mark.asyncio
+    async def test_voice_without_ssml_support_is_not_sent(self, tmp_path, make_tts_service):
+        client = FakeBetaTtsClient()
+
+        with patch("app.tts_service.texttospeech_v1beta1.TextToSpeechAsyncClient", return_value=client):
+            offsets = await make_tts_service().turns_to_audio_async(
+                ["One.", "Two."], str(tmp_path / "turns.mp3"), voice_name="en-US-Chirp3-HD-Puck"
+            )
+
+        assert offsets is None
+        assert client.requests == []
+
+
+class TestBatchedDialogueAudio:
+    """Test grouping and batched synthesis in the workflow"""
+
+    def test_groups_consecutive_turns_of_one_voice(self, monkeypatch, make_generator_service):
+        monkeypatch.setenv("TTS_MAX_INPUT_BYTES", "120")
+        personas = {"Host": _persona("Host", "en-US-Neural2-A"), "Guest": _persona("Guest", "en-US-Neural2-B")}
+        turns = _make_turns(["Host", "Host", "Guest", "Host", "Host", "Host"])
+
+        groups = make_generator_service()._group_turns_for_tts(turns, personas)
+
+        # The last run of Host turns would exceed the input limit as one SSML document
+        assert groups == [[0, 1], [2], [3, 4], [5]]
+
+    def test_voices_without_ssml_support_are_not_grouped(self, make_generator_service):
+        personas = {"Host": _persona("Host", "en-US-Chirp3-HD-Puck")}
+        turns = _make_turns(["Host", "Host", "Host"])
+
+        assert make_generator_service()._group_turns_for_tts(turns, personas) == [[0], [1], [2]]
+
+    @pytest.mark.asyncio
+    async def test_batched_turns_share_file_and_are_indexed(self, tmp_path, status_manager, monkeypatch, make_generator_service):
+        monkeypatch.setenv("DIALOGUE_TTS_BATCHING", "true")
+        tts = FakeTtsService()
+        personas = {"Host": _persona("Host", "en-US-Neural2-A"), "Guest": _persona("Guest", "en-US-Neural2-B")}
+        turns = _make_turns(["Host", "Host", "Host", "Guest", "Host"])
+        index = []
+
+        paths = await make_generator_service(tts)._generate_dialogue_audio_async(
+            "task-123456789", turns, personas, str(tmp_path), [], None, index
+        )
+
+        assert [os.path.basename(p) for p in paths] == ["turns_000-002_Host.mp3", "turn_003_Guest.mp3", "turn_004_Host.mp3"]
+        assert tts.batches == [["Host says 0", "Host says 1", "Host says 2"]]
+        assert [(span.turn_id, span.audio_file_index, span.offset_seconds) for span in index] == [
+            (1, 0, 0.0), (2, 0, 2.0), (3, 0, 4.0), (4, 1, 0.0), (5, 2, 0.0)
+        ]
+        assert status_manager.update_status.call_args_list[-1].args[3] == 90.0
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_falls_back_to_single_turns(self, tmp_path, status_manager, monkeypatch, make_generator_service):
+        monkeypatch.setenv("DIALOGUE_TTS_BATCHING", "true")
+        tts = FakeTtsService(batch_fails=True)
+        turns = _make_turns(["Host", "Host"])
+        index = []
+
+        paths = await make_generator_service(tts)._generate_dialogue_audio_async(
+            "task-123456789", turns, {"Host": _persona("Host", "en-US-Neural2-A")}, str(tmp_path), [], None, index
+        )
+
+        assert [os.path.basename(p) for p in paths] == ["turn_000_Host.mp3", "turn_001_Host.mp3"]
+        assert tts.single_texts == ["Host says 0", "Host says 1"]
+        assert [(span.audio_file_index, span.offset_seconds) for span in index] == [(0, 0.0), (1, 0.0)]
+
+    @pytest.mark.asyncio
+    async def test_batching_disabled_by_default(self, tmp_path, status_manager, make_generator_service):
+        tts = FakeTtsService()
+        turns = _make_turns(["Host", "Host"])
+
+        paths = await make_generator_service(tts)._generate_dialogue_audio_async(
+            "task-123456789", turns, {"Host": _persona("Host", "en-US-Neural2-A")}, str(tmp_path), []
+        )
+
+        assert len(paths) == 2
+        assert tts.batches == []
+
+
+class FakeStreamingLlmService:
+    """LLM stub yielding dialogue turns one at a time, segment by segment"""
+
+    def __init__(self, segments):
+        self.segments = segments
+
+    async def generate_dialogue_turns_async(self, **kwargs):
+        for segment_index, segment_turns in enumerate(self.segments):
+            for k, turn in enumerate(segment_turns):
+                yield segment_index, turn, k == len(segment_turns) - 1
+
+
+class TestBatchedStreamingAudio:
+    """Test batching in the pipelined dialogue-to-TTS mode"""
+
+    @pytest.mark.asyncio
+    async def test_streamed_turns_batched_within_segments(self, tmp_path, status_manager, monkeypatch, make_generator_service):
+        monkeypatch.setenv("DIALOGUE_TTS_BATCHING", "true")
+        tts = FakeTtsService()
+        personas = {"Host": _persona("Host", "en-US-Neural2-A"), "Guest": _persona("Guest", "en-US-Chirp3-HD-Puck")}
+        turns = _make_turns(["Host", "Host", "Guest", "Guest", "Host", "Host"])
+        service = make_generator_service(tts)
+        service.llm_service = FakeStreamingLlmService([turns[:5], turns[5:]])
+        index = []
+
+        dialogue, paths = await service._generate_dialogue_with_streaming_audio_async(
+            "task-123456789", MagicMock(segments=[MagicMock(), MagicMock()]), [], [], {}, "", personas,
+            str(tmp_path), [], None, index
+        )
+
+        assert dialogue == turns
+        # Chirp3-HD turns are synthesized one by one and a batch ends with its segment
+        assert tts.batches == [["Host says 0", "Host says 1"]]
+        assert tts.single_texts == ["Guest says 2", "Guest says 3", "Host says 4", "Host says 5"]
+        assert [os.path.basename(p) for p in paths] == [
+            "turns_000-001_Host.mp3", "turn_002_Guest.mp3", "turn_003_Guest.mp3", "turn_004_Host.mp3", "turn_005_Host.mp3"
+        ]
+        assert [(span.turn_id, span.audio_file_index, span.offset_seconds) for span in index] == [
+            (1, 0, 0.0), (2, 0, 2.0), (3, 1, 0.0), (4, 2, 0.0), (5, 3, 0.0), (6, 4, 0.0)
+        ]
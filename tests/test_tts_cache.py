@@ -0,0 +1,109 @@
+"""
+Test suite for the content-addressed TTS synthesis cache.
+"""
+
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Add the project root to the path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.tts_cache import TtsSynthesisCache
+
+
+class FakeTtsClient:
+    """TextToSpeechAsyncClient that answers with audio derived from the request"""
+
+    def __init__(self):
+        self.requests = []
+
+    async def synthesize_speech(self, request):
+        self.requests.append(request)
+        audio = f"{request['input'].text}|{request['voice'].name}|{request['audio_config'].speaking_rate}"
+        return MagicMock(audio_content=audio.encode())
+
+
+class TestTtsSynthesisCache:
+    """Test TtsSynthesisCache"""
+
+    def test_key_depends_on_text_voice_and_audio_config(self):
+        base = TtsSynthesisCache.make_key({"text": "Hi"}, {"name": "en-US-A"}, {"speaking_rate": 1.0})
+
+        assert base == TtsSynthesisCache.make_key({"text": "Hi"}, {"name": "en-US-A"}, {"speaking_rate": 1.0})
+        assert base != TtsSynthesisCache.make_key({"text": "Hi!"}, {"name": "en-US-A"}, {"speaking_rate": 1.0})
+        assert base != TtsSynthesisCache.make_key({"text": "Hi"}, {"name": "en-US-B"}, {"speaking_rate": 1.0})
+        assert base != TtsSynthesisCache.make_key({"text": "Hi"}, {"name": "en-US-A"}, {"speaking_rate": 1.1})
+
+    def test_least_recently_used_audio_evicted_over_byte_budget(self, tmp_path):
+        cache = TtsSynthesisCache(str(tmp_path), max_bytes=25)
+        cache.set("a", b"a" * 10)
+        cache.set("b", b"b" * 10)
+        assert cache.get("a") == b"a" * 10
+
+        cache.set("c", b"c" * 10)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"a" * 10
+        assert cache.get("c") == b"c" * 10
+        metrics = cache.get_metrics()
+        assert metrics["evictions"] == 1
+        assert metrics["size_bytes"] == 20
+        assert sorted(os.listdir(tmp_path)) == ["a.audio", "c.audio"]
+
+    def test_index_rebuilt_from_disk(self, tmp_path):
+        TtsSynthesisCache(str(tmp_path), max_bytes=100).set("a", b"audio")
+
+        cache = TtsSynthesisCache(str(tmp_path), max_bytes=100)
+
+        assert cache.get_metrics()["entries"] == 1
+        assert cache.get("a") == b"audio"
+
+    def test_bucket_backed_lookup_fills_local_cache(self, tmp_path):
+        blobs = {}
+
+        def blob(name):
+            fake = MagicMock()
+            fake.exists.side_effect = lambda: name in blobs
+            fake.download_as_bytes.side_effect = lambda: blobs[name]
+            fake.upload_from_string.side_effect = lambda data, content_type: blobs.__setitem__(name, data)
+            return fake
+
+        gcs_client = MagicMock()
+        gcs_client.bucket.return_value.blob.side_effect = blob
+        TtsSynthesisCache(str(tmp_path / "one"), 100, gcs_client=gcs_client, gcs_bucket="audio").set("a", b"audio")
+
+        other_instance = TtsSynthesisCache(str(tmp_path / "two"), 100, gcs_client=gcs_client, gcs_bucket="audio")
+
+        assert other_instance.get("a") == b"audio"
+        assert other_instance.get_metrics()["gcs_hits"] == 1
+        assert os.path.exists(tmp_path / "two" / "a.audio")
+
+
+class TestTextToAudioCaching:
+    """Test that text_to_audio_async reuses cached synthesis"""
+
+    @pytest.mark.asyncio
+    async def test_repeat_synthesis_served_from_cache(self, tmp_path, make_tts_service):
+        service = make_tts_service()
+        client = FakeTtsClient()
+        cache = TtsSynthesisCache(str(tmp_path / "cache"), max_bytes=10_000)
+
+        with patch("app.tts_service.get_tts_synthesis_cache", return_value=cache), \
+             patch("app.tts_service.texttospeech.TextToSpeechAsyncClient", return_value=client):
+            for name in ("first.mp3", "second.mp3"):
+                assert await service.text_to_audio_async(
+                    "Welcome back to the show!", str(tmp_path / name),
+                    voice_name="en-US-Chirp3-HD-A", voice_params={"speaking_rate": 0.91}
+                )
+            await service.text_to_audio_async(
+                "Welcome back to the show!", str(tmp_path / "faster.mp3"),
+                voice_name="en-US-Chirp3-HD-A", voice_params={"speaking_rate": 1.0}
+            )
+
+        assert len(client.requests) == 2
+        assert (tmp_path / "second.mp3").read_bytes() == (tmp_path / "first.mp3").read_bytes()
+        assert (tmp_path / "faster.mp3").read_bytes() != (tmp_path / "first.mp3").read_bytes()
+        assert cache.get_metrics()["hits"] == 1
@@ -0,0 +1,399 @@
+"""
+Test suite for concurrent stages in the podcast generation workflow.
+Verifies bounded concurrency, deterministic ordering and per-item error isolation.
+"""
+
+import asyncio
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+# Add the project root to the path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.llm_service import GeminiService
+from app.common_exceptions import ExtractionError, LLMProcessingError
+from app.podcast_models import DialogueTurn, PersonaResearch
+
+
+class FakeTtsService:
+    """TTS stub that records peak concurrency and finishes turns out of order."""
+
+    def __init__(self, fail_texts=()):
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.fail_texts = set(fail_texts)
+
+    async def text_to_audio_async(self, text_input, output_filepath, **kwargs):
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        # Later turns finish first to prove results are reordered
+        await asyncio.sleep(0.01 * (10 - int(text_input.split()[-1])))
+        self.in_flight -= 1
+        if text_input in self.fail_texts:
+            return False
+        with open(output_filepath, "wb") as f:
+            f.write(b"audio")
+        return True
+
+
+class FakeLlmService:
+    """LLM stub whose persona research calls overlap and finish in reverse order."""
+
+    def __init__(self, voice_id="en-US-Chirp3-HD-Puck", fail_names=()):
+        self.model_name = "gemini-test"
+        self.voice_id = voice_id
+        self.fail_names = set(fail_names)
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def research_persona_async(self, source_text, person_name):
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        await asyncio.sleep(0.01 * (5 - len(person_name) % 5))
+        self.in_flight -= 1
+        if person_name in self.fail_names:
+            raise ValueError(f"no data for {person_name}")
+        return PersonaResearch(
+            person_id=person_name.lower(),
+            name=person_name,
+            detailed_profile=f"Profile of {person_name}",
+            gender="Male",
+            tts_voice_id=self.voice_id,
+            tts_voice_params={"voice_id": self.voice_id, "speaking_rate": 1.0},
+        )
+
+
+class FakeVoiceCache:
+    """TTS stub exposing only the voice cache used for voice selection."""
+
+    def get_voices_by_gender(self, gender):
+        return [
+            {"voice_id": f"en-US-Chirp3-HD-Voice{i}", "speaking_rate": 1.0}
+            for i in range(4)
+        ]
+
+
+def _make_turns(count):
+    return [
+        DialogueTurn(turn_id=i + 1, speaker_id="Host", speaker_gender="Female", text=f"turn {i}")
+        for i in range(count)
+    ]
+
+
+
+class TestConcurrentTts:
+    """Test the bounded-concurrency TTS stage"""
+
+    @pytest.mark.asyncio
+    async def test_turns_synthesized_concurrently_in_order(self, tmp_path, status_manager, monkeypatch, make_generator_service):
+        monkeypatch.setenv("TTS_MAX_CONCURRENCY", "3")
+        tts = FakeTtsService()
+        service = make_generator_service(tts)
+        warnings = []
+
+        paths = await service._generate_dialogue_audio_async(
+            "task-123456789", _make_turns(8), {}, str(tmp_path), warnings
+        )
+
+        assert tts.peak_in_flight == 3
+        assert [os.path.basename(p) for p in paths] == [f"turn_{i:03d}_Host.mp3" for i in range(8)]
+        assert warnings == []
+
+        progress_values = [c.args[3] for c in status_manager.update_status.call_args_list]
+        assert progress_values == sorted(progress_values)
+        assert progress_values[-1] == 90.0
+
+    @pytest.mark.asyncio
+    async def test_failed_turns_warn_per_turn(self, tmp_path, status_manager, make_generator_service):
+        tts = FakeTtsService(fail_texts={"turn 2", "turn 5"})
+        service = make_generator_service(tts)
+        warnings = []
+
+        paths = await service._generate_dialogue_audio_async(
+            "task-123456789", _make_turns(6), {}, str(tmp_path), warnings
+        )
+
+        assert len(paths) == 4
+        assert warnings == ["TTS failed for turn 2: turn 2...", "TTS failed for turn 5: turn 5..."]
+
+
+class TestConcurrentPersonaResearch:
+    """Test the bounded-concurrency persona research stage"""
+
+    @pytest.mark.asyncio
+    async def test_personas_researched_concurrently_in_order(self, status_manager, monkeypatch, make_generator_service):
+        monkeypatch.setenv("PERSONA_RESEARCH_MAX_CONCURRENCY", "2")
+        llm = FakeLlmService()
+        service = make_generator_service(FakeVoiceCache(), llm)
+        names = ["Ada", "Grace", "Alan", "Edsger"]
+        warnings = []
+
+        personas = await service._research_personas_async("task-123456789", names, "source", warnings)
+
+        assert llm.peak_in_flight == 2
+        assert [p.name for p in personas] == names
+        assert warnings == []
+
+    @pytest.mark.asyncio
+    async def test_failures_are_isolated_per_person(self, status_manager, make_generator_service):
+        llm = FakeLlmService(fail_names={"Grace"})
+        service = make_generator_service(FakeVoiceCache(), llm)
+        warnings = []
+
+        personas = await service._research_personas_async(
+            "task-123456789", ["Ada", "Grace", "Alan"], "source", warnings
+        )
+
+        assert [p.name for p in personas] == ["Ada", "Alan"]
+        assert warnings == ["Persona research for Grace failed: no data for Grace"]
+
+    @pytest.mark.asyncio
+    async def test_colliding_voices_are_reassigned(self, status_manager, make_generator_service):
+        llm = FakeLlmService(voice_id="en-US-Chirp3-HD-Voice0")
+        service = make_generator_service(FakeVoiceCache(), llm)
+
+        personas = await service._research_personas_async(
+            "task-123456789", ["Ada", "Grace", "Alan"], "source", []
+        )
+
+        voice_ids = [p.tts_voice_id for p in personas]
+        assert voice_ids[0] == "en-US-Chirp3-HD-Voice0"
+        assert len(set(voice_ids)) == 3
+        assert all(p.tts_voice_params["voice_id"] == p.tts_voice_id for p in personas)
+
+
+class TestConcurrentExtraction:
+    """Test the concurrent multi-source extraction stage"""
+
+    @staticmethod
+    def _fake_extractor(delays, fail_urls=()):
+        async def extract(url):
+            await asyncio.sleep(delays[url])
+            if url in fail_urls:
+                raise ExtractionError(f"cannot fetch {url}")
+            return f"text of {url}"
+        return extract
+
+    @pytest.mark.asyncio
+    async def test_sources_extracted_concurrently_in_order(self, make_generator_service):
+        urls = ["https://a.example/", "https://b.example/", "https://c.example/"]
+        delays = {urls[0]: 0.2, urls[1]: 0.1, urls[2]: 0.2}
+        service = make_generator_service()
+        warnings = []
+
+        with patch("app.podcast_workflow.extract_content_from_url", self._fake_extractor(delays, {urls[1]})):
+            loop = asyncio.get_running_loop()
+            started = loop.time()
+            texts, attributions = await service._extract_sources_async(urls, warnings)
+            elapsed = loop.time() - started
+
+        assert elapsed < 0.4
+        assert texts == [f"text of {urls[0]}", f"text of {urls[2]}"]
+        assert attributions == [urls[0], urls[2]]
+        assert warnings == [f"Failed to extract content from URL {urls[1]}: cannot fetch {urls[1]}"]
+
+    @pytest.mark.asyncio
+    async def test_source_timeout_and_global_deadline(self, monkeypatch, make_generator_service):
+        monkeypatch.setenv("EXTRACTION_SOURCE_TIMEOUT_SECONDS", "0.05")
+        urls = ["https://fast.example/", "https://slow.example/"]
+        delays = {urls[0]: 0.0, urls[1]: 10}
+        service = make_generator_service()
+        warnings = []
+
+        with patch("app.podcast_workflow.extract_content_from_url", self._fake_extractor(delays)):
+            texts, _ = await service._extract_sources_async(urls, warnings)
+        assert texts == [f"text of {urls[0]}"]
+        assert warnings == [f"Failed to extract content from URL {urls[1]}: timed out after 0.05s"]
+
+        monkeypatch.setenv("EXTRACTION_SOURCE_TIMEOUT_SECONDS", "60")
+        monkeypatch.setenv("EXTRACTION_DEADLINE_SECONDS", "0.05")
+        warnings = []
+        with patch("app.podcast_workflow.extract_content_from_url", self._fake_extractor(delays)):
+            texts, _ = await service._extract_sources_async(urls, warnings)
+        assert texts == [f"text of {urls[0]}"]
+        assert warnings == [f"Failed to extract content from URL {urls[1]}: extraction deadline of 0.05s exceeded"]
+
+
+class FakeStreamingLlmService:
+    """LLM stub that yields one segment of dialogue turns at a time."""
+
+    def __init__(self, segments, delay=0.05):
+        self.segments = segments
+        self.delay = delay
+        self.events = []
+
+    async def generate_dialogue_segments_async(self, **kwargs):
+        for segment_turns in self.segments:
+            await asyncio.sleep(self.delay)
+            self.events.append(("segment", segment_turns[0].turn_id))
+            yield segment_turns
+
+    # Flattens the segments above into turns, as in non-streaming mode
+    generate_dialogue_turns_async = GeminiService.generate_dialogue_turns_async
+
+
+class RecordingTtsService(FakeTtsService):
+    """TTS stub that also records when each turn starts."""
+
+    def __init__(self, events):
+        super().__init__()
+        self.events = events
+
+    async def text_to_audio_async(self, text_input, output_filepath, **kwargs):
+        self.events.append(("tts", text_input))
+        return await super().text_to_audio_async(text_input, output_filepath, **kwargs)
+
+
+class TestStreamingDialogueAudio:
+    """Test the pipelined dialogue-to-TTS mode"""
+
+    @staticmethod
+    def _outline(segment_count):
+        return MagicMock(segments=[MagicMock() for _ in range(segment_count)])
+
+    @pytest.mark.asyncio
+    async def test_tts_starts_before_dialogue_finishes(self, tmp_path, status_manager, make_generator_service):
+        turns = _make_turns(6)
+        llm = FakeStreamingLlmService([turns[0:2], turns[2:4], turns[4:6]])
+        tts = RecordingTtsService(llm.events)
+        service = make_generator_service(tts, llm)
+        warnings = []
+
+        dialogue, paths = await service._generate_dialogue_with_streaming_audio_async(
+            "task-123456789", self._outline(3), [], [], {}, "", {}, str(tmp_path), warnings
+        )
+
+        assert dialogue == turns
+        assert [os.path.basename(p) for p in paths] == [f"turn_{i:03d}_Host.mp3" for i in range(6)]
+        # Audio for the first segment is requested before the last segment is written
+        assert llm.events.index(("tts", "turn 0")) < llm.events.index(("segment", 5))
+
+        progress_values = [c.args[3] for c in status_manager.update_status.call_args_list]
+        assert progress_values == sorted(progress_values)
+        assert progress_values[-1] == 90.0
+
+    @pytest.mark.asyncio
+    async def test_dialogue_failure_cancels_queued_audio(self, tmp_path, status_manager, make_generator_service):
+        class FailingLlm(FakeStreamingLlmService):
+            async def generate_dialogue_segments_async(self, **kwargs):
+                async for segment_turns in super().generate_dialogue_segments_async(**kwargs):
+                    yield segment_turns
+                raise LLMProcessingError("segment failed")
+
+        turns = _make_turns(2)
+        llm = FailingLlm([turns], delay=0)
+        service = make_generator_service(FakeTtsService(), llm)
+
+        with pytest.raises(LLMProcessingError):
+            await service._generate_dialogue_with_streaming_audio_async(
+                "task-123456789", self._outline(2), [], [], {}, "", {}, str(tmp_path), []
+            )
+        assert not any(n.startswith("turn_") for n in os.listdir(tmp_path / "audio_segments"))
+
+
+class TestConcurrentAnalysisBranches:
+    """Test that source analysis and persona research run side by side"""
+
+    @pytest.mark.asyncio
+    async def test_source_analysis_and_personas_overlap(self, status_manager, make_generator_service):
+        from app.podcast_models import PodcastRequest, SourceAnalysis
+
+        llm = FakeLlmService()
+        events = []
+
+        async def analyze_source_text_async(source_text, analysis_instructions="", **kwargs):
+            events.append("analysis_start")
+            await asyncio.sleep(0.1)
+            events.append("analysis_end")
+            return SourceAnalysis(summary_points=["a", "b"], detailed_analysis="details")
+
+        research_persona_async = llm.research_persona_async
+
+        async def recording_research_persona_async(source_text, person_name):
+            events.append("persona_start")
+            return await research_persona_async(source_text, person_name)
+
+        llm.analyze_source_text_async = analyze_source_text_async
+        llm.research_persona_async = recording_research_persona_async
+        service = make_generator_service(FakeVoiceCache(), llm)
+        request = PodcastRequest(source_urls=["https://example.com/"], prominent_persons=["Ada"])
+        status_manager.get_cached_source_analysis.return_value = None
+
+        results = await service._build_analysis_graph("task-123456789", request, {}, []).run(
+            {"extracted_text": "source", "extracted_texts": ["source"]}
+        )
+
+        # Persona research started while the (slower) analysis was still running
+        assert events.index("persona_start") < events.index("analysis_end")
+        assert [a.summary_points for a in results["source_analyses"]] == [["a", "b"]]
+        assert [p.name for p in results["persona_research"]] == ["Ada"]
+        status_updates = [c.args[1:4] for c in status_manager.update_status.call_args_list]
+        assert status_updates == [("analyzing_sources", "Researched 1 personas, analyzing sources", 30.0)]
+
+
+class TestEpisodePreview:
+    """Test progressive transcript and partial audio publishing"""
+
+    @staticmethod
+    def _preview(tmp_path, publish_every_turns=2):
+        from app.podcast_models import PodcastEpisode
+        from app.podcast_workflow import EpisodePreview
+
+        base = PodcastEpisode(
+            title="Preview", summary="", transcript="", audio_filepath="", source_attributions=[], warnings=[]
+        )
+        return EpisodePreview("task-123456789", base, str(tmp_path / "preview.mp3"), publish_every_turns)
+
+    @pytest.mark.asyncio
+    async def test_preview_audio_grows_with_leading_turns(self, tmp_path, status_manager, monkeypatch, make_generator_service):
+        monkeypatch.setenv("TTS_MAX_CONCURRENCY", "8")
+        tts = FakeTtsService(fail_texts={"turn 1"})
+        service = make_generator_service(tts)
+        preview = self._preview(tmp_path)
+
+        await service._generate_dialogue_audio_async(
+            "task-123456789", _make_turns(5), {}, str(tmp_path), [], preview
+        )
+
+        # Turns finish in reverse order, yet only the completed leading run is appended
+        assert preview.turns_in_audio == 4
+        assert (tmp_path / "preview.mp3").read_bytes() == b"audio" * 4
+        published = [c.args[1] for c in status_manager.set_episode.call_args_list]
+        assert published and all(e.audio_filepath == str(tmp_path / "preview.mp3") for e in published)
+
+    @pytest.mark.asyncio
+    async def test_transcript_published_per_update(self, tmp_path, status_manager):
+        preview = self._preview(tmp_path)
+
+        preview.update_transcript(_make_turns(2))
+
+        episode = status_manager.set_episode.call_args.args[1]
+        assert "turn 0" in episode.transcript and "turn 1" in episode.transcript
+        assert episode.audio_filepath == ""
+
+    @pytest.mark.asyncio
+    async def test_leftover_turns_flushed_and_uploaded(self, tmp_path, status_manager, make_generator_service):
+        storage = MagicMock()
+        storage.upload_audio_file_async = AsyncMock(return_value="https://storage/episodes/task-123456789/preview.mp3")
+        service = make_generator_service(FakeTtsService())
+        preview = self._preview(tmp_path, publish_every_turns=4)
+        preview.storage_manager = storage
+
+        await service._generate_dialogue_audio_async(
+            "task-123456789", _make_turns(3), {}, str(tmp_path), [], preview
+        )
+
+        # Fewer turns than trigger a publish are flushed when the audio stage ends
+        assert storage.upload_audio_file_async.await_count == 1
+        assert storage.upload_audio_file_async.call_args.args[1] == "episodes/task-123456789/preview.mp3"
+        episode = status_manager.set_episode.call_args.args[1]
+        assert episode.audio_filepath == "https://storage/episodes/task-123456789/preview.mp3"
+        assert (tmp_path / "preview.mp3").read_bytes() == b"audio" * 3
+
+    def test_discard_clears_episode(self, tmp_path, status_manager):
+        self._preview(tmp_path).discard()
+
+        status_manager.clear_episode.assert_called_once_with("task-123456789")